@@ -1,6 +1,13 @@
 """
 EthioMorph API - Analyze endpoint
 Author: Esubalew Chekol (esubalew.et)
+
+?metrics=1 returns this function's per-stage analysis timings and pipeline
+branch counters instead of an analysis (?metrics=prometheus: Prometheus
+text). Each is off unless ETHIOMORPH_INSTRUMENT=1 /
+ETHIOMORPH_BRANCH_COUNTERS=1 is set; analysis-cache hits count as
+their own cache_hit stage and branch. They are served here because each API
+file is deployed as its own function with its own stemmer.
 """
 from http.server import BaseHTTPRequestHandler
 from urllib.parse import parse_qs, urlparse
@@ -10,11 +17,18 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.stemmer import GeezStemmer
+from src.engines import branch_metrics, get_stemmer, prometheus_metrics, stage_metrics, warm
+
+# Build the engine at cold start so requests reuse the loaded data.
+warm('stemmer')
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
         query = parse_qs(urlparse(self.path).query)
+        metrics = query.get('metrics', [''])[0]
+        if metrics not in ('', '0'):
+            self._send_metrics(prometheus=metrics == 'prometheus')
+            return
         word = query.get('word', [''])[0]
         
         self.send_response(200)
@@ -27,8 +41,26 @@ class handler(BaseHTTPRequestHandler):
             return
         
         try:
-            stemmer = GeezStemmer()
+            stemmer = get_stemmer()
             result = stemmer.extract_root(word)
             self.wfile.write(json.dumps(result, ensure_ascii=False, indent=2).encode())
         except Exception as e:
             self.wfile.write(json.dumps({"error": str(e)}).encode())
+
+    def _send_metrics(self, prometheus):
+        self.send_response(200)
+        if prometheus:
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        else:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+        try:
+            if prometheus:
+                self.wfile.write(prometheus_metrics().encode())
+                return
+            metrics = {"stages": stage_metrics(), "branches": branch_metrics()}
+            self.wfile.write(json.dumps(metrics, indent=2).encode())
+        except Exception as e:
+            self.wfile.write(json.dumps({"error": str(e)}).encode())
@@ -10,25 +10,34 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.conjugator import EthioMorphGenerator
+from src.engines import paradigm_json, warm
+
+# Build the engine at cold start so requests reuse the loaded data.
+warm('generator')
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
         query = parse_qs(urlparse(self.path).query)
         root = query.get('root', [''])[0]
-        
+        accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+
+        gzipped = False
+        if not root:
+            body = json.dumps({"error": "Missing 'root' parameter"}).encode()
+        else:
+            try:
+                # Serialized paradigms are cached (see src.engines.paradigm_json).
+                body = paradigm_json(root, compress=accepts_gzip)
+                gzipped = accepts_gzip
+            except Exception as e:
+                body = json.dumps({"error": str(e)}).encode()
+
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Vary', 'Accept-Encoding')
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        
-        if not root:
-            self.wfile.write(json.dumps({"error": "Missing 'root' parameter"}).encode())
-            return
-        
-        try:
-            generator = EthioMorphGenerator()
-            result = generator.expand_root(root)
-            self.wfile.write(json.dumps(result, ensure_ascii=False, indent=2).encode())
-        except Exception as e:
-            self.wfile.write(json.dumps({"error": str(e)}).encode())
+        self.wfile.write(body)
@@ -10,7 +10,10 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.conjugator import EthioMorphGenerator
+from src.engines import get_generator, warm
+
+# Build the engine at cold start so requests reuse the loaded data.
+warm('generator')
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
@@ -27,7 +30,7 @@ class handler(BaseHTTPRequestHandler):
             return
         
         try:
-            generator = EthioMorphGenerator()
+            generator = get_generator()
             result = generator.expand_root_simple(root)
             self.wfile.write(json.dumps(result, ensure_ascii=False, indent=2).encode())
         except Exception as e:
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Stream a Ge'ez text file (or stdin) through the stemmer as JSON lines.
+
+Each output line is {"token", "start", "end", "analysis"}; with --lean the
+analysis is the compact analyze_fast record. Input is read in chunks, so
+memory use does not grow with the size of the file. --workers N analyzes on
+N processes (output order is unchanged).
+
+    python scripts/analyze_corpus.py dump.txt --lean > analyses.jsonl
+    cat dump.txt | python scripts/analyze_corpus.py - --limit 100
+    python scripts/analyze_corpus.py dump.txt --workers 8 > analyses.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.corpus import DEFAULT_CHUNK_SIZE, analyze_stream, read_chunks  # noqa: E402
+from src.parallel import parallel_analyze_stream  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", help="text file, or - for stdin")
+    parser.add_argument("--lean", action="store_true", help="emit analyze_fast records")
+    parser.add_argument("--all-tokens", action="store_true",
+                        help="also analyze tokens without Ethiopic syllables")
+    parser.add_argument("--limit", type=int, default=0, help="stop after N tokens (0 = no limit)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="analyze on N worker processes (0 = in this process)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--encoding", default="utf-8")
+    args = parser.parse_args()
+
+    if args.input == "-":
+        handle = sys.stdin
+    else:
+        handle = open(args.input, encoding=args.encoding)
+
+    out = sys.stdout
+    started = time.perf_counter()
+    count = 0
+    try:
+        chunks = read_chunks(handle, args.chunk_size)
+        if args.workers:
+            # Analyses are only serialized here, so repeats can share one object.
+            results = parallel_analyze_stream(
+                chunks, workers=args.workers, lean=args.lean, geez_only=not args.all_tokens,
+                share=True,
+            )
+        else:
+            results = analyze_stream(chunks, lean=args.lean, geez_only=not args.all_tokens)
+        for token, analysis in results:
+            if args.lean:
+                analysis = analysis._asdict()
+            record = {"token": token.text, "start": token.start, "end": token.end, "analysis": analysis}
+            out.write(json.dumps(record, ensure_ascii=False))
+            out.write("\n")
+            count += 1
+            if args.limit and count >= args.limit:
+                break
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed else 0.0
+    print(f"{count} tokens in {elapsed:.2f}s ({rate:.0f} tokens/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark GrammarIndex.lookup_form as the form table grows.
+
+Pads the real form_to_roots table with synthetic fidel forms up to each
+requested size and times exact hits, homophone (normalized) hits and misses
+against the indexed lookup and the previous linear normalize-and-scan.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.grammar_loader import GrammarIndex  # noqa: E402
+from src.normalizer import normalize_geez  # noqa: E402
+
+# Fidel used for synthetic forms; includes homophone pairs (ሀ/ሐ/ኀ, ሰ/ሠ, አ/ዐ, ጸ/ፀ).
+SYLLABLES = [chr(base + order) for base in (
+    0x1200, 0x1210, 0x1280, 0x1230, 0x1220, 0x12A0, 0x12D0, 0x1338, 0x1340,
+    0x1260, 0x1270, 0x1290, 0x1308, 0x12A8, 0x1208, 0x1218, 0x1228, 0x12C8,
+) for order in range(7)]
+
+
+def linear_lookup(form_to_roots: dict[str, list[str]], word: str) -> list[str]:
+    """The pre-index lookup: normalize every stored form on each miss."""
+    if word in form_to_roots:
+        return form_to_roots[word]
+    norm = normalize_geez(word)
+    hits = []
+    for form, roots in form_to_roots.items():
+        if normalize_geez(form) == norm:
+            hits.extend(roots)
+    return list(dict.fromkeys(hits))
+
+
+def padded_index(base: GrammarIndex, size: int, rng: random.Random) -> GrammarIndex:
+    forms = dict(base.form_to_roots)
+    roots = list(base.roots) or ["ቀተለ"]
+    while len(forms) < size:
+        form = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(3, 6)))
+        forms.setdefault(form, [rng.choice(roots)])
+    return GrammarIndex.from_tables(
+        roots=base.roots,
+        secondary_roots=base.secondary_roots,
+        form_to_roots=forms,
+        skeleton_to_roots=base.skeleton_to_roots,
+        normalized_form_to_roots=GrammarIndex._build_normalized_forms(forms),
+        source=getattr(base, "source", None),
+    )
+
+
+def homophone_variant(form: str) -> str:
+    swaps = str.maketrans({"ሐ": "ሀ", "ኀ": "ሀ", "ሠ": "ሰ", "ዐ": "አ", "ፀ": "ጸ"})
+    return form.translate(swaps)
+
+
+def time_per_call(fn, words: list[str], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for word in words:
+            fn(word)
+    return (time.perf_counter() - started) / (repeat * len(words)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_600, 10_000, 50_000, 100_000, 200_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--linear-queries", type=int, default=5,
+                        help="queries for the linear baseline (0 to skip it)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    base = GrammarIndex()
+    print(f"Real table: {len(base.form_to_roots)} forms")
+    print(f"{'forms':>8} {'exact us':>9} {'homophone us':>13} {'miss us':>8} {'linear miss us':>15}")
+
+    for size in args.sizes:
+        index = padded_index(base, size, rng)
+        stored = rng.sample(list(index.form_to_roots), min(args.queries, len(index.form_to_roots)))
+        variants = [v for v in (homophone_variant(f) for f in stored) if v not in index.form_to_roots]
+        variants = variants or stored
+        misses = ["ፘ" + form for form in stored]
+
+        exact = time_per_call(index.lookup_form, stored, 20)
+        normalized = time_per_call(index.lookup_form, variants, 20)
+        miss = time_per_call(index.lookup_form, misses, 20)
+        linear = "-"
+        if args.linear_queries:
+            sample = misses[:args.linear_queries]
+            linear = f"{time_per_call(lambda w: linear_lookup(index.form_to_roots, w), sample, 1):.1f}"
+        print(f"{len(index.form_to_roots):>8} {exact:>9.2f} {normalized:>13.2f} {miss:>8.2f} {linear:>15}")
+
+
+if __name__ == "__main__":
+    main()
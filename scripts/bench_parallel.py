@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel corpus analysis from 1 to N worker processes.
+
+Builds a synthetic corpus from the attested grammar forms (Zipf-like
+repetition, so the per-batch sharing and encoding are exercised as on real
+text), checks every worker count returns the serial results, and reports
+tokens/s and speedup over the in-process baseline. Also reports the size
+of an encoded batch against pickling the same results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import marshal
+import os
+import pickle
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.parallel import DEFAULT_BATCH_SIZE, encode_batch, parallel_analyze  # noqa: E402
+from src.stemmer import GeezStemmer  # noqa: E402
+
+
+def build_corpus(stemmer: GeezStemmer, size: int, rng: random.Random) -> list[str]:
+    forms = sorted(stemmer.grammar.form_to_roots) or sorted(stemmer.lexicon_roots)
+    weights = [1.0 / (rank + 1) for rank in range(len(forms))]
+    rng.shuffle(forms)
+    return rng.choices(forms, weights=weights, k=size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=50_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--lean", action="store_true")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    stemmer = GeezStemmer()
+    stemmer.cache = None  # measure analysis, not cache hits
+    words = build_corpus(stemmer, args.tokens, random.Random(args.seed))
+    print(f"{len(words)} tokens, {len(set(words))} distinct, batch {args.batch_size}, "
+          f"{os.cpu_count()} CPUs")
+
+    batch = words[:args.batch_size]
+    results = stemmer.extract_many(batch, share=True)
+    print(f"batch encoding: {len(encode_batch(results))} B "
+          f"(marshal alone {len(marshal.dumps(results))} B, "
+          f"pickle {len(pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL))} B)")
+
+    baseline = None
+    expected = None
+    print(f"{'workers':>7} {'seconds':>8} {'tokens/s':>9} {'speedup':>8}")
+    for workers in range(1, args.max_workers + 1):
+        started = time.perf_counter()
+        out = list(parallel_analyze(
+            words, workers=workers, batch_size=args.batch_size, lean=args.lean, share=True,
+            stemmer=stemmer,
+        ))
+        elapsed = time.perf_counter() - started
+        if expected is None:
+            expected, baseline = out, elapsed
+        elif out != expected:
+            sys.exit(f"results with {workers} workers differ from the serial run")
+        print(f"{workers:>7} {elapsed:>8.2f} {len(words) / elapsed:>9.0f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Compile the JSON data files into the memory-mapped runtime artifact.
+
+Reads:  data/lexicon.json, data/templates.json, data/stems.json,
+        data/grammar_index.json, data/grammar_zewadla_index.json
+Writes: data/ethiomorph.bin
+
+Re-run after editing any of the JSON sources, src/decomposer.py,
+src/normalizer.py (the stored skeleton indexes depend on them),
+src/conjugator.py or src/paradigm_index.py (the stored paradigm index is
+generated with them); --check exits non-zero when the artifact is missing
+or no longer matches them. The artifact is not committed: build it after
+cloning and as part of every deploy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.data_artifact import ArtifactFormatError, MappedArtifact  # noqa: E402
+from src.lexicon_store import ARTIFACT_PATH, DATA_DIR, LexiconStore, compile_artifact  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--check", action="store_true", help="verify the artifact is up to date")
+    args = parser.parse_args()
+
+    output = args.output or args.data_dir / ARTIFACT_PATH.name
+    store = LexiconStore(args.data_dir)
+
+    if args.check:
+        try:
+            built_version = MappedArtifact(output).meta.get("version")
+        except ArtifactFormatError as exc:
+            sys.exit(f"{output}: {exc}")
+        if built_version != store.version:
+            sys.exit(f"{output} is stale (built from {built_version}, data is {store.version})")
+        print(f"{output} is up to date ({store.version})")
+        return
+
+    started = time.perf_counter()
+    payload = compile_artifact(store)
+    output.write_bytes(payload)
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {output} ({len(payload) / 1024:.0f} KiB, version {store.version}, {elapsed:.2f}s)")
+    for source, stats in store.grammar.ingest_stats.items():
+        counts = ", ".join(f"{value} {key}" for key, value in stats.items() if key != "seconds")
+        print(f"  grammar {source}: {stats['seconds'] * 1000:.1f} ms ({counts})")
+    paradigms = store.paradigm_index
+    print(f"  paradigm index: {len(paradigms)} forms, {len(paradigms.normalized)} homophone keys")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Generate the conjugation table of every lexicon and grammar-index root.
+
+Roots are expanded on a process pool (--workers) and written in a stable
+order: lexicon roots first, then grammar-index roots the lexicon lacks.
+JSONL lines are {"root", "paradigm"}, where paradigm is the expand_root
+matrix (expand_root_words with --lean). TSV rows are root, verb_type, tense,
+subject, word, variants; derived nominals use the tense "derived" and the
+nominal class as subject, as in the paradigm index.
+
+Every --checkpoint-every roots the output is flushed and a sidecar
+(<output>.checkpoint) records how far it got; --resume truncates the output
+to the last checkpoint and continues from there.
+
+    python scripts/generate_paradigms.py paradigms.jsonl --lean --workers 8
+    python scripts/generate_paradigms.py paradigms.tsv --format tsv --resume
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.conjugator import TENSES  # noqa: E402
+from src.lexicon_store import get_store  # noqa: E402
+from src.parallel import DEFAULT_EXPAND_BATCH_SIZE, parallel_expand  # noqa: E402
+
+TSV_HEADER = "root\tverb_type\ttense\tsubject\tword\tvariants\n"
+
+
+def collect_roots(store, sources: list[str]) -> list[str]:
+    """Roots of the requested sources, in source order, without repeats."""
+    roots: dict[str, None] = {}
+    if "lexicon" in sources:
+        roots.update(dict.fromkeys(store.lexicon_roots))
+    if "grammar" in sources and store.grammar.loaded:
+        for entry in store.grammar.roots.values():
+            roots.setdefault(entry["root"], None)
+    return list(roots)
+
+
+def tsv_rows(root: str, words: dict) -> str:
+    """TSV rows of one expand_root_words matrix."""
+    verb_type = words["_meta"]["verb_type"]
+    variants = words["variants"]
+    rows = []
+    for tense in TENSES:
+        tense_variants = variants.get(tense, {})
+        for subject, word in words.get(tense, {}).items():
+            rows.append(
+                f"{root}\t{verb_type}\t{tense}\t{subject}\t{word}\t"
+                f"{','.join(tense_variants.get(subject, ()))}\n"
+            )
+    for derived_class, word in words["derived"].items():
+        rows.append(f"{root}\t{verb_type}\tderived\t{derived_class}\t{word}\t\n")
+    return "".join(rows)
+
+
+def jsonl_record(root: str, paradigm: dict) -> tuple[bool, str]:
+    return "error" in paradigm, json.dumps({"root": root, "paradigm": paradigm}, ensure_ascii=False) + "\n"
+
+
+def tsv_record(root: str, paradigm: dict) -> tuple[bool, str]:
+    if "error" in paradigm:
+        return True, ""
+    return False, tsv_rows(root, paradigm)
+
+
+def write_checkpoint(path: Path, state: dict) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, ensure_ascii=False))
+    os.replace(tmp, path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("output", help="output file, or - for stdout (no checkpoints)")
+    parser.add_argument("--format", choices=("jsonl", "tsv"), default="jsonl")
+    parser.add_argument("--lean", action="store_true",
+                        help="emit expand_root_words matrices (TSV always does)")
+    parser.add_argument("--sources", default="lexicon,grammar",
+                        help="comma-separated root sources: lexicon, grammar")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="expand on N worker processes (0 = in this process)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_EXPAND_BATCH_SIZE)
+    parser.add_argument("--checkpoint-every", type=int, default=256, help="roots between checkpoints")
+    parser.add_argument("--resume", action="store_true", help="continue from the output's checkpoint")
+    parser.add_argument("--limit", type=int, default=0, help="stop after N roots (0 = all)")
+    args = parser.parse_args()
+
+    store = get_store()
+    roots = collect_roots(store, [s.strip() for s in args.sources.split(",") if s.strip()])
+    if args.limit:
+        roots = roots[:args.limit]
+    lean = args.lean or args.format == "tsv"
+    settings = {
+        "format": args.format,
+        "lean": lean,
+        "sources": args.sources,
+        "roots": len(roots),
+        "data_version": store.version,
+    }
+
+    to_stdout = args.output == "-"
+    checkpoint_path = None if to_stdout else Path(args.output + ".checkpoint")
+    done = 0
+    offset = 0
+    if args.resume and checkpoint_path is not None and checkpoint_path.exists():
+        state = json.loads(checkpoint_path.read_text())
+        if state["settings"] != settings:
+            parser.error(f"{checkpoint_path} was written with different settings: {state['settings']}")
+        if state.get("complete"):
+            print(f"{args.output} is already complete ({len(roots)} roots)", file=sys.stderr)
+            return
+        done, offset = state["roots"], state["bytes"]
+
+    if to_stdout:
+        out = sys.stdout.buffer
+    elif done:
+        out = open(args.output, "r+b")
+        out.truncate(offset)
+        out.seek(offset)
+    else:
+        out = open(args.output, "wb")
+    if not done and args.format == "tsv":
+        out.write(TSV_HEADER.encode())
+
+    def checkpoint(complete: bool = False) -> None:
+        out.flush()
+        if checkpoint_path is None:
+            return
+        os.fsync(out.fileno())
+        write_checkpoint(checkpoint_path, {
+            "settings": settings, "roots": done, "bytes": out.tell(), "complete": complete,
+        })
+
+    started = time.perf_counter()
+    generated = errors = 0
+    try:
+        # Records are serialized in the workers; this process only writes them.
+        results = parallel_expand(
+            roots[done:], workers=args.workers or 1, batch_size=args.batch_size, lean=lean,
+            transform=tsv_record if args.format == "tsv" else jsonl_record,
+        )
+        for _, (failed, record) in results:
+            errors += failed
+            out.write(record.encode())
+            done += 1
+            generated += 1
+            if done % args.checkpoint_every == 0:
+                checkpoint()
+                elapsed = time.perf_counter() - started
+                print(f"{done}/{len(roots)} roots ({generated / elapsed:.0f} roots/s)", file=sys.stderr)
+        checkpoint(complete=True)
+    finally:
+        if not to_stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    rate = generated / elapsed if elapsed else 0.0
+    print(
+        f"{generated} roots ({errors} errors) in {elapsed:.2f}s ({rate:.0f} roots/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
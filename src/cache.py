@@ -0,0 +1,160 @@
+"""
+EthioMorph Cache - Bounded In-Process LRU Caches
+================================================
+Least-recently-used caches with an entry and/or byte budget, hit/miss/
+eviction counters, and invalidation tied to the loaded data version.
+
+AnalysisCache stores results marshal-encoded, so a cached analysis can
+never be mutated through a returned copy. ParadigmCache stores expand_root
+results already serialized, as the bytes the API sends.
+
+Esubalew Chekol
+"""
+
+from __future__ import annotations
+
+import marshal
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache bounded by entry count and/or total size.
+
+    Values are stored as given; subclasses can encode them on the way in and
+    decode on the way out (see AnalysisCache).
+    """
+
+    def __init__(self, max_entries: int | None = 4096, max_bytes: int | None = None):
+        """
+        Args:
+            max_entries: Most entries kept, or None for no entry limit.
+            max_bytes: Most total size kept (as measured by _sizeof), or None.
+        """
+        if max_entries is None and max_bytes is None:
+            raise ValueError("LRUCache needs max_entries, max_bytes or both")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.version = None
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _encode(self, value):
+        return value
+
+    def _decode(self, stored):
+        return stored
+
+    def _sizeof(self, stored) -> int:
+        return 0
+
+    def get(self, key, default=None):
+        """Returns the cached value for key (marking it recently used), or default."""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+        return self._decode(item[0])
+
+    def put(self, key, value) -> None:
+        """Caches value under key, evicting least-recently-used entries over budget."""
+        stored = self._encode(value)
+        size = self._sizeof(stored)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._data[key] = (stored, size)
+            self.bytes += size
+            while (
+                (self.max_entries is not None and len(self._data) > self.max_entries)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)
+            ):
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def bind_version(self, version) -> None:
+        """Ties the cache to a data version, dropping every entry if it changed."""
+        if version == self.version:
+            return
+        with self._lock:
+            if version != self.version:
+                if self._data:
+                    self.invalidations += 1
+                self._data.clear()
+                self.bytes = 0
+                self.version = version
+
+    def clear(self) -> None:
+        """Drops every entry; counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        """Current size, budget and hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "version": self.version,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+
+class AnalysisCache(LRUCache):
+    """
+    LRU cache of analysis results.
+
+    Results are kept marshal-encoded (they are plain dict/list/str/number
+    trees); every get() decodes a fresh copy, and the byte budget counts the
+    encoded size.
+    """
+
+    def _encode(self, value):
+        return marshal.dumps(value)
+
+    def _decode(self, stored):
+        return marshal.loads(stored)
+
+    def _sizeof(self, stored) -> int:
+        return len(stored)
+
+
+class ParadigmCache(LRUCache):
+    """
+    LRU cache of serialized paradigms for /api/expand.
+
+    Values are (JSON bytes, gzip bytes or None) pairs, stored as given since
+    bytes are immutable; the byte budget counts both encodings.
+    """
+
+    def _sizeof(self, stored) -> int:
+        body, compressed = stored
+        return len(body) + (len(compressed) if compressed is not None else 0)
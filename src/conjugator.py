@@ -16,12 +16,13 @@ Key Features:
 Esubalew Chekol
 """
 
-import json
-import os
+from typing import NamedTuple
+
 from src.decomposer import (
     devowelize, get_char_order, get_char_by_order,
-    get_consonant_skeleton, detect_verb_home
+    get_consonant_skeleton, detect_verb_home, REVOWELIZATION_MAP
 )
+from src.lexicon_store import get_store
 
 get_vowel_order = get_char_order
 
@@ -35,6 +36,146 @@ LARYNGEALS = set(['ሀ', 'ሐ', 'ኀ', 'አ', 'ዐ'])
 
 DERIVED_TYPE_SUFFIXES = ("_passive", "_causative", "_aste", "_reciprocal")
 PREFIX_LOOKALIKES = ("አን", "አስተ", "ተ", "አ", "ነ")
+# Longest first, as _handle_prefixes tries them.
+PREFIX_LOOKALIKES_BY_LENGTH = tuple(sorted(PREFIX_LOOKALIKES, key=len, reverse=True))
+
+# Stem prefix -> subject prefix -> fused prefix (ይ+አ -> ያ, ...). Other
+# subject prefixes are simply followed by the stem prefix, and perfectives
+# (no subject prefix) take the stem prefix alone.
+PREFIX_FUSION = {
+    "አን": {"ይ": "ያን", "ት": "ታን", "እ": "አን", "ን": "ናን"},
+    "አስተ": {"ይ": "ያስተ", "ት": "ታስተ", "እ": "አስተ", "ን": "ናስተ"},
+    "አ": {"ይ": "ያ", "ት": "ታ", "እ": "አ", "ን": "ና"},
+}
+
+RADICAL_KEYS = ("C1", "C2", "C3", "C4")
+TENSES = ("perfective", "imperfective", "jussive", "imperative")
+DERIVED_CLASSES = (
+    "infinitive", "active_participle", "passive_participle",
+    "instrumental", "verbal_noun", "abstract_noun",
+    "verbal_noun_alt", "causative_agent", "passive_adj", "place_noun",
+    "result_noun",
+)
+
+
+def fuse_prefix(subject_prefix, stem_prefix, tense):
+    """Prefix of a conjugated form whose root carries stem_prefix (e.g. አ-)."""
+    if not stem_prefix:
+        return subject_prefix
+    fusion = PREFIX_FUSION.get(stem_prefix)
+    if fusion is None:
+        return subject_prefix + stem_prefix
+    if tense == "perfective":
+        return stem_prefix
+    return fusion.get(subject_prefix, subject_prefix + stem_prefix)
+
+
+class CellProgram(NamedTuple):
+    """
+    One templates.json cell (verb type, tense, subject) compiled for generate_word.
+
+    orders holds the C1-C4 target orders; the flags say which drop/shift
+    rules apply to this cell, so generating a word only reads them.
+    """
+    tense: str
+    subject_key: str
+    orders: tuple[int, int, int, int]
+    # "" or a PREFIX_LOOKALIKES stem prefix -> fused word prefix
+    prefixes: dict
+    suffix: str
+    # Order a 6th-order final radical fuses to with the suffix, or None.
+    fusion_order: int | None
+    # (C1-C3 pattern, C1-C4 pattern) strings for derivation["applied_pattern"]
+    applied_patterns: tuple[str, str]
+    # Hollow type -> (C1 order, C3 order) of the collapsed perfective.
+    hollow_perfective: dict
+    type_d_c1: bool
+    type_d_c2_drop: bool
+    weak_initial_drop: bool
+    laryngeal_jussive: bool
+    laryngeal_c2: bool
+    tense_info: tuple
+    subject_label: tuple[str, str]
+    morphological_rule: str
+
+
+class RootContext(NamedTuple):
+    """
+    Per-root state shared by every cell generate_word produces for one root.
+
+    Built by EthioMorphGenerator.root_context; expand_root builds it once and
+    generates all tenses and subjects from it.
+    """
+    root: str
+    verb_type: str
+    verb_home: dict
+    features: dict
+    # Devowelized radicals, after stripping a derivational prefix.
+    root_chars: list
+    # Root spelling the radicals come from (the root without that prefix).
+    surface_root: str
+    # Stripped prefix to fuse with the subject prefixes, or "".
+    prefix_adjustment: str
+    weak_info: dict | None
+    # Compiled cells of verb_type, or None for an unknown type.
+    programs: dict | None
+
+
+def compile_cell(verb_type, tense, subject_key, tense_data, subject_data, weak_root_rules):
+    """
+    Compiles one template cell into a CellProgram.
+
+    Args:
+        verb_type: Template verb type.
+        tense: Tense key of the template.
+        subject_key: Subject key within the tense.
+        tense_data: templates[verb_type][tense].
+        subject_data: tense_data["subjects"][subject_key].
+        weak_root_rules: templates["weak_root_rules"].
+    """
+    subject_prefix = subject_data.get("prefix", "")
+    suffix = subject_data.get("suffix", "")
+    vowel_map = subject_data.get("vowel_map", {})
+    label = subject_data.get("label", {})
+
+    hollow_perfective = {}
+    if tense == "perfective":
+        for hollow_type in ("hollow_w", "hollow_y"):
+            transform = weak_root_rules.get(hollow_type, {}).get("perfective_transform", {})
+            hollow_perfective[hollow_type] = (
+                transform.get("C1", vowel_map.get("C1", 1)),
+                transform.get("C3", vowel_map.get("C3", 1)),
+            )
+
+    return CellProgram(
+        tense=tense,
+        subject_key=subject_key,
+        orders=tuple(vowel_map.get(key, 1) for key in RADICAL_KEYS),
+        prefixes={
+            stem_prefix: fuse_prefix(subject_prefix, stem_prefix, tense)
+            for stem_prefix in ("", *PREFIX_LOOKALIKES)
+        },
+        suffix=suffix,
+        fusion_order=VOWEL_SUFFIX_MAP.get(suffix),
+        applied_patterns=tuple(
+            ", ".join(str(vowel_map.get(key, '-')) for key in RADICAL_KEYS[:count])
+            for count in (3, 4)
+        ),
+        hollow_perfective=hollow_perfective,
+        type_d_c1=verb_type == "type_d" and tense == "perfective",
+        type_d_c2_drop=verb_type == "type_d" and tense == "imperfective",
+        weak_initial_drop=tense in ("jussive", "imperative"),
+        laryngeal_jussive=tense == "jussive",
+        laryngeal_c2=tense == "imperfective",
+        tense_info=(
+            tense_data.get("template_name", tense),
+            tense_data.get("geez_name", ""),
+            tense_data.get("cv_template", ""),
+            tense_data.get("gemination", None),
+        ),
+        subject_label=(label.get("geez", ""), label.get("english", "")),
+        morphological_rule=subject_data.get("morphological_rule", ""),
+    )
 
 
 class EthioMorphGenerator:
@@ -45,32 +186,27 @@ class EthioMorphGenerator:
     with proper handling of suffix fusion rules and laryngeal adjustments.
     """
     
-    def __init__(self):
-        """Initialize the generator by loading templates and lexicon data."""
+    def __init__(self, store=None):
+        """
+        Initialize the generator over the shared lexicon store.
+
+        Args:
+            store: LexiconStore to read from. Defaults to the process-wide store.
+        """
+        self.store = store if store is not None else get_store()
         self.templates = {}
         self.lexicon = {}
         self.lexicon_full = {}
+        # verb type -> {(tense, subject): CellProgram}, compiled on first use
+        self._cell_programs = {}
         self._load_data()
     
     def _load_data(self):
-        """Load templates, stems, and lexicon from the data directory."""
-        try:
-            base_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-            
-            with open(os.path.join(base_dir, 'templates.json'), 'r', encoding='utf-8') as f:
-                self.templates = json.load(f)
-                
-            with open(os.path.join(base_dir, 'stems.json'), 'r', encoding='utf-8') as f:
-                self.stems_data = json.load(f).get('stems', {})
-                
-            with open(os.path.join(base_dir, 'lexicon.json'), 'r', encoding='utf-8') as f:
-                lex_data = json.load(f)
-                for entry in lex_data.get('roots', []):
-                    self.lexicon[entry['root']] = entry.get('type', 'type_a')
-                    self.lexicon_full[entry['root']] = entry
-                    
-        except FileNotFoundError:
-            print("Warning: Data files (templates, stems, or lexicon) not found.")
+        """Bind templates, stems, and lexicon from the shared store."""
+        self.templates = self.store.templates
+        self.stems_data = self.store.stems
+        self.lexicon = self.store.lexicon_types
+        self.lexicon_full = self.store.lexicon_roots
     
     @staticmethod
     def change_order(char, target_order):
@@ -89,6 +225,36 @@ class EthioMorphGenerator:
         base = devowelize(char)
         return get_char_by_order(base, target_order)
     
+    def _programs(self, verb_type):
+        """Compiled cells of verb_type, or None for an unknown type."""
+        programs = self._cell_programs.get(verb_type)
+        if programs is None:
+            type_data = self.templates.get(verb_type)
+            if not type_data:
+                return None
+            weak_root_rules = self.templates.get("weak_root_rules", {})
+            programs = {}
+            for tense, tense_data in type_data.items():
+                if tense == "_meta" or not isinstance(tense_data, dict):
+                    continue
+                for subject_key, subject_data in tense_data.get("subjects", {}).items():
+                    if subject_data:
+                        programs[tense, subject_key] = compile_cell(
+                            verb_type, tense, subject_key, tense_data, subject_data, weak_root_rules
+                        )
+            self._cell_programs[verb_type] = programs
+        return programs
+
+    def _cell_error(self, verb_type, tense, subject_key):
+        """Error result for a (verb type, tense, subject) with no template cell."""
+        type_data = self.templates.get(verb_type)
+        if not type_data:
+            return {"error": f"Unknown verb type '{verb_type}'"}
+        tense_data = type_data.get(tense)
+        if not tense_data or tense == "_meta":
+            return {"error": f"Unknown tense '{tense}' for type '{verb_type}'"}
+        return {"error": f"Unknown subject '{subject_key}' for tense '{tense}'"}
+
     def _detect_weak_root(self, root_chars):
         """
         Detect if a root is a weak (hollow or weak initial) verb.
@@ -181,17 +347,11 @@ class EthioMorphGenerator:
         if not allow_strip:
             return root, ""
 
-        prefixes = list(PREFIX_LOOKALIKES)
-        prefixes.sort(key=len, reverse=True)
-        
-        for p in prefixes:
-            if root.startswith(p) and len(root) > len(p):
-                remaining = root[len(p):]
-                # Only strip if remaining has at least 3 characters (radicals)
-                remaining_consonants = [devowelize(c) for c in remaining]
-                if len(remaining_consonants) >= 3:
-                    return remaining, p
-                
+        for p in PREFIX_LOOKALIKES_BY_LENGTH:
+            # Only strip if the remainder has at least 3 characters (radicals)
+            if root.startswith(p) and len(root) - len(p) >= 3:
+                return root[len(p):], p
+
         return root, ""
     
     def _identify_stem(self, prefix, original_root):
@@ -267,47 +427,6 @@ class EthioMorphGenerator:
             "description": "Basic active voice"
         }
 
-    def _apply_laryngeal_rules(self, char, order, position, tense, verb_type, features=None):
-        """
-        Apply Ge'ez laryngeal (guttural) rules affecting vowel orders.
-        
-        Laryngeal consonants (ሀ, ሐ, ኀ, አ, ዐ) cause vowel shifts in certain contexts:
-        - Jussive: Shift to 4th order (ራብዕ) when laryngeal is present
-        - Imperfective: May drop certain radicals
-        
-        Args:
-            char: The character being processed.
-            order: The target order.
-            position: Radical position (C1, C2, etc.).
-            tense: Grammatical tense.
-            verb_type: Verb classification.
-            features: Dict of verb features (has_laryngeal, is_hollow, etc.).
-            
-        Returns:
-            The adjusted order or "DROP".
-        """
-        base = devowelize(char)
-        features = features or {}
-        
-        
-        if verb_type == "type_d" and tense == "imperfective" and position == "C2":
-            return "DROP"
-        
-        
-        if features.get('has_laryngeal'):
-            laryngeal_positions = features.get('laryngeal_positions', [])
-            
-           
-            if tense == "jussive" and base in LARYNGEALS:
-                return 4 
-            
-          
-            if tense == "imperfective" and position == "C2" and f"C2={base}" in str(laryngeal_positions):
-              
-                return 4
-             
-        return order
-
     def _generate_hollow_collapsed_variants(self, root_chars, weak_info, suffix, features):
         """
         Build collapsed imperative surface forms for hollow verbs.
@@ -356,275 +475,306 @@ class EthioMorphGenerator:
         Returns:
             Dict with word and complete derivation metadata.
         """
-        root_chars = [devowelize(c) for c in root]
-        
+        context = self.root_context(root, verb_type, verb_home)
+        if isinstance(context, dict):
+            return context
+        return self._generate_cell(context, tense, subject_key)
+
+    def generate_word_fast(self, root, tense, subject_key, verb_type=None, verb_home=None):
+        """
+        Surface form of one cell, without derivation metadata.
+
+        Same word and hollow-imperative variants as generate_word, for callers
+        that only keep the strings (bulk generation, simple expansion).
+
+        Returns:
+            (word, variants) tuple, or None where generate_word returns an error.
+        """
+        context = self.root_context(root, verb_type, verb_home)
+        if isinstance(context, dict) or context.programs is None:
+            return None
+        program = context.programs.get((tense, subject_key))
+        if program is None:
+            return None
+        word, variants, _ = self._cell_words(context, program)
+        return word, variants
+
+    def root_context(self, root, verb_type=None, verb_home=None):
+        """
+        Computes the per-root state generate_word needs for any cell of root.
+
+        Args:
+            root: The root (3 or 4 letters, possibly with a derivational prefix).
+            verb_type: The verb class. If None, uses the lexicon or verb_home.
+            verb_home: Pre-computed verb home dict (optional).
+
+        Returns:
+            A RootContext, or an error dict for roots under 3 radicals.
+        """
         if not verb_home:
             skeleton = get_consonant_skeleton(root)
             verb_home = detect_verb_home(skeleton, root)
-        
+
         features = verb_home.get('features', {})
-        
+
         if not verb_type:
             verb_type = self.lexicon.get(root) or verb_home.get('type') or "type_a"
-        
+
         allow_strip = self._should_strip_prefix(root, verb_type)
         clean_root, root_prefix = self._handle_prefixes(root, allow_strip=allow_strip)
-        
-        is_derived_stem_template = self._is_derived_stem_type(verb_type)
-        
+
         prefix_adjustment = ""
         if root_prefix:
-            clean_root_chars = [devowelize(c) for c in clean_root]
-            root_chars = clean_root_chars
-            if not is_derived_stem_template:
+            root_chars = [devowelize(c) for c in clean_root]
+            if not self._is_derived_stem_type(verb_type):
                 prefix_adjustment = root_prefix
+            surface_root = clean_root
+        else:
+            root_chars = [devowelize(c) for c in root]
+            surface_root = root
 
-        surface_root = clean_root if root_prefix else root
-        
         if len(root_chars) < 3:
-             return {"error": f"Root must be at least 3 letters (Got '{root}')"}
-        
-        type_data = self.templates.get(verb_type)
-        if not type_data:
-            return {"error": f"Unknown verb type '{verb_type}'"}
+            return {"error": f"Root must be at least 3 letters (Got '{root}')"}
 
-        tense_data = type_data.get(tense)
-        if not tense_data or tense == "_meta":
-            return {"error": f"Unknown tense '{tense}' for type '{verb_type}'"}
-        
-        subjects = tense_data.get("subjects", {})
-        subject_data = subjects.get(subject_key)
-        if not subject_data:
-            return {"error": f"Unknown subject '{subject_key}' for tense '{tense}'"}
-        
-        template_name = tense_data.get("template_name", tense)
-        geez_name = tense_data.get("geez_name", "")
-        cv_template = tense_data.get("cv_template", "")
-        gemination = tense_data.get("gemination", None)
-        
-        subject_prefix = subject_data.get("prefix", "")
-        suffix = subject_data.get("suffix", "")
-        vowel_map = subject_data.get("vowel_map", {})
-        morphological_rule = subject_data.get("morphological_rule", "")
-        subject_label = subject_data.get("label", {})
-        
-        weak_info = self._detect_weak_root(root_chars) if len(root_chars) == 3 else None
-        
-        result_chars = []
-        vowel_shifts = []
+        return RootContext(
+            root=root,
+            verb_type=verb_type,
+            verb_home=verb_home,
+            features=features,
+            root_chars=root_chars,
+            surface_root=surface_root,
+            prefix_adjustment=prefix_adjustment,
+            weak_info=self._detect_weak_root(root_chars) if len(root_chars) == 3 else None,
+            programs=self._programs(verb_type),
+        )
+
+    def _generate_cell(self, context, tense, subject_key):
+        """generate_word for one cell of a root_context."""
+        verb_type = context.verb_type
+        programs = context.programs
+        program = programs.get((tense, subject_key)) if programs is not None else None
+        if program is None:
+            return self._cell_error(verb_type, tense, subject_key)
+
+        word, variants, trace = self._cell_words(context, program, trace=True)
+
+        features = context.features
+        root_chars = list(context.root_chars)
+        weak_info = context.weak_info
+        weak_type = weak_info["type"] if weak_info else None
+        radical_count = 4 if len(root_chars) >= 4 else 3
+        template_name, geez_name, cv_template, gemination = program.tense_info
+        derivation = {
+            "root": root_chars,
+            "root_display": "{" + ", ".join(root_chars) + "}",
+            "root_type": weak_type or "strong",
+            "verb_type": verb_type,
+            "verb_home": context.verb_home,
+            "tense": {
+                "name": tense,
+                "template_name": template_name,
+                "geez_name": geez_name,
+                "cv_template": cv_template,
+                "gemination": gemination
+            },
+            "subject": {
+                "key": subject_key,
+                "geez": program.subject_label[0],
+                "english": program.subject_label[1]
+            },
+            "vowel_shifts": trace["vowel_shifts"],
+            "morphological_rule": program.morphological_rule,
+            "applied_pattern": program.applied_patterns[radical_count - 3],
+            "prefix": trace["prefix"],
+            "suffix": program.suffix,
+            "fusion": trace["fusion"],
+            "features_applied": {
+                "laryngeal_shift": features.get('has_laryngeal', False),
+                "hollow_handling": features.get('is_hollow', False),
+                "weak_initial_drop": weak_type == "weak_initial",
+                "causative_prefix": context.prefix_adjustment == "አ"
+            }
+        }
+
+        result = {
+            "word": word,
+            "derivation": derivation
+        }
+        if variants:
+            result["variants"] = list(variants)
+        return result
+
+    def _cell_words(self, context, program, trace=False):
+        """
+        Applies one compiled cell to a root_context.
+
+        Args:
+            context: The root's RootContext.
+            program: The cell's CellProgram.
+            trace: Record the prefix, per-radical vowel shifts and suffix
+                fusion for generate_word's derivation; bulk callers pass
+                False and get None.
+
+        Returns:
+            (word, variants, trace) tuple; variants are the hollow-imperative
+            collapsed forms.
+        """
+        root_chars = context.root_chars
+        weak_info = context.weak_info
+        weak_type = weak_info["type"] if weak_info else None
+        orders = program.orders
+        suffix = program.suffix
+        vowel_shifts = [] if trace else None
         fusion_info = None
-        
-        final_prefix = subject_prefix
-        
-        if prefix_adjustment:
-            if prefix_adjustment == "አን":
-                if subject_prefix == "ይ": final_prefix = "ያን"
-                elif subject_prefix == "ት": final_prefix = "ታን"
-                elif subject_prefix == "እ": final_prefix = "አን"
-                elif subject_prefix == "ን": final_prefix = "ናን"
-                else: final_prefix = subject_prefix + prefix_adjustment
-                
-                if tense == "perfective":
-                    final_prefix = prefix_adjustment
-                    
-            elif prefix_adjustment == "አስተ":
-                if subject_prefix == "ይ": final_prefix = "ያስተ"
-                elif subject_prefix == "ት": final_prefix = "ታስተ"
-                elif subject_prefix == "እ": final_prefix = "አስተ"
-                elif subject_prefix == "ን": final_prefix = "ናስተ"
-                else: final_prefix = subject_prefix + prefix_adjustment
-                
-                if tense == "perfective":
-                    final_prefix = prefix_adjustment
-            
-            # Causative "አ" prefix: ይ→ያ, ት→ታ, እ→አ, ን→ና
-            elif prefix_adjustment == "አ":
-                if subject_prefix == "ይ": final_prefix = "ያ"
-                elif subject_prefix == "ት": final_prefix = "ታ"
-                elif subject_prefix == "እ": final_prefix = "አ"
-                elif subject_prefix == "ን": final_prefix = "ና"
-                else: final_prefix = subject_prefix + prefix_adjustment
-                
-                if tense == "perfective":
-                    final_prefix = prefix_adjustment
-
-            else:
-                final_prefix = subject_prefix + prefix_adjustment
-
-        if final_prefix:
-            result_chars.append(final_prefix)
-        
-        radicals = ["C1", "C2", "C3"]
-        if len(root_chars) >= 4:
-            radicals.append("C4")
-            
-        last_radical_key = radicals[-1]
 
-        if weak_info and weak_info["type"] in ("hollow_w", "hollow_y") and tense == "perfective" and len(root_chars) == 3:
-            weak_rules = self.templates.get("weak_root_rules", {}).get(weak_info["type"], {})
-            transform = weak_rules.get("perfective_transform", {})
-            
-            c1_order = transform.get("C1", vowel_map.get("C1", 1))
-            c3_order = transform.get("C3", vowel_map.get("C3", 1))
-            
+        final_prefix = program.prefixes.get(context.prefix_adjustment)
+        if final_prefix is None:
+            final_prefix = fuse_prefix(program.prefixes[""], context.prefix_adjustment, program.tense)
+        result_chars = [final_prefix]
+
+        if weak_type in ("hollow_w", "hollow_y") and program.hollow_perfective:
+            c1_order, c3_order = program.hollow_perfective[weak_type]
             c1_out = self.change_order(root_chars[0], c1_order)
             result_chars.append(c1_out)
-            vowel_shifts.append({
-                "consonant": "C1",
-                "base": root_chars[0],
-                "order": c1_order,
-                "result": c1_out,
-                "note": f"hollow verb: takes order {c1_order}"
-            })
-            
-            vowel_shifts.append({
-                "consonant": "C2",
-                "base": root_chars[1],
-                "order": "DROP",
-                "result": "",
-                "note": "hollow verb: middle radical dropped"
-            })
-            
-            c3_out, suffix_out, fused = self._apply_suffix_fusion(root_chars[2], c3_order, suffix)
+            c3_out, suffix_out, fused = self._apply_fusion(root_chars[2], c3_order, suffix)
             result_chars.append(c3_out)
-            vowel_shifts.append({
-                "consonant": "C3",
-                "base": root_chars[2],
-                "order": c3_order if not fused else f"{c3_order}→{VOWEL_SUFFIX_MAP.get(suffix, '?')}",
-                "result": c3_out,
-                "note": "suffix fusion applied" if fused else ""
-            })
-            
-            if fused:
-                fusion_info = {"original_suffix": suffix, "fused_with": "C3", "result": c3_out}
+            if trace:
+                vowel_shifts.append({
+                    "consonant": "C1",
+                    "base": root_chars[0],
+                    "order": c1_order,
+                    "result": c1_out,
+                    "note": f"hollow verb: takes order {c1_order}"
+                })
+                vowel_shifts.append({
+                    "consonant": "C2",
+                    "base": root_chars[1],
+                    "order": "DROP",
+                    "result": "",
+                    "note": "hollow verb: middle radical dropped"
+                })
+                vowel_shifts.append({
+                    "consonant": "C3",
+                    "base": root_chars[2],
+                    "order": c3_order if not fused else f"{c3_order}→{VOWEL_SUFFIX_MAP.get(suffix, '?')}",
+                    "result": c3_out,
+                    "note": "suffix fusion applied" if fused else ""
+                })
+                if fused:
+                    fusion_info = {"original_suffix": suffix, "fused_with": "C3", "result": c3_out}
             suffix = suffix_out
-            
         else:
-            for i, key in enumerate(radicals):
-                if i < len(root_chars):
-                    base = root_chars[i]
-                    order = vowel_map.get(key, 1)
-
-                    if (
-                        verb_type == "type_d"
-                        and tense == "perfective"
-                        and key == "C1"
-                        and i < len(surface_root)
-                        and get_vowel_order(surface_root[i]) == 6
-                    ):
+            features = context.features
+            laryngeal_positions = (
+                features.get('laryngeal_positions', []) if features.get('has_laryngeal') else None
+            )
+            radical_count = 4 if len(root_chars) >= 4 else 3
+            last = radical_count - 1
+            for i in range(radical_count):
+                base = root_chars[i]
+                order = orders[i]
+
+                if i == 0:
+                    surface_root = context.surface_root
+                    if program.type_d_c1 and surface_root and get_vowel_order(surface_root[0]) == 6:
                         order = 6
-                    
+
                     # Weak Initial C1-Drop Rule: ወለደ → ይልድ (C1 drops in Jussive/Imperative)
-                    # When verb is weak_initial (C1=ወ), drop C1 in jussive and imperative
-                    if key == "C1" and weak_info and weak_info.get("type") == "weak_initial":
-                        if tense in ["jussive", "imperative"]:
+                    if weak_type == "weak_initial" and program.weak_initial_drop:
+                        if trace:
                             vowel_shifts.append({
-                                "consonant": key,
+                                "consonant": RADICAL_KEYS[i],
                                 "base": base,
                                 "order": "DROP",
                                 "result": "",
                                 "note": "Weak Initial: C1 (ወ) drops in Jussive/Imperative"
                             })
-                            continue
-                    
-                    order = self._apply_laryngeal_rules(base, order, key, tense, verb_type, features)
-                    
-                    if order == "DROP":
+                        continue
+
+                # Type D drops C2 in the imperfective. Laryngeal roots shift
+                # laryngeal radicals to 4th order (ራብዕ) in the jussive, and a
+                # laryngeal C2 to 4th order in the imperfective.
+                if i == 1 and program.type_d_c2_drop:
+                    order = "DROP"
+                elif laryngeal_positions is not None:
+                    if program.laryngeal_jussive and base in LARYNGEALS:
+                        order = 4
+                    elif program.laryngeal_c2 and i == 1 and "C2=" + base in laryngeal_positions:
+                        order = 4
+                if order == "DROP":
+                    if trace:
                         vowel_shifts.append({
-                            "consonant": key,
+                            "consonant": RADICAL_KEYS[i],
                             "base": base,
                             "order": "DROP",
                             "result": "",
                             "note": "Laryngeal/Type Rule Dropped"
                         })
-                        continue
+                    continue
 
-                    if key == last_radical_key and suffix:
-                        final_out, suffix_out, fused = self._apply_fusion(base, order, suffix)
-                        result_chars.append(final_out)
-                        
-                        if fused:
-                            fusion_info = {"original_suffix": suffix, "fused_with": key, "result": final_out}
-                            suffix = suffix_out
-                        
+                if i == last and suffix and order == 6 and program.fusion_order is not None:
+                    final_out = REVOWELIZATION_MAP.get((base, program.fusion_order), base)
+                    result_chars.append(final_out)
+                    if trace:
+                        fusion_info = {"original_suffix": suffix, "fused_with": RADICAL_KEYS[i], "result": final_out}
                         vowel_shifts.append({
-                            "consonant": key,
+                            "consonant": RADICAL_KEYS[i],
                             "base": base,
-                            "order": order if not fused else f"{order}→{VOWEL_SUFFIX_MAP.get(subject_data.get('suffix', ''), '?')}",
+                            "order": f"{order}→{program.fusion_order}",
                             "result": final_out,
-                            "note": "suffix fusion applied" if fused else ""
+                            "note": "suffix fusion applied"
                         })
-                    else:
-                        shifted = self.change_order(base, order)
-                        result_chars.append(shifted)
-                        
-                        vowel_shifts.append({
-                            "consonant": key,
-                            "base": base,
-                            "order": order,
-                            "result": shifted,
-                            "note": ""
-                        })
-        
-        if suffix:
-            result_chars.append(suffix)
-        
+                    suffix = ""
+                    continue
+
+                shifted = REVOWELIZATION_MAP.get((base, order), base)
+                result_chars.append(shifted)
+                if trace:
+                    vowel_shifts.append({
+                        "consonant": RADICAL_KEYS[i],
+                        "base": base,
+                        "order": order,
+                        "result": shifted,
+                        "note": ""
+                    })
+
+        result_chars.append(suffix)
         word = "".join(result_chars)
-        
-        derivation = {
-            "root": root_chars,
-            "root_display": "{" + ", ".join(root_chars) + "}",
-            "root_type": weak_info["type"] if weak_info else "strong",
-            "verb_type": verb_type,
-            "verb_home": verb_home,
-            "tense": {
-                "name": tense,
-                "template_name": template_name,
-                "geez_name": geez_name,
-                "cv_template": cv_template,
-                "gemination": gemination
-            },
-            "subject": {
-                "key": subject_key,
-                "geez": subject_label.get("geez", ""),
-                "english": subject_label.get("english", "")
-            },
-            "vowel_shifts": vowel_shifts,
-            "morphological_rule": morphological_rule,
-            "applied_pattern": ", ".join([str(vowel_map.get(k, '-')) for k in radicals]),
-            "prefix": final_prefix,
-            "suffix": subject_data.get("suffix", ""),
-            "fusion": fusion_info,
-            "features_applied": {
-                "laryngeal_shift": features.get('has_laryngeal', False),
-                "hollow_handling": features.get('is_hollow', False),
-                "weak_initial_drop": weak_info.get("type") == "weak_initial" if weak_info else False,
-                "causative_prefix": prefix_adjustment == "አ"
-            }
-        }
-        
-        result = {
-            "word": word,
-            "derivation": derivation
-        }
 
-        if (
-            weak_info
-            and weak_info["type"] in ("hollow_w", "hollow_y")
-            and tense == "imperative"
-        ):
-            variants = [
+        variants = ()
+        if weak_type in ("hollow_w", "hollow_y") and program.tense == "imperative":
+            variants = tuple(
                 v for v in self._generate_hollow_collapsed_variants(
-                    root_chars, weak_info, suffix, features
+                    root_chars, weak_info, suffix, context.features
                 )
                 if v and v != word
-            ]
-            if variants:
-                result["variants"] = variants
+            )
+        if trace:
+            trace = {"prefix": final_prefix, "vowel_shifts": vowel_shifts, "fusion": fusion_info}
+        else:
+            trace = None
+        return word, variants, trace
 
-        return result
-    
-    def generate_derived(self, root, derived_class, verb_type=None):
+    def _derived_root_chars(self, root, verb_type):
+        """Radicals generate_derived builds from (prefix-stripped for roots over 4 letters)."""
+        root_chars = [devowelize(c) for c in root]
+        if len(root_chars) > 4:
+            allow_strip = self._should_strip_prefix(root, verb_type)
+            clean_root, _ = self._handle_prefixes(root, allow_strip=allow_strip)
+            root_chars = [devowelize(c) for c in clean_root]
+        return root_chars
+
+    def _derived_word(self, template, root_chars):
+        """Surface form of a derived-nominal template over root_chars."""
+        vowel_map = template.get("pattern", {})
+        result_chars = [template.get("prefix", "")]
+        for key, base in zip(RADICAL_KEYS[:4 if len(root_chars) >= 4 else 3], root_chars):
+            if key in vowel_map:
+                result_chars.append(self.change_order(base, vowel_map[key]))
+        result_chars.append(template.get("suffix", ""))
+        return "".join(result_chars)
+
+    def generate_derived(self, root, derived_class, verb_type=None, root_chars=None):
         """
         Generates derived nominals (Participles, Infinitives, etc.) based on verb type.
         
@@ -633,6 +783,8 @@ class EthioMorphGenerator:
             derived_class: 'infinitive', 'active_participle', 'passive_participle', 
                           'instrumental', 'verbal_noun', 'abstract_noun'.
             verb_type: The verb class (optional).
+            root_chars: Radicals from _derived_root_chars(root, verb_type),
+                when already computed (expand_root shares them across classes).
             
         Returns:
             Dict with generated word and metadata.
@@ -650,44 +802,41 @@ class EthioMorphGenerator:
         if not template:
             return {"error": f"Derived form '{derived_class}' not defined for '{verb_type}'"}
             
-        root_chars = [devowelize(c) for c in root]
-        
-        allow_strip = self._should_strip_prefix(root, verb_type)
-        clean_root, root_prefix = self._handle_prefixes(root, allow_strip=allow_strip)
-        if len(root_chars) > 4:
-            root_chars = [devowelize(c) for c in clean_root]
+        if root_chars is None:
+            root_chars = self._derived_root_chars(root, verb_type)
 
-        vowel_map = template.get("pattern", {})
-        prefix = template.get("prefix", "")
-        suffix = template.get("suffix", "")
-        
-        result_chars = []
-        if prefix:
-            result_chars.append(prefix)
-            
-        radicals = ["C1", "C2", "C3"]
-        if len(root_chars) >= 4:
-            radicals.append("C4")
-            
-        for i, key in enumerate(radicals):
-            if i < len(root_chars):
-            
-                if key not in vowel_map:
-                    continue
-                base = root_chars[i]
-                order = vowel_map.get(key, 1)
-                result_chars.append(self.change_order(base, order))
-                
-        if suffix:
-            result_chars.append(suffix)
-            
         return {
-            "word": "".join(result_chars),
+            "word": self._derived_word(template, root_chars),
             "template": template.get("template"),
             "type": verb_type,
             "class": derived_class
         }
 
+    def _expansion_stem(self, root, verb_type):
+        """
+        Stem analysis shared by expand_root and expand_root_words.
+
+        Returns:
+            (verb_home, stem_prefix, stem_info, analysis_root, verb_type), where
+            verb_type is the derived stem's template when the root carries one.
+        """
+        skeleton = get_consonant_skeleton(root)
+        verb_home = detect_verb_home(skeleton, root)
+        base_type = self.lexicon.get(root) or verb_home.get('type') or "type_a"
+
+        allow_strip = self._should_strip_prefix(root, base_type)
+        clean_root, stem_prefix = self._handle_prefixes(root, allow_strip=allow_strip)
+        stem_info = self._identify_stem(stem_prefix, root)
+        stem_suffix = stem_info['template_suffix']
+
+        if stem_suffix and f"{base_type}_{stem_suffix}" in self.templates:
+            verb_type = f"{base_type}_{stem_suffix}"
+        elif not verb_type:
+            verb_type = base_type
+
+        analysis_root = clean_root if stem_prefix else root
+        return verb_home, stem_prefix, stem_info, analysis_root, verb_type
+
     def expand_root(self, root, verb_type=None):
         """
         Generate the full conjugation matrix including derived forms.
@@ -707,21 +856,8 @@ class EthioMorphGenerator:
         Returns:
             Dict with complete matrix of conjugations and derived forms.
         """
-        skeleton = get_consonant_skeleton(root)
-        verb_home = detect_verb_home(skeleton, root)
-        base_type = self.lexicon.get(root) or verb_home.get('type') or "type_a"
-
-        if not verb_type:
-            verb_type = base_type
-
-        allow_strip = self._should_strip_prefix(root, base_type)
-        clean_root, stem_prefix = self._handle_prefixes(root, allow_strip=allow_strip)
-        
-        stem_info = self._identify_stem(stem_prefix, root)
-        stem_number = stem_info['number']
+        verb_home, stem_prefix, stem_info, analysis_root, verb_type = self._expansion_stem(root, verb_type)
         stem_suffix = stem_info['template_suffix']
-        
-        analysis_root = clean_root if stem_prefix else root
         root_chars = [devowelize(c) for c in analysis_root]
         
         if len(root_chars) < 3:
@@ -729,15 +865,9 @@ class EthioMorphGenerator:
 
         features = verb_home.get('features', {})
         
-        features['stem_number'] = stem_number
+        features['stem_number'] = stem_info['number']
         features['stem_prefix'] = stem_prefix or None
         features['stem_type'] = stem_info['name']
-        
-       
-        if stem_suffix and f"{base_type}_{stem_suffix}" in self.templates:
-            verb_type = f"{base_type}_{stem_suffix}"
-        elif not verb_type:
-            verb_type = base_type
 
         weak_info = self._detect_weak_root(root_chars) if len(root_chars) == 3 else None
         
@@ -766,7 +896,12 @@ class EthioMorphGenerator:
         if not type_data:
             return {"error": f"Unknown verb type '{verb_type}'"}
 
-        for tense in ["perfective", "imperfective", "jussive", "imperative"]:
+        gen_root = analysis_root if stem_suffix else root
+        context = self.root_context(gen_root, verb_type, verb_home)
+        if isinstance(context, dict):
+            context = None
+
+        for tense in TENSES:
             tense_data = type_data.get(tense)
             if not tense_data:
                 continue
@@ -783,22 +918,18 @@ class EthioMorphGenerator:
                 "conjugations": {}
             }
             
+            if context is None:
+                continue
             for subject_key in subjects:
-                gen_root = analysis_root if stem_suffix else root
-                gen_result = self.generate_word(gen_root, tense, subject_key, verb_type, verb_home)
+                gen_result = self._generate_cell(context, tense, subject_key)
                 if "error" not in gen_result:
                     result[tense]["conjugations"][subject_key] = gen_result
         
         result["derived"] = {}
-        derived_keys = [
-            "infinitive", "active_participle", "passive_participle", 
-            "instrumental", "verbal_noun", "abstract_noun",
-            "verbal_noun_alt", "causative_agent", "passive_adj", "place_noun",
-            "result_noun"
-        ]
-        
-        for key in derived_keys:
-            gen_result = self.generate_derived(root, key, verb_type)
+        
+        derived_chars = self._derived_root_chars(root, verb_type)
+        for key in DERIVED_CLASSES:
+            gen_result = self.generate_derived(root, key, verb_type, root_chars=derived_chars)
             if "error" not in gen_result:
                 result["derived"][key] = gen_result
 
@@ -854,6 +985,61 @@ class EthioMorphGenerator:
             results[code] = self.generate_stem(root, code)
         return results
 
+    def expand_root_words(self, root, verb_type=None):
+        """
+        The surface forms of expand_root, without derivation metadata.
+
+        Args:
+            root: The verb root.
+            verb_type: The verb class (optional, overrides detection).
+
+        Returns:
+            Dict with "_meta" (verb_type, stem_prefix), tense -> subject -> word
+            for each tense, "variants" (tense -> subject -> hollow imperative
+            variants) and "derived" (class -> word); or an error dict.
+        """
+        verb_home, stem_prefix, stem_info, analysis_root, verb_type = self._expansion_stem(root, verb_type)
+        if len(analysis_root) < 3:
+            return {"error": f"Root must be at least 3 letters (Got '{root}')"}
+
+        type_data = self.templates.get(verb_type)
+        if not type_data:
+            return {"error": f"Unknown verb type '{verb_type}'"}
+
+        result = {"_meta": {"verb_type": verb_type, "stem_prefix": stem_prefix or None}}
+        all_variants = {}
+
+        gen_root = analysis_root if stem_info['template_suffix'] else root
+        context = self.root_context(gen_root, verb_type, verb_home)
+        programs = None if isinstance(context, dict) else context.programs
+
+        for tense in TENSES:
+            tense_data = type_data.get(tense)
+            if not tense_data:
+                continue
+            words = result[tense] = {}
+            if programs is None:
+                continue
+            for subject_key in tense_data.get("subjects", {}):
+                program = programs.get((tense, subject_key))
+                if program is not None:
+                    words[subject_key], variants, _ = self._cell_words(context, program)
+                    if variants:
+                        all_variants.setdefault(tense, {})[subject_key] = list(variants)
+
+        result["variants"] = all_variants
+        result["derived"] = self._derived_words(root, verb_type)
+        return result
+
+    def _derived_words(self, root, verb_type):
+        """Class -> word for the DERIVED_CLASSES verb_type has templates for."""
+        templates = self.templates.get(verb_type, {}).get('derived', {})
+        root_chars = self._derived_root_chars(root, verb_type)
+        return {
+            key: self._derived_word(templates[key], root_chars)
+            for key in DERIVED_CLASSES if templates.get(key)
+        }
+
     def expand_root_simple(self, root, verb_type=None):
         """
         Generate a simple conjugation matrix (backwards compatible).
@@ -893,36 +1079,32 @@ class EthioMorphGenerator:
 
         result["variants"] = {}
 
-        for tense in ["perfective", "imperfective", "jussive", "imperative"]:
+        context = self.root_context(root, verb_type, verb_home)
+        programs = None if isinstance(context, dict) else context.programs
+
+        for tense in TENSES:
             tense_data = type_data.get(tense)
             if not tense_data:
                 continue
             
             subjects = tense_data.get("subjects", {})
             result[tense] = {}
+            if programs is None:
+                continue
             
             for subject_key in subjects:
-                gen_result = self.generate_word(root, tense, subject_key, verb_type, verb_home)
-                if "error" not in gen_result:
+                program = programs.get((tense, subject_key))
+                if program is not None:
+                    word, variants, _ = self._cell_words(context, program)
                     old_key = key_map.get(subject_key, subject_key)
-                    result[tense][old_key] = gen_result["word"]
-                    if gen_result.get("variants"):
-                        result["variants"].setdefault(tense, {})[old_key] = gen_result["variants"]
+                    result[tense][old_key] = word
+                    if variants:
+                        result["variants"].setdefault(tense, {})[old_key] = list(variants)
         
         if not result["variants"]:
             del result["variants"]
 
-        result['derived'] = {}
-        derived_keys = [
-            "infinitive", "active_participle", "passive_participle", 
-            "instrumental", "verbal_noun", "abstract_noun",
-            "verbal_noun_alt", "causative_agent", "passive_adj", "place_noun",
-            "result_noun"
-        ]
-        for key in derived_keys:
-            gen_result = self.generate_derived(root, key, verb_type)
-            if "error" not in gen_result:
-                result['derived'][key] = gen_result['word']
+        result['derived'] = self._derived_words(root, verb_type)
 
         return result
 
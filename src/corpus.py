@@ -0,0 +1,147 @@
+"""
+EthioMorph Corpus - Streaming Tokenization and Analysis
+=======================================================
+Splits Ge'ez running text into word tokens with character offsets and
+feeds them through the stemmer one at a time.
+
+Everything here is a generator over text chunks: files are read in fixed-
+size blocks and only the token straddling a block boundary is carried
+over, so memory stays constant however large the input is.
+
+Token separators are whitespace and the Ethiopic punctuation marks
+፡ (wordspace) ። (full stop) ፣ (comma) ፤ (semicolon) ፥ (colon) ፦ (preface colon).
+
+Esubalew Chekol
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple, TextIO
+
+ETHIOPIC_PUNCTUATION = '፡።፣፤፥፦'
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # characters per read
+
+_TOKEN_RE = re.compile(rf'[^\s{ETHIOPIC_PUNCTUATION}]+')
+
+# Ethiopic syllables (main, supplement, extended and extended-A blocks);
+# numerals and punctuation are excluded.
+_SYLLABLE_RE = re.compile('[\u1200-\u135a\u1380-\u138f\u2d80-\u2ddf\uab00-\uab2f]')
+
+
+class Token(NamedTuple):
+    """A word token and its [start, end) character offsets in the input."""
+    text: str
+    start: int
+    end: int
+
+
+def read_chunks(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Yields successive blocks of at most chunk_size characters from a text stream."""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_tokens(chunks: Iterable[str]) -> Iterator[Token]:
+    """
+    Tokenizes a stream of text chunks.
+
+    Chunks may split a word anywhere; the partial word at the end of a chunk
+    is held back and joined with the next one, so the tokens (and offsets)
+    are the same as for the concatenated text.
+
+    Args:
+        chunks: Any iterable of strings (a list, lines of a file, read_chunks()).
+
+    Yields:
+        Token(text, start, end) with offsets into the concatenated input.
+    """
+    carry = ''
+    base = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        text = carry + chunk if carry else chunk
+        size = len(text)
+        held = None
+        for match in _TOKEN_RE.finditer(text):
+            if held is not None:
+                yield held
+            held = Token(match.group(), base + match.start(), base + match.end())
+        if held is not None and held.end - base == size:
+            # May continue in the next chunk.
+            carry = held.text
+            base = held.start
+        else:
+            if held is not None:
+                yield held
+            carry = ''
+            base += size
+    if carry:
+        yield Token(carry, base, base + len(carry))
+
+
+def tokenize(text: str) -> list[Token]:
+    """Tokenizes a whole string."""
+    return list(iter_tokens((text,)))
+
+
+def is_geez_token(text: str) -> bool:
+    """True when the token contains at least one Ethiopic syllable."""
+    return _SYLLABLE_RE.search(text) is not None
+
+
+def analyze_stream(
+    chunks: Iterable[str],
+    stemmer=None,
+    *,
+    lean: bool = False,
+    geez_only: bool = True,
+) -> Iterator[tuple[Token, dict]]:
+    """
+    Lazily analyzes every token of a text stream.
+
+    Args:
+        chunks: Any iterable of strings.
+        stemmer: A GeezStemmer; defaults to the shared engine.
+        lean: Use analyze_fast (LeanAnalysis records) instead of extract_root.
+        geez_only: Skip tokens without Ethiopic syllables (numerals, Latin).
+
+    Yields:
+        (Token, analysis) pairs in input order.
+    """
+    if stemmer is None:
+        from src.engines import get_stemmer
+        stemmer = get_stemmer()
+    analyze = stemmer.analyze_fast if lean else stemmer.extract_root
+    for token in iter_tokens(chunks):
+        if geez_only and not is_geez_token(token.text):
+            continue
+        yield token, analyze(token.text)
+
+
+def analyze_file(
+    path: str | Path,
+    stemmer=None,
+    *,
+    lean: bool = False,
+    geez_only: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = 'utf-8',
+) -> Iterator[tuple[Token, dict]]:
+    """
+    Lazily analyzes a text file, reading it chunk_size characters at a time.
+
+    Offsets are character offsets into the decoded file. See analyze_stream
+    for the other arguments.
+    """
+    with open(path, encoding=encoding) as handle:
+        yield from analyze_stream(
+            read_chunks(handle, chunk_size), stemmer, lean=lean, geez_only=geez_only
+        )
@@ -0,0 +1,454 @@
+"""
+EthioMorph Data Artifact - Compiled Binary Data Format
+======================================================
+Compiles the lexicon, grammar indices and templates into one versioned
+binary file that the runtime opens with mmap instead of parsing JSON.
+
+The JSON files in data/ remain the source of truth; the artifact is a
+build output (see scripts/build_data_artifact.py), not committed, stamped
+with the content hash of the JSON it was built from and a fingerprint of
+each source file.
+
+Layout (little-endian, sections aligned to 4 bytes):
+
+    header     magic "EMDA", u16 format, u16 section count
+    directory  per section: name (24 bytes), u8 kind, u64 offset, u64 length
+    strings    NUL-separated UTF-8; a string's id is its position
+    lists      u32 array; a list is [length, string id, string id, ...]
+    meta       UTF-8 JSON (version, grammar sources, stems)
+    tables     u32 count, u32 key bytes, NUL-separated UTF-8 keys,
+               padding, u32 values, then the JSON documents (KIND_JSON)
+    indexes    self-contained string -> string list tables (KIND_INDEX)
+
+Table values are string ids (KIND_STR), offsets into the lists section
+(KIND_LIST) or (offset, length) pairs of UTF-8 JSON documents (KIND_JSON).
+Roots and forms are referred to by their integer string id.
+
+String and list tables are small lookup indexes and are decoded in bulk
+into plain dicts on first use. JSON tables (lexicon entries, grammar
+entries, templates) are served by MappedTable, which decodes one entry at
+a time on first access.
+
+Large string-list tables (the paradigm index, ~130k forms) are written as
+KIND_INDEX sections with their own string pool, so they never enlarge the
+shared strings/lists sections the small tables decode:
+
+    u32 count, u32 pool size, u32 key bytes, u32 pool bytes, u32 slots
+    u32 key offsets[count + 1]     keys sorted by UTF-8 bytes
+    u32 value offsets[count + 1]   into the value ids
+    u32 value ids[...]             into the pool
+    u32 pool offsets[pool size + 1]
+    u32 (hash, entry + 1)[slots]   open-addressing table, 0 = empty slot
+    key bytes, pool bytes
+
+Keys hash with CRC-32 of their UTF-8 bytes (stable across processes, unlike
+hash()) into a power-of-two table at most half full, probed linearly.
+MappedIndex compares the stored hash before any key bytes, so a miss is
+usually one or two integer reads, and decodes only the entries (and pool
+strings) it is asked for.
+
+Esubalew Chekol
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+
+ARTIFACT_MAGIC = b"EMDA"
+ARTIFACT_FORMAT = 4
+
+KIND_STRINGS = 0
+KIND_LISTS = 1
+KIND_META = 2
+KIND_STR = 3
+KIND_LIST = 4
+KIND_JSON = 5
+KIND_INDEX = 6
+
+_HEADER = struct.Struct("<4sHH")
+_SECTION = struct.Struct("<24sBQQ")
+_U32 = struct.Struct("<I")
+_INDEX_HEADER = struct.Struct("<5I")
+_MISSING = object()
+
+
+class ArtifactFormatError(ValueError):
+    """Raised when a data artifact is missing, truncated or of another format."""
+
+
+def _pad4(data: bytearray) -> None:
+    data.extend(b"\0" * (-len(data) % 4))
+
+
+def _join_keys(name: str, keys: list[str]) -> bytes:
+    if any("\0" in key for key in keys):
+        raise ValueError(f"Table '{name}' has a key containing NUL")
+    return "\0".join(keys).encode("utf-8")
+
+
+class ArtifactWriter:
+    """Accumulates tables and writes them as one artifact."""
+
+    def __init__(self, meta: dict):
+        self.meta = meta
+        self.string_ids: dict[str, int] = {}
+        self.lists: list[int] = []
+        self.list_offsets: dict[tuple[int, ...], int] = {}
+        self.tables: list[tuple[str, int, bytes]] = []
+
+    def _intern(self, value: str) -> int:
+        sid = self.string_ids.get(value)
+        if sid is None:
+            sid = self.string_ids[value] = len(self.string_ids)
+        return sid
+
+    def _list_ref(self, items) -> int:
+        ids = tuple(self._intern(item) for item in items)
+        offset = self.list_offsets.get(ids)
+        if offset is None:
+            offset = self.list_offsets[ids] = len(self.lists)
+            self.lists.append(len(ids))
+            self.lists.extend(ids)
+        return offset
+
+    def add_table(self, name: str, kind: int, mapping: Mapping) -> None:
+        """
+        Adds a string-keyed table.
+
+        Args:
+            name: Section name (ASCII, at most 24 bytes).
+            kind: KIND_STR, KIND_LIST or KIND_JSON.
+            mapping: Table contents; iteration order is preserved.
+        """
+        keys = list(mapping)
+        key_blob = _join_keys(name, keys)
+        body = bytearray(_U32.pack(len(keys)) + _U32.pack(len(key_blob)) + key_blob)
+        _pad4(body)
+        values = []
+        documents = bytearray()
+        for key in keys:
+            value = mapping[key]
+            if kind == KIND_STR:
+                values.append(self._intern(value))
+            elif kind == KIND_LIST:
+                values.append(self._list_ref(value))
+            elif kind == KIND_JSON:
+                encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                values.extend((len(documents), len(encoded)))
+                documents.extend(encoded)
+            else:
+                raise ValueError(f"Unsupported table kind {kind}")
+        body.extend(struct.pack(f"<{len(values)}I", *values))
+        body.extend(documents)
+        self.tables.append((name, kind, bytes(body)))
+
+    def add_index(self, name: str, mapping: Mapping) -> None:
+        """
+        Adds a large string -> list of strings table as a KIND_INDEX section.
+
+        Args:
+            name: Section name (ASCII, at most 24 bytes).
+            mapping: Table contents; stored in UTF-8 key order.
+        """
+        encoded = sorted((key.encode("utf-8"), key) for key in mapping)
+        pool: dict[str, int] = {}
+        key_offsets = [0]
+        value_offsets = [0]
+        value_ids = []
+        key_blob = bytearray()
+        for raw, key in encoded:
+            key_blob.extend(raw)
+            key_offsets.append(len(key_blob))
+            for item in mapping[key]:
+                sid = pool.get(item)
+                if sid is None:
+                    sid = pool[item] = len(pool)
+                value_ids.append(sid)
+            value_offsets.append(len(value_ids))
+        pool_offsets = [0]
+        pool_blob = bytearray()
+        for item in pool:
+            pool_blob.extend(item.encode("utf-8"))
+            pool_offsets.append(len(pool_blob))
+
+        slot_count = 1
+        while slot_count < 2 * len(encoded):
+            slot_count *= 2
+        mask = slot_count - 1
+        slots = [0] * (2 * slot_count)
+        for entry, (raw, _) in enumerate(encoded):
+            key_hash = zlib.crc32(raw)
+            slot = key_hash & mask
+            while slots[2 * slot + 1]:
+                slot = (slot + 1) & mask
+            slots[2 * slot] = key_hash
+            slots[2 * slot + 1] = entry + 1
+
+        body = bytearray(_INDEX_HEADER.pack(
+            len(encoded), len(pool), len(key_blob), len(pool_blob), slot_count
+        ))
+        for array in (key_offsets, value_offsets, value_ids, pool_offsets, slots):
+            body.extend(struct.pack(f"<{len(array)}I", *array))
+        body.extend(key_blob)
+        body.extend(pool_blob)
+        self.tables.append((name, KIND_INDEX, bytes(body)))
+
+    def to_bytes(self) -> bytes:
+        sections = [
+            ("strings", KIND_STRINGS, _join_keys("strings", list(self.string_ids))),
+            ("lists", KIND_LISTS, struct.pack(f"<{len(self.lists)}I", *self.lists)),
+            ("meta", KIND_META, json.dumps(self.meta, ensure_ascii=False).encode("utf-8")),
+        ] + self.tables
+
+        offset = _HEADER.size + _SECTION.size * len(sections)
+        offset += -offset % 4
+        directory = bytearray()
+        payload = bytearray()
+        for name, kind, body in sections:
+            directory.extend(_SECTION.pack(name.encode("ascii"), kind, offset + len(payload), len(body)))
+            payload.extend(body)
+            _pad4(payload)
+
+        out = bytearray(_HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_FORMAT, len(sections)))
+        out.extend(directory)
+        _pad4(out)
+        out.extend(payload)
+        return bytes(out)
+
+
+class MappedTable(Mapping):
+    """Read-only view of a JSON table; each entry decodes on first access."""
+
+    def __init__(self, artifact: "MappedArtifact", keys: list[str], values, documents_start: int):
+        self._artifact = artifact
+        self._index = dict(zip(keys, range(len(keys))))
+        self._values = values
+        self._documents_start = documents_start
+        self._decoded = {}
+
+    def _decode(self, pos: int):
+        start = self._documents_start + self._values[2 * pos]
+        end = start + self._values[2 * pos + 1]
+        return json.loads(bytes(self._artifact.buffer[start:end]).decode("utf-8"))
+
+    def __getitem__(self, key):
+        value = self._decoded.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._decoded[key] = self._decode(self._index[key])
+        return value
+
+    def get(self, key, default=None):
+        value = self._decoded.get(key, _MISSING)
+        if value is _MISSING:
+            pos = self._index.get(key)
+            if pos is None:
+                return default
+            value = self._decoded[key] = self._decode(pos)
+        return value
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
+class MappedIndex(Mapping):
+    """
+    Read-only view of a KIND_INDEX section.
+
+    Lookups probe the section's hash table in the mapped bytes; a value is
+    decoded (as a new list) only when asked for, and pool strings are
+    decoded once each.
+    """
+
+    def __init__(self, artifact: "MappedArtifact", offset: int):
+        buf = artifact.buffer
+        count, pool_size, key_bytes, _, slot_count = _INDEX_HEADER.unpack_from(buf, offset)
+        pos = offset + _INDEX_HEADER.size
+
+        def array(length):
+            nonlocal pos
+            view = buf[pos:pos + 4 * length].cast("I")
+            pos += 4 * length
+            return view
+
+        self._count = count
+        self._key_offsets = array(count + 1)
+        self._value_offsets = array(count + 1)
+        self._value_ids = array(self._value_offsets[count] if count else 0)
+        self._pool_offsets = array(pool_size + 1)
+        self._slots = array(2 * slot_count)
+        self._mask = slot_count - 1
+        self._keys_start = pos
+        self._pool_start = pos + key_bytes
+        self._buffer = buf
+        self._pool: dict[int, str] = {}
+
+    def _key_bytes(self, i: int) -> bytes:
+        start = self._keys_start
+        return bytes(self._buffer[start + self._key_offsets[i]:start + self._key_offsets[i + 1]])
+
+    def _find(self, key) -> int:
+        if not isinstance(key, str):
+            return -1
+        target = key.encode("utf-8")
+        key_hash = zlib.crc32(target)
+        slots = self._slots
+        mask = self._mask
+        slot = key_hash & mask
+        while True:
+            entry = slots[2 * slot + 1]
+            if not entry:
+                return -1
+            if slots[2 * slot] == key_hash:
+                entry -= 1
+                start = self._keys_start
+                offsets = self._key_offsets
+                if self._buffer[start + offsets[entry]:start + offsets[entry + 1]] == target:
+                    return entry
+            slot = (slot + 1) & mask
+
+    def _string(self, sid: int) -> str:
+        value = self._pool.get(sid)
+        if value is None:
+            start = self._pool_start
+            value = self._pool[sid] = bytes(
+                self._buffer[start + self._pool_offsets[sid]:start + self._pool_offsets[sid + 1]]
+            ).decode("utf-8")
+        return value
+
+    def _value(self, i: int) -> list[str]:
+        ids = self._value_ids[self._value_offsets[i]:self._value_offsets[i + 1]]
+        return [self._string(sid) for sid in ids]
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._value(i)
+
+    def get(self, key, default=None):
+        i = self._find(key)
+        return default if i < 0 else self._value(i)
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._key_bytes(i).decode("utf-8")
+
+    def __len__(self):
+        return self._count
+
+
+class MappedArtifact:
+    """An mmap-backed data artifact."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        if sys.byteorder != "little":
+            raise ArtifactFormatError("Data artifacts are little-endian; this platform is not")
+        try:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise ArtifactFormatError(f"Cannot map data artifact {self.path}: {exc}") from exc
+        self.buffer = memoryview(self._mmap)
+
+        if len(self.buffer) < _HEADER.size:
+            raise ArtifactFormatError(f"Truncated data artifact {self.path}")
+        magic, fmt, count = _HEADER.unpack_from(self.buffer, 0)
+        if magic != ARTIFACT_MAGIC or fmt != ARTIFACT_FORMAT:
+            raise ArtifactFormatError(
+                f"{self.path} is not a format {ARTIFACT_FORMAT} EthioMorph data artifact"
+            )
+
+        self.sections: dict[str, tuple[int, int, int]] = {}
+        for i in range(count):
+            raw_name, kind, offset, length = _SECTION.unpack_from(self.buffer, _HEADER.size + i * _SECTION.size)
+            if offset + length > len(self.buffer):
+                raise ArtifactFormatError(f"Truncated data artifact {self.path}")
+            self.sections[raw_name.rstrip(b"\0").decode("ascii")] = (kind, offset, length)
+
+        self.meta = json.loads(self._section_bytes("meta").decode("utf-8"))
+        self._strings = None
+        self._lists = None
+        self._tables: dict[str, Mapping] = {}
+
+    def _section_bytes(self, name: str) -> bytes:
+        if name not in self.sections:
+            raise ArtifactFormatError(f"Data artifact {self.path} has no section '{name}'")
+        _, offset, length = self.sections[name]
+        return bytes(self.buffer[offset:offset + length])
+
+    @property
+    def strings(self) -> list[str]:
+        """The string table, indexed by string id (decoded in one pass)."""
+        if self._strings is None:
+            raw = self._section_bytes("strings")
+            self._strings = raw.decode("utf-8").split("\0") if raw else []
+        return self._strings
+
+    def _string_lists(self) -> memoryview:
+        """The lists section as a u32 view; only the lists read are copied out."""
+        if self._lists is None:
+            _, offset, length = self.sections["lists"]
+            self._lists = self.buffer[offset:offset + length].cast("I")
+        return self._lists
+
+    def table(self, name: str) -> Mapping:
+        """
+        Returns the named table, decoding it on first use.
+
+        String and list tables come back as plain dicts; JSON tables as a
+        MappedTable and index sections as a MappedIndex, both of which decode
+        entries lazily.
+        """
+        table = self._tables.get(name)
+        if table is not None:
+            return table
+
+        if name not in self.sections:
+            raise ArtifactFormatError(f"Data artifact {self.path} has no table '{name}'")
+        kind, offset, _ = self.sections[name]
+        if kind == KIND_INDEX:
+            table = self._tables[name] = MappedIndex(self, offset)
+            return table
+        buf = self.buffer
+        count = _U32.unpack_from(buf, offset)[0]
+        key_len = _U32.unpack_from(buf, offset + 4)[0]
+        keys_start = offset + 8
+        keys = bytes(buf[keys_start:keys_start + key_len]).decode("utf-8").split("\0") if count else []
+        values_start = keys_start + key_len + (-key_len % 4)
+        width = 2 if kind == KIND_JSON else 1
+        values_end = values_start + 4 * width * count
+        values = buf[values_start:values_end].cast("I")
+
+        if kind == KIND_STR:
+            strings = self.strings
+            table = dict(zip(keys, [strings[sid] for sid in values]))
+        elif kind == KIND_LIST:
+            strings = self.strings
+            lists = self._string_lists()
+            table = {
+                key: [strings[sid] for sid in lists[ref + 1:ref + 1 + lists[ref]]]
+                for key, ref in zip(keys, values.tolist())
+            }
+        elif kind == KIND_JSON:
+            table = MappedTable(self, keys, values, values_end)
+        else:
+            raise ArtifactFormatError(f"Section '{name}' is not a table")
+
+        self._tables[name] = table
+        return table
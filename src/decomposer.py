@@ -7,6 +7,43 @@ base consonant and vowel order.
 Esubalew Chekol
 """
 
+# Decomposition is table-driven from codepoint offsets. Ethiopic syllables
+# come in rows of 8 cells starting at a multiple of 8: cell i of a row is
+# order i + 1 of the row's first cell (base + order - 1), and the 8th cell
+# is the row's labialized/"oa" variant (order 8). Labialized rows (ቈ, ኰ,
+# ...) only fill orders 1, 3, 4, 5, 6.
+#
+# _BASES and _ORDERS are flat arrays indexed by ord(c) - ETHIOPIC_START,
+# covering Ethiopic (U+1200-U+137F), Ethiopic Supplement (U+1380-U+139F)
+# and Ethiopic Extended (U+2D80-U+2DDF). The lookup maps below and the
+# str.translate table used for skeletons are compiled from them.
+ETHIOPIC_START = 0x1200
+ETHIOPIC_END = 0x2DE0
+
+_BASES: list[str | None] = [None] * (ETHIOPIC_END - ETHIOPIC_START)
+_ORDERS = bytearray(ETHIOPIC_END - ETHIOPIC_START)
+
+# Order of each cell in a row (0 = no syllable in that cell).
+STANDARD_ROW = (1, 2, 3, 4, 5, 6, 7, 8)
+SEVEN_ORDER_ROW = (1, 2, 3, 4, 5, 6, 7, 0)
+LABIALIZED_ROW = (1, 0, 3, 4, 5, 6, 0, 0)
+LABIALIZED_QUAD = (1, 3, 5, 6)
+
+# Row starts: U+1200-U+1357 in 8-cell rows, Ethiopic Extended U+2DA0-U+2DDF
+# in 7-order rows; the labialized rows of the main block.
+MAIN_ROWS = range(0x1200, 0x1358, 8)
+EXTENDED_ROWS = range(0x2DA0, 0x2DE0, 8)
+LABIALIZED_ROWS = (0x1248, 0x1258, 0x1288, 0x12B0, 0x12C0, 0x1310)
+
+# Four-cell labialized runs (Sebatbeit MWA.., BWA.., FWA.., PWA..; GGWA..).
+LABIALIZED_QUADS = (0x1380, 0x1384, 0x1388, 0x138C, 0x2D93)
+
+# Stand-alone variant cells: glyph -> base of the row it varies (order 8).
+VARIANT_CELLS = dict(zip(
+    'ፘፙፚ' 'ⶀⶁⶂⶃⶄⶅⶆⶇⶈⶉⶊⶋⶌⶍⶎⶏⶐⶑⶒ',
+    'ረመፈ' 'ለመረሰሸበተቸነኘአዘደዸጀጠጨጰፐ',
+))
+
 DEVOWELIZATION_MAP = {}
 ORDER_MAP = {}
 REVOWELIZATION_MAP = {}
@@ -21,55 +58,63 @@ AMBIGUOUS_VOWEL_DEFAULTS = {
 }
 
 
+def _set_cell(char, base, order):
+    _BASES[ord(char) - ETHIOPIC_START] = base
+    _ORDERS[ord(char) - ETHIOPIC_START] = order
+    REVOWELIZATION_MAP[(base, order)] = char
+
+
+def _add_layout(start, layout):
+    """Registers the cells of a row by codepoint offset from its first cell."""
+    base = chr(start)
+    for offset, order in enumerate(layout):
+        if order:
+            _set_cell(chr(start + offset), base, order)
+
+
 def _add_row(base, chars):
-    """Populate character maps for a standard 7-order row."""
+    """Registers an explicitly listed 7-order row over the arithmetic layout."""
     for i, char in enumerate(chars):
-        DEVOWELIZATION_MAP[char] = base
-        ORDER_MAP[char] = i + 1
-        REVOWELIZATION_MAP[(base, i + 1)] = char
+        _set_cell(char, base, i + 1)
 
 
 def _apply_ambiguous_defaults():
     """Re-pin shared vowel glyphs to the preferred consonant row after registration."""
     for char, preferred_base in AMBIGUOUS_VOWEL_DEFAULTS.items():
-        DEVOWELIZATION_MAP[char] = preferred_base
-_add_row('ሀ', ['ሀ', 'ሁ', 'ሂ', 'ሃ', 'ሄ', 'ህ', 'ሆ'])
-_add_row('ለ', ['ለ', 'ሉ', 'ሊ', 'ላ', 'ሌ', 'ል', 'ሎ'])
-_add_row('ሐ', ['ሐ', 'ሑ', 'ሒ', 'ሓ', 'ሔ', 'ሕ', 'ሖ'])
-_add_row('መ', ['መ', 'ሙ', 'ሚ', 'ማ', 'ሜ', 'ም', 'ሞ'])
-_add_row('ሠ', ['ሠ', 'ሡ', 'ሢ', 'ሣ', 'ሤ', 'ሥ', 'ሦ'])
-_add_row('ረ', ['ረ', 'ሩ', 'ሪ', 'ራ', 'ሬ', 'ር', 'ሮ'])
-_add_row('ሰ', ['ሰ', 'ሱ', 'ሲ', 'ሳ', 'ሴ', 'ስ', 'ሶ'])
-_add_row('ሸ', ['ሸ', 'ሹ', 'ሺ', 'ሻ', 'ሼ', 'ሽ', 'ሾ'])
-_add_row('ቀ', ['ቀ', 'ቁ', 'ቂ', 'ቃ', 'ቄ', 'ቅ', 'ቆ'])
-_add_row('በ', ['በ', 'ቡ', 'ቢ', 'ባ', 'ቤ', 'ብ', 'ቦ'])
-_add_row('ቨ', ['ቨ', 'ቩ', 'ቪ', 'ቫ', 'ቬ', 'ቭ', 'ቮ'])
-_add_row('ተ', ['ተ', 'ቱ', 'ቲ', 'ታ', 'ቴ', 'ት', 'ቶ'])
-_add_row('ቸ', ['ቸ', 'ቹ', 'ቺ', 'ቻ', 'ቼ', 'ች', 'ቾ'])
-_add_row('ኀ', ['ኀ', 'ኁ', 'ኂ', 'ኃ', 'ኄ', 'ኅ', 'ኆ'])
-_add_row('ነ', ['ነ', 'ኑ', 'ኒ', 'ና', 'ኔ', 'ን', 'ኖ'])
-_add_row('ኘ', ['ኘ', 'ኙ', 'ኚ', 'ኛ', 'ኜ', 'ኝ', 'ኞ'])
-_add_row('አ', ['አ', 'ኡ', 'ኢ', 'ኣ', 'ኤ', 'እ', 'ኦ'])
-_add_row('ከ', ['ከ', 'ኩ', 'ኪ', 'ካ', 'ኬ', 'ክ', 'ኮ'])
-_add_row('ኸ', ['ኸ', 'ኹ', 'ኺ', 'ኻ', 'ኼ', 'ኽ', 'ኾ'])
-_add_row('ወ', ['ወ', 'ዉ', 'ዊ', 'ዋ', 'ዌ', 'ው', 'ዎ'])
+        _BASES[ord(char) - ETHIOPIC_START] = preferred_base
+
+
+for _start in MAIN_ROWS:
+    _add_layout(_start, LABIALIZED_ROW if _start in LABIALIZED_ROWS else STANDARD_ROW)
+for _start in EXTENDED_ROWS:
+    _add_layout(_start, SEVEN_ORDER_ROW)
+for _start in LABIALIZED_QUADS:
+    for _offset, _order in enumerate(LABIALIZED_QUAD):
+        _set_cell(chr(_start + _offset), chr(_start), _order)
+for _char, _base in VARIANT_CELLS.items():
+    _BASES[ord(_char) - ETHIOPIC_START] = _base
+    _ORDERS[ord(_char) - ETHIOPIC_START] = 8
+    REVOWELIZATION_MAP.setdefault((_base, 8), _char)
+
+# Irregular rows. The ዐ row is keyed by ዓ (ዐ itself is left unmapped and ዓ
+# reads as 4th order), and the ፀ row spells its 3rd order with the shared ጺ.
+_BASES[0x12D0 - ETHIOPIC_START] = None
+_ORDERS[0x12D0 - ETHIOPIC_START] = 0
+for _order in range(1, 8):
+    REVOWELIZATION_MAP.pop(('ዐ', _order), None)
 _add_row('ዓ', ['ዓ', 'ዑ', 'ዒ', 'ዓ', 'ዔ', 'ዕ', 'ዖ'])
-_add_row('ዘ', ['ዘ', 'ዙ', 'ዚ', 'ዛ', 'ዜ', 'ዝ', 'ዞ'])
-_add_row('ዠ', ['ዠ', 'ዡ', 'ዢ', 'ዣ', 'ዤ', 'ዥ', 'ዦ'])
-_add_row('የ', ['የ', 'ዩ', 'ዪ', 'ያ', 'ዬ', 'ይ', 'ዮ'])
-_add_row('ደ', ['ደ', 'ዱ', 'ዲ', 'ዳ', 'ዴ', 'ድ', 'ዶ'])
-_add_row('ጀ', ['ጀ', 'ጁ', 'ጂ', 'ጃ', 'ጄ', 'ጅ', 'ጆ'])
-_add_row('ገ', ['ገ', 'ጉ', 'ጊ', 'ጋ', 'ጌ', 'ግ', 'ጎ'])
-_add_row('ጠ', ['ጠ', 'ጡ', 'ጢ', 'ጣ', 'ጤ', 'ጥ', 'ጦ'])
-_add_row('ጨ', ['ጨ', 'ጩ', 'ጪ', 'ጫ', 'ጬ', 'ጭ', 'ጮ'])
-_add_row('ጰ', ['ጰ', 'ጱ', 'ጲ', 'ጳ', 'ጴ', 'ጵ', 'ጶ'])
-_add_row('ጸ', ['ጸ', 'ጹ', 'ጺ', 'ጻ', 'ጼ', 'ጽ', 'ጾ'])
 _add_row('ፀ', ['ፀ', 'ፁ', 'ጺ', 'ፃ', 'ፄ', 'ፅ', 'ፆ'])
-_add_row('ፈ', ['ፈ', 'ፉ', 'ፊ', 'ፋ', 'ፌ', 'ፍ', 'ፎ'])
-_add_row('ፐ', ['ፐ', 'ፑ', 'ፒ', 'ፓ', 'ፔ', 'ፕ', 'ፖ'])
 
 _apply_ambiguous_defaults()
 
+for _index, _base in enumerate(_BASES):
+    if _base is not None:
+        _char = chr(ETHIOPIC_START + _index)
+        DEVOWELIZATION_MAP[_char] = _base
+        ORDER_MAP[_char] = _ORDERS[_index]
+
+_SKELETON_TABLE = str.maketrans(DEVOWELIZATION_MAP)
+
 def devowelize(char: str) -> str:
     """
     Maps a Ge'ez character to its 1st order (consonant base).
@@ -88,13 +133,13 @@ def devowelize(char: str) -> str:
 
 def get_char_order(char: str) -> int:
     """
-    Returns the order (1-7) of a Ge'ez character.
+    Returns the order (1-8) of a Ge'ez character.
     
     Args:
         char: The input Ge'ez character.
         
     Returns:
-        The order (1-7), or 0 if not found.
+        The order (1-8, 8 being a row's labialized/"oa" cell), or 0 if not found.
     """
     return ORDER_MAP.get(char, 0)
 
@@ -105,7 +150,7 @@ def get_char_by_order(base: str, order: int) -> str:
     
     Args:
         base: The base consonant (1st order).
-        order: The target order (1-7).
+        order: The target order (1-8; 8 is the labialized/"oa" cell).
         
     Returns:
         The character at the specified order, or base if not found.
@@ -123,7 +168,7 @@ def get_consonant_skeleton(word: str) -> str:
     Returns:
         The sequence of 1st order characters.
     """
-    return "".join([devowelize(c) for c in word])
+    return word.translate(_SKELETON_TABLE)
 
 
 # Laryngeal consonants (gutturals) that affect conjugation patterns
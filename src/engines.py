@@ -0,0 +1,207 @@
+"""
+EthioMorph Engines - Process-Level Engine Registry
+==================================================
+Builds each analysis/generation engine once per worker process and shares
+it across requests, so per-request latency depends on the word being
+processed rather than on parsing the data files.
+
+Esubalew Chekol
+"""
+
+import gzip
+import json
+import os
+import threading
+
+from src.cache import AnalysisCache, ParadigmCache
+from src.instrumentation import count_branches, instrument
+from src.stemmer import CANONICAL_CACHE_ENTRIES, GeezStemmer
+from src.conjugator import EthioMorphGenerator
+
+# Shared stemmer's analysis cache budget; 0 entries disables it.
+ANALYSIS_CACHE_ENTRIES = int(os.environ.get('ETHIOMORPH_ANALYSIS_CACHE', '4096'))
+ANALYSIS_CACHE_BYTES = int(os.environ.get('ETHIOMORPH_ANALYSIS_CACHE_BYTES', str(16 * 1024 * 1024)))
+# Shared stemmer's root canonicalization memo size; 0 disables it.
+CANONICAL_CACHE_ENTRIES = int(os.environ.get('ETHIOMORPH_CANONICAL_CACHE', str(CANONICAL_CACHE_ENTRIES)))
+# Byte budget of the serialized /api/expand paradigms; 0 disables the cache.
+PARADIGM_CACHE_BYTES = int(os.environ.get('ETHIOMORPH_PARADIGM_CACHE_BYTES', str(32 * 1024 * 1024)))
+# Time the shared stemmer's analysis stages (see src.instrumentation).
+INSTRUMENT = os.environ.get('ETHIOMORPH_INSTRUMENT', '') not in ('', '0')
+# Count the shared stemmer's pipeline exits (see src.instrumentation).
+BRANCH_COUNTERS = os.environ.get('ETHIOMORPH_BRANCH_COUNTERS', '') not in ('', '0')
+
+
+def _build_stemmer() -> GeezStemmer:
+    cache = None
+    if ANALYSIS_CACHE_ENTRIES > 0:
+        cache = AnalysisCache(
+            max_entries=ANALYSIS_CACHE_ENTRIES,
+            max_bytes=ANALYSIS_CACHE_BYTES or None,
+        )
+    stemmer = GeezStemmer(cache=cache, canonical_cache_entries=CANONICAL_CACHE_ENTRIES)
+    if INSTRUMENT:
+        instrument(stemmer)
+    if BRANCH_COUNTERS:
+        count_branches(stemmer)
+    return stemmer
+
+
+ENGINE_FACTORIES = {
+    'stemmer': _build_stemmer,
+    'generator': EthioMorphGenerator,
+}
+
+_ENGINES = {}
+_LOCK = threading.Lock()
+_PARADIGM_CACHE = None
+
+
+def get_engine(name: str):
+    """
+    Returns the shared engine registered under name, building it on first use.
+
+    Args:
+        name: A key of ENGINE_FACTORIES ('stemmer' or 'generator').
+
+    Returns:
+        The process-wide engine instance.
+    """
+    engine = _ENGINES.get(name)
+    if engine is not None:
+        return engine
+    if name not in ENGINE_FACTORIES:
+        raise ValueError(f"Unknown engine '{name}'")
+    with _LOCK:
+        engine = _ENGINES.get(name)
+        if engine is None:
+            engine = ENGINE_FACTORIES[name]()
+            _ENGINES[name] = engine
+    return engine
+
+
+def get_stemmer() -> GeezStemmer:
+    """Returns the shared GeezStemmer."""
+    return get_engine('stemmer')
+
+
+def get_generator() -> EthioMorphGenerator:
+    """Returns the shared EthioMorphGenerator."""
+    return get_engine('generator')
+
+
+def get_paradigm_cache() -> ParadigmCache | None:
+    """Returns the shared paradigm cache, or None when PARADIGM_CACHE_BYTES is 0."""
+    global _PARADIGM_CACHE
+    if _PARADIGM_CACHE is None and PARADIGM_CACHE_BYTES > 0:
+        with _LOCK:
+            if _PARADIGM_CACHE is None:
+                _PARADIGM_CACHE = ParadigmCache(max_entries=None, max_bytes=PARADIGM_CACHE_BYTES)
+    return _PARADIGM_CACHE
+
+
+def paradigm_json(root: str, verb_type: str | None = None, compress: bool = False) -> bytes:
+    """
+    The shared generator's expand_root(root, verb_type) as /api/expand serves it.
+
+    Paradigms only depend on the root, the verb type and the data version, so
+    the encoded JSON (and, once asked for, its gzip) is kept in the paradigm
+    cache; a repeat request is a lookup.
+
+    Args:
+        root: The verb root.
+        verb_type: The verb class (optional).
+        compress: Return the gzip-compressed body.
+
+    Returns:
+        The UTF-8 JSON body (indented), gzip-compressed when compress is set.
+    """
+    generator = get_generator()
+    cache = get_paradigm_cache()
+    key = (root, verb_type)
+    entry = None
+    if cache is not None:
+        cache.bind_version(generator.store.version)
+        entry = cache.get(key)
+    changed = entry is None
+    if changed:
+        result = generator.expand_root(root, verb_type)
+        entry = (json.dumps(result, ensure_ascii=False, indent=2).encode(), None)
+    if compress and entry[1] is None:
+        # mtime=0 keeps the compressed bytes the same for the same body.
+        entry = (entry[0], gzip.compress(entry[0], mtime=0))
+        changed = True
+    if changed and cache is not None:
+        cache.put(key, entry)
+    return entry[1] if compress else entry[0]
+
+
+def _loaded_stemmer() -> GeezStemmer | None:
+    """The shared stemmer if this process has built it; metrics never build it."""
+    return _ENGINES.get('stemmer')
+
+
+def stage_metrics() -> dict:
+    """
+    Stage timing snapshot of the shared stemmer.
+
+    Returns:
+        {"enabled": False} unless ETHIOMORPH_INSTRUMENT is set, else the
+        StageTimer snapshot plus "enabled": True. Before the stemmer is
+        built: {"enabled": INSTRUMENT, "loaded": False}.
+    """
+    stemmer = _loaded_stemmer()
+    if stemmer is None:
+        return {"enabled": INSTRUMENT, "loaded": False}
+    timer = stemmer.instrumentation
+    if timer is None:
+        return {"enabled": False}
+    return {"enabled": True, **timer.snapshot()}
+
+
+def branch_metrics() -> dict:
+    """
+    Branch counter snapshot of the shared stemmer.
+
+    Returns:
+        {"enabled": False} unless ETHIOMORPH_BRANCH_COUNTERS is set, else the
+        BranchCounters snapshot plus "enabled": True. Before the stemmer is
+        built: {"enabled": BRANCH_COUNTERS, "loaded": False}.
+    """
+    stemmer = _loaded_stemmer()
+    if stemmer is None:
+        return {"enabled": BRANCH_COUNTERS, "loaded": False}
+    counters = stemmer.branch_counters
+    if counters is None:
+        return {"enabled": False}
+    return {"enabled": True, **counters.snapshot()}
+
+
+def prometheus_metrics() -> str:
+    """Enabled stage histograms and branch counters in Prometheus text format."""
+    stemmer = _loaded_stemmer()
+    if stemmer is None:
+        return ""
+    return "".join(
+        recorder.prometheus()
+        for recorder in (stemmer.instrumentation, stemmer.branch_counters)
+        if recorder is not None
+    )
+
+
+def warm(*names: str) -> None:
+    """
+    Builds engines ahead of the first request (cold start).
+
+    Args:
+        names: Engines to build. Defaults to every registered engine.
+    """
+    for name in names or tuple(ENGINE_FACTORIES):
+        get_engine(name)
+
+
+def reset_engines() -> None:
+    """Drops all shared engines and the paradigm cache; the next lookup rebuilds them."""
+    global _PARADIGM_CACHE
+    with _LOCK:
+        _ENGINES.clear()
+        _PARADIGM_CACHE = None
@@ -7,13 +7,17 @@ from __future__ import annotations
 import json
 import os
 import re
+import time
 from pathlib import Path
+from typing import NamedTuple
 
 from src.normalizer import normalize_geez
-from src.decomposer import get_consonant_skeleton, get_char_order
+from src.decomposer import get_char_order
 
 NOISY_GLOSS_RE = re.compile(r"^.{1,2}$|❖")
 
+_MISSING = object()
+
 
 def _is_noisy_gloss(gloss: str | None) -> bool:
     if not gloss:
@@ -34,6 +38,25 @@ PATTERN_CODE_MAP = {
 }
 
 
+def unique_order_candidates(candidates) -> dict[int, str]:
+    """First-radical vowel order -> candidate, for orders exactly one candidate has."""
+    by_order: dict[int, list[str]] = {}
+    for candidate in candidates:
+        order = get_char_order(candidate[0])
+        if order:
+            by_order.setdefault(order, []).append(candidate)
+    return {order: hits[0] for order, hits in by_order.items() if len(hits) == 1}
+
+
+class SkeletonBucket(NamedTuple):
+    """Precomputed resolve_skeleton decisions for one skeleton."""
+    roots: tuple[str, ...]
+    by_order: dict[int, str]
+    # First root glossed with the ንገረ marker (or spelled with ን-), picked
+    # for 6th-order imperfective/jussive sources.
+    marked: str | None
+
+
 class GrammarIndex:
     """Lookup over ግስ ከሀ-ፐ plus መጽሐፈ ግስ ዘዋድላ indices."""
 
@@ -41,8 +64,12 @@ class GrammarIndex:
         self.roots: dict[str, dict] = {}
         self.form_to_roots: dict[str, list[str]] = {}
         self.skeleton_to_roots: dict[str, list[str]] = {}
+        self.normalized_form_to_roots: dict[str, list[str]] = {}
+        self._skeleton_buckets: dict[str, SkeletonBucket | None] = {}
         self.loaded = False
         self.secondary_roots: dict[str, dict] = {}
+        # Per-source ingest timings: {"primary": {"seconds", "roots", "forms"}, ...}
+        self.ingest_stats: dict[str, dict] = {}
 
         data_dir = Path(__file__).resolve().parents[1] / "data"
         if path is None:
@@ -53,9 +80,17 @@ class GrammarIndex:
         path = Path(path)
         secondary_path = Path(secondary_path)
 
+        # Ingest into dict-keyed buckets (ordered sets) and freeze them into
+        # lists once every source is in; skeletons are memoized per string.
+        form_buckets: dict[str, dict[str, None]] = {}
+        skeleton_buckets: dict[str, dict[str, None]] = {}
+        skeletons: dict[str, str] = {}
+
         if path.exists():
+            started = time.perf_counter()
             payload = json.loads(path.read_text(encoding="utf-8"))
-            self._ingest_payload(payload, primary=True)
+            self._ingest_payload(payload, form_buckets, skeleton_buckets, skeletons, primary=True)
+            self.ingest_stats["primary"] = self._ingest_stat(payload, started)
             self.source = {
                 "title": payload.get("source"),
                 "author": payload.get("author"),
@@ -65,8 +100,10 @@ class GrammarIndex:
             self.loaded = True
 
         if secondary_path.exists():
+            started = time.perf_counter()
             payload = json.loads(secondary_path.read_text(encoding="utf-8"))
-            self._ingest_payload(payload, primary=False)
+            self._ingest_payload(payload, form_buckets, skeleton_buckets, skeletons, primary=False)
+            self.ingest_stats["secondary"] = self._ingest_stat(payload, started)
             self.secondary_source = {
                 "title": payload.get("source"),
                 "url": payload.get("url"),
@@ -76,7 +113,77 @@ class GrammarIndex:
                 self.source = self.secondary_source
                 self.loaded = True
 
-    def _ingest_payload(self, payload: dict, *, primary: bool) -> None:
+        started = time.perf_counter()
+        self.form_to_roots = {form: list(bucket) for form, bucket in form_buckets.items()}
+        self.skeleton_to_roots = {skel: list(bucket) for skel, bucket in skeleton_buckets.items()}
+        self.normalized_form_to_roots = self._build_normalized_forms(self.form_to_roots)
+        self.ingest_stats["indexes"] = {
+            "seconds": time.perf_counter() - started,
+            "forms": len(self.form_to_roots),
+            "skeletons": len(self.skeleton_to_roots),
+            "normalized_forms": len(self.normalized_form_to_roots),
+        }
+
+    @staticmethod
+    def _ingest_stat(payload: dict, started: float) -> dict:
+        return {
+            "seconds": time.perf_counter() - started,
+            "roots": len(payload.get("roots", [])),
+            "forms": len(payload.get("form_to_roots", {})),
+        }
+
+    @classmethod
+    def from_tables(
+        cls,
+        *,
+        roots,
+        secondary_roots,
+        form_to_roots,
+        skeleton_to_roots,
+        normalized_form_to_roots,
+        source: dict | None,
+        secondary_source: dict | None = None,
+    ) -> "GrammarIndex":
+        """Build an index over prebuilt (e.g. memory-mapped) lookup tables."""
+        index = cls.__new__(cls)
+        index.roots = roots
+        index.secondary_roots = secondary_roots
+        index.form_to_roots = form_to_roots
+        index.skeleton_to_roots = skeleton_to_roots
+        index.normalized_form_to_roots = normalized_form_to_roots
+        index._skeleton_buckets = {}
+        index.loaded = source is not None
+        if source is not None:
+            index.source = source
+        if secondary_source is not None:
+            index.secondary_source = secondary_source
+        return index
+
+    @staticmethod
+    def _build_normalized_forms(form_to_roots: dict[str, list[str]]) -> dict[str, list[str]]:
+        """Group form_to_roots by homophone-normalized form, keeping form order."""
+        buckets: dict[str, dict[str, None]] = {}
+        for form, roots in form_to_roots.items():
+            bucket = buckets.setdefault(normalize_geez(form), {})
+            for root in roots:
+                bucket[root] = None
+        return {norm: list(bucket) for norm, bucket in buckets.items()}
+
+    def _ingest_payload(
+        self,
+        payload: dict,
+        form_buckets: dict[str, dict[str, None]],
+        skeleton_buckets: dict[str, dict[str, None]],
+        skeletons: dict[str, str],
+        *,
+        primary: bool,
+    ) -> None:
+        def skeleton_of(text: str) -> str:
+            skel = skeletons.get(text)
+            if skel is None:
+                skel = skeletons[text] = normalize_geez(text, "search")
+            return skel
+
         for entry in payload.get("roots", []):
             root = entry["root"]
             if primary:
@@ -96,20 +203,16 @@ class GrammarIndex:
                     if entry.get("synonyms"):
                         merged["synonyms"] = entry.get("synonyms")
                     self.roots[root] = merged
-            skel = normalize_geez(get_consonant_skeleton(root))
-            self.skeleton_to_roots.setdefault(skel, [])
-            if root not in self.skeleton_to_roots[skel]:
-                self.skeleton_to_roots[skel].append(root)
+            skeleton_buckets.setdefault(skeleton_of(root), {})[root] = None
 
         for form, roots in payload.get("form_to_roots", {}).items():
-            existing = self.form_to_roots.setdefault(form, [])
+            existing = form_buckets.setdefault(form, {})
+            if not roots:
+                continue
+            bucket = skeleton_buckets.setdefault(skeleton_of(form), {})
             for root in roots:
-                if root not in existing:
-                    existing.append(root)
-            skel = normalize_geez(get_consonant_skeleton(form))
-            for root in roots:
-                if root not in self.skeleton_to_roots.get(skel, []):
-                    self.skeleton_to_roots.setdefault(skel, []).append(root)
+                existing[root] = None
+                bucket[root] = None
 
     def get_root(self, root: str) -> dict | None:
         return self.roots.get(root)
@@ -131,38 +234,49 @@ class GrammarIndex:
             return []
         return [PATTERN_CODE_MAP.get(code, {"name": code}) for code in entry.get("patterns", [])]
 
+    def skeleton_bucket(self, norm: str) -> SkeletonBucket | None:
+        """Decision record for a search-normalized skeleton, built on first use."""
+        bucket = self._skeleton_buckets.get(norm, _MISSING)
+        if bucket is _MISSING:
+            roots = tuple(dict.fromkeys(self.skeleton_to_roots.get(norm, ())))
+            if not roots:
+                bucket = None
+            elif len(roots) == 1:
+                bucket = SkeletonBucket(roots, {}, None)
+            else:
+                marked = None
+                for candidate in roots:
+                    if candidate.startswith("ን") or "እሽኰኰ" in (self.primary_gloss(candidate) or ""):
+                        marked = candidate
+                        break
+                bucket = SkeletonBucket(roots, unique_order_candidates(roots), marked)
+            self._skeleton_buckets[norm] = bucket
+        return bucket
+
     def resolve_skeleton(self, skeleton: str, *, source: str | None = None, pattern_name: str | None = None) -> str | None:
-        norm = normalize_geez(get_consonant_skeleton(skeleton))
-        candidates = list(dict.fromkeys(self.skeleton_to_roots.get(norm, [])))
-        if not candidates:
+        bucket = self.skeleton_bucket(normalize_geez(skeleton, "search"))
+        if bucket is None:
             return None
-        if len(candidates) == 1:
-            return candidates[0]
+        roots = bucket.roots
+        if len(roots) == 1:
+            return roots[0]
 
         if source:
             order = get_char_order(source[0])
-            if order:
-                order_hits = [c for c in candidates if get_char_order(c[0]) == order]
-                if len(order_hits) == 1:
-                    return order_hits[0]
-
-        if pattern_name in {"imperfective", "jussive"} and source and get_char_order(source[0]) == 6:
-            for candidate in candidates:
-                gloss = self.primary_gloss(candidate) or ""
-                if "እሽኰኰ" in gloss or candidate.startswith("ን"):
-                    return candidate
+            pick = bucket.by_order.get(order)
+            if pick is not None:
+                return pick
+            if order == 6 and bucket.marked and pattern_name in ("imperfective", "jussive"):
+                return bucket.marked
 
-        return candidates[0]
+        return roots[0]
 
     def lookup_form(self, word: str) -> list[str]:
-        if word in self.form_to_roots:
-            return self.form_to_roots[word]
-        norm = normalize_geez(word)
-        hits = []
-        for form, roots in self.form_to_roots.items():
-            if normalize_geez(form) == norm:
-                hits.extend(roots)
-        return list(dict.fromkeys(hits))
+        """Roots attested for a surface form, exact spelling first, then by homophone."""
+        roots = self.form_to_roots.get(word)
+        if roots is not None:
+            return roots
+        return self.normalized_form_to_roots.get(normalize_geez(word), [])
 
     def reference(self, root: str) -> dict | None:
         entry = self.roots.get(root)
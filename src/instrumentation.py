@@ -0,0 +1,411 @@
+"""
+EthioMorph Instrumentation - Stage Timing and Branch Counters
+=============================================================
+Opt-in wall-clock timing of the named stages GeezStemmer runs for each
+analysis (particle segmentation, hollow restoration, citation resolution,
+canonicalization, affix stripping, pattern identification, the grammar
+reference block), aggregated into fixed-bucket latency histograms.
+
+instrument(stemmer) replaces the stage methods of that one stemmer instance
+with timed wrappers; the class and every other instance are untouched, so a
+stemmer that is not instrumented pays nothing. Stage times are inclusive:
+canonicalize_root also counts inside build_result, and a stage that runs
+more than once in a call (canonicalize_root does) is summed for that call.
+
+    timer = instrument(stemmer)
+    stemmer.extract_root("ይትቀተል")
+    timer.last_call()   # {"analyze": 0.0004, "strip_affixes": 0.00005, ...}
+    timer.snapshot()    # histograms per stage
+
+count_branches(stemmer) works the same way for BranchCounters, which count
+how often each exit of the pipeline (src.stemmer.ANALYSIS_BRANCHES) and each
+canonicalization lookup (CANONICALIZATION_PATHS) fires, with the cumulative
+latency of each. Both export Prometheus text format.
+
+extract_root calls answered by the analysis cache never reach the
+pipeline; both recorders count them under CACHE_HIT (a call stage of its
+own, and a branch), so the totals cover every call.
+
+Esubalew Chekol
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+
+from src.stemmer import ANALYSIS_BRANCHES, CACHE_HIT, CANONICALIZATION_PATHS
+
+# Histogram bucket upper bounds in seconds (1-2-5 steps, 1 µs to 0.5 s);
+# slower observations land in a final overflow bucket.
+DEFAULT_BOUNDS = tuple(
+    float(f"{mantissa}e{exponent}")
+    for exponent in range(-6, 0)
+    for mantissa in (1, 2, 5)
+)
+
+# The whole _analyze call; every other stage is timed inside it.
+CALL_STAGE = "analyze"
+
+# Stage name -> GeezStemmer method timed as that stage.
+STEMMER_STAGES = {
+    "segment_particles": "_segment_particles",
+    "hollow_restore": "_try_hollow_middle_restore",
+    "resolve_citation": "_resolve_skeleton_citation",
+    "canonicalize_root": "_canonicalize_root",
+    "strip_affixes": "strip_affixes",
+    "identify_pattern": "identify_verb_pattern",
+    "grammar_reference": "_grammar_reference",
+    "build_result": "_build_result",
+}
+
+
+class Histogram:
+    """Latency histogram over fixed bucket bounds (seconds)."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (max for the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        """Counts and summary statistics, in milliseconds."""
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1e3,
+            "mean_ms": self.total / self.count * 1e3 if self.count else 0.0,
+            "max_ms": self.max * 1e3,
+            "p50_ms": self.quantile(0.50) * 1e3,
+            "p90_ms": self.quantile(0.90) * 1e3,
+            "p99_ms": self.quantile(0.99) * 1e3,
+            "buckets": [
+                [bound * 1e3, count]
+                for bound, count in zip((*self.bounds, float("inf")), self.counts)
+                if count
+            ],
+        }
+
+
+class StageTimer:
+    """
+    Collects per-call stage times and aggregates them into histograms.
+
+    A call starts when the CALL_STAGE wrapper is entered; stage times
+    recorded while it runs are summed per stage, then observed once each
+    when the call returns. Calls on different threads are kept apart.
+    """
+
+    def __init__(self, bounds=DEFAULT_BOUNDS, on_call=None):
+        """
+        Args:
+            bounds: Histogram bucket upper bounds in seconds.
+            on_call: Optional callback(word, stages) invoked after each call
+                with the {stage: seconds} times of that call.
+        """
+        self.bounds = tuple(bounds)
+        self.on_call = on_call
+        self.calls = 0
+        self.histograms: dict[str, Histogram] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def wrap(self, stage: str, func):
+        """Returns func timed as stage within the current call."""
+        perf_counter = time.perf_counter
+        local = self._local
+
+        def timed(*args, **kwargs):
+            stages = getattr(local, "stages", None)
+            if stages is None:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stages[stage] = stages.get(stage, 0.0) + (perf_counter() - start)
+
+        timed.__wrapped__ = func
+        return timed
+
+    def wrap_call(self, func, stage: str = CALL_STAGE):
+        """Returns func timed as one call: its stage times are observed when it returns."""
+        perf_counter = time.perf_counter
+        local = self._local
+
+        def timed_call(word, *args, **kwargs):
+            outer = getattr(local, "stages", None)
+            if outer is not None:
+                # Re-entered inside a call: time it as an ordinary stage.
+                start = perf_counter()
+                try:
+                    return func(word, *args, **kwargs)
+                finally:
+                    outer[stage] = outer.get(stage, 0.0) + (perf_counter() - start)
+            stages = local.stages = {}
+            start = perf_counter()
+            try:
+                return func(word, *args, **kwargs)
+            finally:
+                stages[stage] = perf_counter() - start
+                local.stages = None
+                local.last = stages
+                self._observe(stages)
+                if self.on_call is not None:
+                    self.on_call(word, stages)
+
+        timed_call.__wrapped__ = func
+        return timed_call
+
+    def wrap_lookup(self, func, stage: str = CACHE_HIT):
+        """Returns the cache lookup func, observing each hit as a call of its own stage."""
+        perf_counter = time.perf_counter
+        local = self._local
+
+        def timed_lookup(word):
+            start = perf_counter()
+            result = func(word)
+            if result is not None:
+                stages = local.last = {stage: perf_counter() - start}
+                self._observe(stages)
+                if self.on_call is not None:
+                    self.on_call(word, stages)
+            return result
+
+        timed_lookup.__wrapped__ = func
+        return timed_lookup
+
+    def _observe(self, stages: dict) -> None:
+        with self._lock:
+            self.calls += 1
+            for stage, seconds in stages.items():
+                histogram = self.histograms.get(stage)
+                if histogram is None:
+                    histogram = self.histograms[stage] = Histogram(self.bounds)
+                histogram.observe(seconds)
+
+    def last_call(self) -> dict:
+        """{stage: seconds} of the most recent call finished on this thread."""
+        return dict(getattr(self._local, "last", None) or {})
+
+    def snapshot(self) -> dict:
+        """Aggregated histograms per stage, in milliseconds."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "stages": {
+                    stage: histogram.snapshot()
+                    for stage, histogram in sorted(self.histograms.items())
+                },
+            }
+
+    def prometheus(self) -> str:
+        """Stage histograms in Prometheus text exposition format."""
+        name = "ethiomorph_analysis_stage_seconds"
+        lines = [
+            f"# HELP {name} Wall time per analysis stage and call.",
+            f"# TYPE {name} histogram",
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip((*histogram.bounds, float("inf")), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.total!r}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drops every observation."""
+        with self._lock:
+            self.calls = 0
+            self.histograms.clear()
+
+
+def instrument(stemmer, timer: StageTimer | None = None) -> StageTimer:
+    """
+    Times the analysis stages of one GeezStemmer instance.
+
+    Args:
+        stemmer: The stemmer to instrument (already instrumented ones keep
+            their timer).
+        timer: Timer to record into; a new StageTimer by default.
+
+    Returns:
+        The StageTimer receiving the stemmer's stage times.
+    """
+    existing = stemmer.__dict__.get("instrumentation")
+    if existing is not None:
+        return existing
+    timer = timer if timer is not None else StageTimer()
+    for stage, method in STEMMER_STAGES.items():
+        setattr(stemmer, method, timer.wrap(stage, getattr(stemmer, method)))
+    stemmer._analyze = timer.wrap_call(stemmer._analyze)
+    stemmer._cached_analysis = timer.wrap_lookup(stemmer._cached_analysis)
+    stemmer.instrumentation = timer
+    return timer
+
+
+def uninstrument(stemmer) -> None:
+    """Restores the stemmer's untimed stage methods."""
+    if stemmer.__dict__.pop("instrumentation", None) is None:
+        return
+    for method in (*STEMMER_STAGES.values(), "_analyze", "_cached_analysis"):
+        stemmer.__dict__.pop(method, None)
+
+
+class BranchCounters:
+    """
+    Hit count and cumulative latency per pipeline exit and canonicalization path.
+
+    Latency of an exit is the whole analysis call (of CACHE_HIT, the cache
+    lookup); latency of a canonicalization path is that _canonicalize_root
+    call.
+    """
+
+    def __init__(self, branches=(*ANALYSIS_BRANCHES, CACHE_HIT), paths=CANONICALIZATION_PATHS):
+        """
+        Args:
+            branches: Exit labels always exported (others appear once hit).
+            paths: Canonicalization labels always exported.
+        """
+        self.branches: dict[str, list] = {label: [0, 0.0] for label in branches}
+        self.paths: dict[str, list] = {label: [0, 0.0] for label in paths}
+        self._lock = threading.Lock()
+
+    def wrap(self, table: dict, func):
+        """Returns func (which returns (label, result)) counting each label into table."""
+        perf_counter = time.perf_counter
+        lock = self._lock
+
+        def counted(*args, **kwargs):
+            start = perf_counter()
+            label, result = func(*args, **kwargs)
+            elapsed = perf_counter() - start
+            with lock:
+                entry = table.get(label)
+                if entry is None:
+                    table[label] = [1, elapsed]
+                else:
+                    entry[0] += 1
+                    entry[1] += elapsed
+            return label, result
+
+        counted.__wrapped__ = func
+        return counted
+
+    def wrap_lookup(self, func, label: str = CACHE_HIT):
+        """Returns the cache lookup func, counting each hit as a label branch."""
+        perf_counter = time.perf_counter
+        lock = self._lock
+        table = self.branches
+
+        def counted_lookup(word):
+            start = perf_counter()
+            result = func(word)
+            if result is not None:
+                elapsed = perf_counter() - start
+                with lock:
+                    entry = table.setdefault(label, [0, 0.0])
+                    entry[0] += 1
+                    entry[1] += elapsed
+            return result
+
+        counted_lookup.__wrapped__ = func
+        return counted_lookup
+
+    def snapshot(self) -> dict:
+        """{"branches": {label: {count, seconds}}, "canonicalization": {...}}."""
+        with self._lock:
+            return {
+                "branches": {
+                    label: {"count": count, "seconds": seconds}
+                    for label, (count, seconds) in self.branches.items()
+                },
+                "canonicalization": {
+                    label: {"count": count, "seconds": seconds}
+                    for label, (count, seconds) in self.paths.items()
+                },
+            }
+
+    def prometheus(self) -> str:
+        """Counters in Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, label, table, help_text in (
+                ("ethiomorph_analysis_branch", "branch", self.branches, "Analyses by pipeline exit"),
+                ("ethiomorph_canonicalization", "via", self.paths, "Root canonicalizations by lookup"),
+            ):
+                lines.append(f"# HELP {name}_total {help_text}.")
+                lines.append(f"# TYPE {name}_total counter")
+                lines.extend(f'{name}_total{{{label}="{key}"}} {count}' for key, (count, _) in table.items())
+                lines.append(f"# HELP {name}_seconds_total Cumulative latency of {help_text[0].lower() + help_text[1:]}.")
+                lines.append(f"# TYPE {name}_seconds_total counter")
+                lines.extend(
+                    f'{name}_seconds_total{{{label}="{key}"}} {seconds!r}'
+                    for key, (_, seconds) in table.items()
+                )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Zeroes every counter."""
+        with self._lock:
+            for table in (self.branches, self.paths):
+                for entry in table.values():
+                    entry[0], entry[1] = 0, 0.0
+
+
+def count_branches(stemmer, counters: BranchCounters | None = None) -> BranchCounters:
+    """
+    Counts the pipeline exits and canonicalization paths of one GeezStemmer.
+
+    Args:
+        stemmer: The stemmer to count (already counted ones keep their counters).
+        counters: Counters to record into; new BranchCounters by default.
+
+    Returns:
+        The BranchCounters receiving the stemmer's counts.
+    """
+    existing = stemmer.__dict__.get("branch_counters")
+    if existing is not None:
+        return existing
+    counters = counters if counters is not None else BranchCounters()
+    stemmer._route = counters.wrap(counters.branches, stemmer._route)
+    stemmer._canonical_citation = counters.wrap(counters.paths, stemmer._canonical_citation)
+    stemmer._cached_analysis = counters.wrap_lookup(stemmer._cached_analysis)
+    stemmer.branch_counters = counters
+    return counters
+
+
+def uncount_branches(stemmer) -> None:
+    """Restores the stemmer's uncounted pipeline."""
+    if stemmer.__dict__.pop("branch_counters", None) is None:
+        return
+    stemmer.__dict__.pop("_route", None)
+    stemmer.__dict__.pop("_canonical_citation", None)
+    stemmer.__dict__.pop("_cached_analysis", None)
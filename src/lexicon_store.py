@@ -0,0 +1,482 @@
+"""
+EthioMorph Lexicon Store - Shared Read-Only Data Registry
+=========================================================
+Loads each data file once per process and builds the derived lookup
+indexes once, so every GeezStemmer and EthioMorphGenerator in a worker
+shares the same read-only structures.
+
+Components are built lazily: a worker that only generates never parses
+the grammar indices, and a worker that only analyzes never parses the
+templates.
+
+Esubalew Chekol
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from functools import cached_property
+from pathlib import Path
+from typing import NamedTuple
+
+from src.normalizer import normalize_geez
+from src.grammar_loader import GrammarIndex, unique_order_candidates
+from src.paradigm_index import ParadigmIndex
+from src.data_artifact import (
+    ArtifactFormatError, ArtifactWriter, MappedArtifact,
+    KIND_JSON, KIND_LIST, KIND_STR,
+)
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+ARTIFACT_PATH = DATA_DIR / "ethiomorph.bin"
+
+# Files whose contents define the data version used for cache invalidation.
+DATA_FILES = (
+    "lexicon.json",
+    "templates.json",
+    "stems.json",
+    "grammar_index.json",
+    "grammar_zewadla_index.json",
+)
+
+# Modules that derive the stored skeleton/normalized and paradigm indexes;
+# they are part of the data version so a change in decomposition or
+# generation invalidates artifacts.
+INDEX_SOURCES = tuple(
+    Path(__file__).resolve().parent / name
+    for name in ("decomposer.py", "normalizer.py", "conjugator.py", "paradigm_index.py")
+)
+
+
+class LexiconStore:
+    """
+    Process-wide lexicon, grammar and template data.
+
+    Every attribute is shared by the engines built on top of the store and
+    must be treated as read-only.
+    """
+
+    def __init__(self, data_dir: str | Path | None = None, paradigms: bool = True):
+        """
+        Args:
+            data_dir: Directory holding the JSON data files.
+            paradigms: Generate the paradigm index on first use (seconds of
+                work; compile_artifact needs it). When False the index is
+                empty and the stemmer skips the paradigm lookup.
+        """
+        self.data_dir = Path(data_dir) if data_dir is not None else DATA_DIR
+        self.paradigms = paradigms
+        self._lock = threading.RLock()
+
+    def _read_json(self, name: str) -> dict | None:
+        path = self.data_dir / name
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def source_paths(self) -> dict[str, Path]:
+        """Files the data version is computed from, by name."""
+        paths = {name: self.data_dir / name for name in DATA_FILES}
+        paths.update((f"src/{path.name}", path) for path in INDEX_SOURCES)
+        return paths
+
+    @cached_property
+    def version(self) -> str:
+        """Content hash of the data files and index code; changes whenever any of them does."""
+        digest = hashlib.sha1()
+        for name, path in self.source_paths().items():
+            digest.update(name.encode("utf-8"))
+            if path.exists():
+                digest.update(path.read_bytes())
+        return digest.hexdigest()[:16]
+
+    # ------------------------------------------------------------------
+    # Lexicon (data/lexicon.json)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def _lexicon_payload(self) -> dict:
+        with self._lock:
+            payload = self._read_json("lexicon.json")
+            if payload is None:
+                print("Warning: lexicon.json not found. Using empty lexicon.")
+                payload = {}
+            return payload
+
+    @cached_property
+    def lexicon_roots(self) -> dict[str, dict]:
+        """Root -> full lexicon entry."""
+        return {entry["root"]: entry for entry in self._lexicon_payload.get("roots", [])}
+
+    @cached_property
+    def nouns(self) -> dict[str, dict]:
+        """Protected noun word -> lexicon entry."""
+        return {entry["word"]: entry for entry in self._lexicon_payload.get("nouns", [])}
+
+    def _roots_of_type(self, root_type: str) -> frozenset[str]:
+        return frozenset(
+            entry["root"] for entry in self._lexicon_payload.get("roots", [])
+            if entry.get("type", "") == root_type
+        )
+
+    @cached_property
+    def weak_initial_roots(self) -> frozenset[str]:
+        return self._roots_of_type("weak_initial")
+
+    @cached_property
+    def hollow_w_roots(self) -> frozenset[str]:
+        return self._roots_of_type("hollow_w")
+
+    @cached_property
+    def hollow_y_roots(self) -> frozenset[str]:
+        return self._roots_of_type("hollow_y")
+
+    @cached_property
+    def quadriliterals(self) -> frozenset[str]:
+        return self._roots_of_type("quadriliteral")
+
+    @cached_property
+    def hollow_w_lookup(self) -> dict[str, str]:
+        """Normalized hollow-W root -> lexicon citation form."""
+        return {normalize_geez(root): root for root in self.hollow_w_roots}
+
+    @cached_property
+    def hollow_y_lookup(self) -> dict[str, str]:
+        """Normalized hollow-Y root -> lexicon citation form."""
+        return {normalize_geez(root): root for root in self.hollow_y_roots}
+
+    @cached_property
+    def lexicon_normalized_lookup(self) -> dict[str, str]:
+        """Normalized root -> first lexicon root with that normalization."""
+        lookup = {}
+        for lex_root in self.lexicon_roots:
+            lookup.setdefault(normalize_geez(lex_root), lex_root)
+        return lookup
+
+    @cached_property
+    def lexicon_types(self) -> dict[str, str]:
+        """Root -> verb type, as used by the generator (defaults to type_a)."""
+        return {
+            entry["root"]: entry.get("type", "type_a")
+            for entry in self._lexicon_payload.get("roots", [])
+        }
+
+    # ------------------------------------------------------------------
+    # Grammar indices (ግስ ከሀ-ፐ + መጽሐፈ ግስ ዘዋድላ)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def grammar(self) -> GrammarIndex:
+        with self._lock:
+            return GrammarIndex(
+                self.data_dir / "grammar_index.json",
+                secondary_path=self.data_dir / "grammar_zewadla_index.json",
+            )
+
+    @cached_property
+    def skeleton_lookup(self) -> dict[str, list[str]]:
+        """Normalized consonant skeleton -> lexicon roots, then grammar roots."""
+        lookup: dict[str, list[str]] = {}
+        for lex_root in self.lexicon_roots:
+            skel = normalize_geez(lex_root, "search")
+            lookup.setdefault(skel, []).append(lex_root)
+        if self.grammar.loaded:
+            for entry in self.grammar.roots.values():
+                root = entry["root"]
+                skel = normalize_geez(root, "search")
+                bucket = lookup.setdefault(skel, [])
+                if root not in bucket:
+                    bucket.append(root)
+        return lookup
+
+    @cached_property
+    def skeleton_candidates(self) -> dict[str, SkeletonCandidates]:
+        """Decision records for the skeleton_lookup buckets holding several roots."""
+        types = self.lexicon_types
+        hollow_roots = self.hollow_w_roots | self.hollow_y_roots
+        decisions = {}
+        for skel, roots in self.skeleton_lookup.items():
+            if len(roots) < 2:
+                continue
+            root_types = [types.get(root) for root in roots]
+            decisions[skel] = SkeletonCandidates(
+                roots=roots,
+                members=frozenset(roots),
+                by_order=unique_order_candidates(roots),
+                type_a=next((r for r, t in zip(roots, root_types) if t == "type_a"), None),
+                hollow=next((r for r in roots if r in hollow_roots), None),
+                typed=next(
+                    (r for r, t in zip(roots, root_types)
+                     if t and t not in ("type_a", "strong", "unknown")),
+                    None,
+                ),
+            )
+        return decisions
+
+    # ------------------------------------------------------------------
+    # Generator data (templates.json, stems.json)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def templates(self) -> dict:
+        with self._lock:
+            templates = self._read_json("templates.json")
+            if templates is None:
+                print("Warning: Data files (templates, stems, or lexicon) not found.")
+                templates = {}
+            return templates
+
+    @cached_property
+    def stems(self) -> dict:
+        payload = self._read_json("stems.json") or {}
+        return payload.get("stems", {})
+
+    # ------------------------------------------------------------------
+    # Paradigm index (every generated form of the lexicon roots)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def paradigm_index(self) -> ParadigmIndex:
+        """Surface form -> generating paradigm cells; generated here on first use."""
+        if not self.paradigms:
+            return ParadigmIndex({}, {})
+        from src.conjugator import EthioMorphGenerator
+
+        with self._lock:
+            return ParadigmIndex.build(EthioMorphGenerator(store=self))
+
+
+class SkeletonCandidates(NamedTuple):
+    """
+    Precomputed citation decisions for a skeleton with several candidate roots.
+
+    Each field is the pick of one GeezStemmer._resolve_skeleton_citation rule,
+    so resolving a skeleton is a few dict probes instead of a scan over the
+    bucket per rule.
+    """
+    roots: list[str]
+    members: frozenset[str]
+    by_order: dict[int, str]
+    type_a: str | None
+    hollow: str | None
+    typed: str | None
+
+
+ROOT_TYPE_SETS = ("weak_initial_roots", "hollow_w_roots", "hollow_y_roots", "quadriliterals")
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def source_fingerprint(path: Path) -> dict | None:
+    """Size, mtime and content hash of a source file (None when it is absent)."""
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": _file_digest(path)}
+
+
+def compile_artifact(store: LexiconStore) -> bytes:
+    """
+    Compiles a JSON-backed store into data artifact bytes.
+
+    Args:
+        store: The store to serialize; every lazy component is built.
+
+    Returns:
+        The artifact, stamped with the store's data version.
+    """
+    grammar = store.grammar
+    writer = ArtifactWriter({
+        "version": store.version,
+        "sources": {name: source_fingerprint(path) for name, path in store.source_paths().items()},
+        "grammar": {
+            "source": getattr(grammar, "source", None) if grammar.loaded else None,
+            "secondary_source": getattr(grammar, "secondary_source", None),
+        },
+        "stems": store.stems,
+    })
+    writer.add_table("lexicon_roots", KIND_JSON, store.lexicon_roots)
+    writer.add_table("nouns", KIND_JSON, store.nouns)
+    writer.add_table("lexicon_types", KIND_STR, store.lexicon_types)
+    writer.add_table("root_type_sets", KIND_LIST, {
+        name: sorted(getattr(store, name)) for name in ROOT_TYPE_SETS
+    })
+    # Built from frozensets; sort so rebuilds are byte-for-byte reproducible.
+    writer.add_table("hollow_w_lookup", KIND_STR, dict(sorted(store.hollow_w_lookup.items())))
+    writer.add_table("hollow_y_lookup", KIND_STR, dict(sorted(store.hollow_y_lookup.items())))
+    writer.add_table("lexicon_normalized", KIND_STR, store.lexicon_normalized_lookup)
+    writer.add_table("skeleton_lookup", KIND_LIST, store.skeleton_lookup)
+    writer.add_table("grammar_roots", KIND_JSON, grammar.roots)
+    writer.add_table("grammar_secondary", KIND_JSON, grammar.secondary_roots)
+    writer.add_table("grammar_forms", KIND_LIST, grammar.form_to_roots)
+    writer.add_table("grammar_skeletons", KIND_LIST, grammar.skeleton_to_roots)
+    writer.add_table("grammar_normalized_forms", KIND_LIST, grammar.normalized_form_to_roots)
+    writer.add_table("templates", KIND_JSON, store.templates)
+    paradigms = store.paradigm_index
+    writer.add_index("paradigm_forms", paradigms.forms)
+    writer.add_index("paradigm_normalized", paradigms.normalized)
+    return writer.to_bytes()
+
+
+class ArtifactLexiconStore(LexiconStore):
+    """
+    LexiconStore served from a compiled, memory-mapped data artifact.
+
+    Opening the store maps the file and reads its header; tables and their
+    entries are decoded only when first used.
+    """
+
+    def __init__(self, artifact_path: str | Path = ARTIFACT_PATH, data_dir: str | Path | None = None):
+        super().__init__(data_dir)
+        self.artifact = MappedArtifact(artifact_path)
+
+    def is_stale(self) -> bool:
+        """
+        True when a source file differs from the one compiled.
+
+        Files whose size and mtime are unchanged are taken as unchanged;
+        otherwise their content hash decides, so a same-size edit is caught
+        and a fresh checkout of identical sources is not.
+        """
+        compiled = self.artifact.meta.get("sources", {})
+        for name, path in self.source_paths().items():
+            recorded = compiled.get(name)
+            if recorded is None or not path.exists():
+                if recorded is not None or path.exists():
+                    return True
+                continue
+            stat = path.stat()
+            if stat.st_size != recorded["size"]:
+                return True
+            if stat.st_mtime_ns != recorded["mtime_ns"] and _file_digest(path) != recorded["sha1"]:
+                return True
+        return False
+
+    @cached_property
+    def version(self) -> str:
+        return self.artifact.meta["version"]
+
+    @cached_property
+    def lexicon_roots(self):
+        return self.artifact.table("lexicon_roots")
+
+    @cached_property
+    def nouns(self):
+        return self.artifact.table("nouns")
+
+    def _roots_of_type_set(self, name: str) -> frozenset[str]:
+        return frozenset(self.artifact.table("root_type_sets")[name])
+
+    @cached_property
+    def weak_initial_roots(self) -> frozenset[str]:
+        return self._roots_of_type_set("weak_initial_roots")
+
+    @cached_property
+    def hollow_w_roots(self) -> frozenset[str]:
+        return self._roots_of_type_set("hollow_w_roots")
+
+    @cached_property
+    def hollow_y_roots(self) -> frozenset[str]:
+        return self._roots_of_type_set("hollow_y_roots")
+
+    @cached_property
+    def quadriliterals(self) -> frozenset[str]:
+        return self._roots_of_type_set("quadriliterals")
+
+    @cached_property
+    def hollow_w_lookup(self):
+        return self.artifact.table("hollow_w_lookup")
+
+    @cached_property
+    def hollow_y_lookup(self):
+        return self.artifact.table("hollow_y_lookup")
+
+    @cached_property
+    def lexicon_normalized_lookup(self):
+        return self.artifact.table("lexicon_normalized")
+
+    @cached_property
+    def lexicon_types(self):
+        return self.artifact.table("lexicon_types")
+
+    @cached_property
+    def grammar(self) -> GrammarIndex:
+        meta = self.artifact.meta["grammar"]
+        return GrammarIndex.from_tables(
+            roots=self.artifact.table("grammar_roots"),
+            secondary_roots=self.artifact.table("grammar_secondary"),
+            form_to_roots=self.artifact.table("grammar_forms"),
+            skeleton_to_roots=self.artifact.table("grammar_skeletons"),
+            normalized_form_to_roots=self.artifact.table("grammar_normalized_forms"),
+            source=meta["source"],
+            secondary_source=meta["secondary_source"],
+        )
+
+    @cached_property
+    def skeleton_lookup(self):
+        return self.artifact.table("skeleton_lookup")
+
+    @cached_property
+    def templates(self):
+        return self.artifact.table("templates")
+
+    @cached_property
+    def stems(self) -> dict:
+        return self.artifact.meta["stems"]
+
+    @cached_property
+    def paradigm_index(self) -> ParadigmIndex:
+        return ParadigmIndex(
+            self.artifact.table("paradigm_forms"),
+            self.artifact.table("paradigm_normalized"),
+        )
+
+
+def open_store(data_dir: str | Path | None = None) -> LexiconStore:
+    """
+    Opens the best available store for data_dir.
+
+    Uses the compiled artifact (ethiomorph.bin) when present and in step with
+    the JSON sources, unless ETHIOMORPH_DATA=json; otherwise parses the JSON.
+    The paradigm index is only served from the artifact: generating it from
+    the JSON takes about a second, which would land on the first request, so
+    a JSON store has none unless ETHIOMORPH_PARADIGMS=build.
+    """
+    data_dir = Path(data_dir) if data_dir is not None else DATA_DIR
+    artifact_path = data_dir / ARTIFACT_PATH.name
+    if os.environ.get("ETHIOMORPH_DATA", "").lower() != "json" and artifact_path.exists():
+        try:
+            store = ArtifactLexiconStore(artifact_path, data_dir)
+            if not store.is_stale():
+                return store
+            print(f"Warning: {artifact_path.name} is older than the JSON data. Using JSON.")
+        except ArtifactFormatError as exc:
+            print(f"Warning: {exc}. Using JSON data.")
+    build_paradigms = os.environ.get("ETHIOMORPH_PARADIGMS", "").lower() == "build"
+    return LexiconStore(data_dir, paradigms=build_paradigms)
+
+
+_STORE = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_store() -> LexiconStore:
+    """Returns the process-wide LexiconStore, creating it on first use."""
+    global _STORE
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                _STORE = open_store()
+    return _STORE
+
+
+def reset_store() -> None:
+    """Drops the process-wide store; the next get_store() reloads the data."""
+    global _STORE
+    with _STORE_LOCK:
+        _STORE = None
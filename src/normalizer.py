@@ -3,9 +3,20 @@ EthioMorph Normalizer - Homophone Standardization
 =================================================
 Utilities for normalizing Ge'ez text by mapping homophones to their canonical forms.
 
+Normalization is compiled into str.translate tables, one per profile:
+
+    homophone  merge homophone rows (ሐ/ኀ → ሀ, ሠ → ሰ, ፀ → ጸ, ዓ → አ); the default
+    strict     as homophone, but keep ሠ and ሰ apart
+    search     homophone merge of the consonant skeleton (devowelized), the
+               key used by the skeleton indexes
+
 Esubalew Chekol
 """
 
+from collections.abc import Iterable
+
+from src.decomposer import DEVOWELIZATION_MAP
+
 NORMALIZATION_MAP = {
     'ሐ': 'ሀ', 'ሑ': 'ሁ', 'ሒ': 'ሂ', 'ሓ': 'ሃ', 'ሔ': 'ሄ', 'ሕ': 'ህ', 'ሖ': 'ሆ',
     'ኀ': 'ሀ', 'ኁ': 'ሁ', 'ኂ': 'ሂ', 'ኃ': 'ሃ', 'ኄ': 'ሄ', 'ኅ': 'ህ', 'ኆ': 'ሆ',
@@ -15,15 +26,85 @@ NORMALIZATION_MAP = {
     'ኳ': 'ኰ',
 }
 
+# The ሠ row, which the strict profile leaves unmerged.
+SAWT_ROW = frozenset('ሠሡሢሣሤሥሦ')
+
+DEFAULT_PROFILE = "homophone"
+
+
+def _compile(mapping: dict) -> list[int]:
+    """
+    Compiles a char -> char map into a str.translate table.
 
-def normalize_geez(text: str) -> str:
+    The str.maketrans dict is flattened into a list indexed by codepoint
+    (identity where unmapped, up to the highest mapped codepoint): CPython
+    translates non-Latin text several times faster through a sequence table
+    than through a dict. Codepoints past the end are left unchanged.
+    """
+    # Multi-character keys in the source map (e.g. ' ዓ') never match a single
+    # character, so they are dropped.
+    table = str.maketrans({char: target for char, target in mapping.items() if len(char) == 1})
+    flat = list(range(max(table, default=-1) + 1))
+    for code, target in table.items():
+        flat[code] = ord(target)
+    return flat
+
+
+def _search_map() -> dict:
+    chars = set(NORMALIZATION_MAP) | set(DEVOWELIZATION_MAP)
+    mapping = {}
+    for char in chars:
+        if len(char) == 1:
+            base = DEVOWELIZATION_MAP.get(char, char)
+            mapping[char] = NORMALIZATION_MAP.get(base, base)
+    return mapping
+
+
+NORMALIZATION_PROFILES = {
+    "homophone": _compile(NORMALIZATION_MAP),
+    "strict": _compile({k: v for k, v in NORMALIZATION_MAP.items() if k not in SAWT_ROW}),
+    "search": _compile(_search_map()),
+}
+
+_HOMOPHONE_TABLE = NORMALIZATION_PROFILES[DEFAULT_PROFILE]
+
+
+def _profile_table(profile: str) -> list[int]:
+    try:
+        return NORMALIZATION_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown normalization profile '{profile}'. "
+            f"Available: {', '.join(NORMALIZATION_PROFILES)}"
+        ) from None
+
+
+def normalize_geez(text: str, profile: str = DEFAULT_PROFILE) -> str:
     """
     Normalizes Ge'ez text by mapping homophones to their canonical forms.
-    
+
     Args:
         text: The input Ge'ez text.
-        
+        profile: "homophone" (default), "strict" or "search".
+
     Returns:
         The normalized text.
     """
-    return "".join([NORMALIZATION_MAP.get(char, char) for char in text])
+    if profile == DEFAULT_PROFILE:
+        return text.translate(_HOMOPHONE_TABLE)
+    return text.translate(_profile_table(profile))
+
+
+def normalize_many(texts: Iterable[str], profile: str = DEFAULT_PROFILE) -> list[str]:
+    """
+    Normalizes every text in a list or iterator with one profile.
+
+    Args:
+        texts: Any iterable of strings; iterators are consumed.
+        profile: "homophone" (default), "strict" or "search".
+
+    Returns:
+        The normalized texts, in input order.
+    """
+    table = _profile_table(profile)
+    return [text.translate(table) for text in texts]
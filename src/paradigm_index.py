@@ -0,0 +1,201 @@
+"""
+EthioMorph Paradigm Index - Analysis by Generation
+==================================================
+Reverse index from every surface form EthioMorphGenerator produces for the
+lexicon roots (all tenses and subjects, the derived stems each root's type
+has templates for, and the generate_derived nominals) to the paradigm cells
+that produce it.
+
+A cell is (root, verb_type, tense, subject); derived nominals use the tense
+"derived" and the nominal class as subject. Cells are stored flattened as
+root, "verb_type/tense/subject" string pairs: the slot strings repeat across
+roots, so the data artifact stores each of them once.
+
+Forms under MIN_FORM_LENGTH letters are not indexed: collapsed hollow and
+imperative forms that short are homographs of other roots' forms, and the
+stemmer's hollow-restoration and lexicon rules decide them. Roots that
+already start with a stem prefix (ተ, አ) get no further derived stems,
+because the generator stacks the prefixes into forms of other roots
+(ተጋወረ -> አገረ).
+
+The index is built offline into data/ethiomorph.bin (see
+scripts/build_data_artifact.py); a JSON-backed store only builds it when
+asked to (LexiconStore(paradigms=True)).
+
+Esubalew Chekol
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+from src.normalizer import normalize_geez
+
+TENSES = ("perfective", "imperfective", "jussive", "imperative")
+DERIVED_STEM_SUFFIXES = ("passive", "causative", "aste", "reciprocal")
+SLOT_SEPARATOR = "/"
+MIN_FORM_LENGTH = 3
+# Leading letters of stem prefixes (ተ-, አ-, አስተ-).
+STEM_PREFIX_LETTERS = ("ተ", "አ")
+
+# Stem template suffix -> (stem number, pattern name prefix, Ge'ez name, English name)
+STEM_PATTERNS = {
+    "": (1, "", None, None),
+    "passive": (2, "passive_", "ተገብሮ", "Passive"),
+    "causative": (3, "causative_", "አሳሳቢ", "Causative"),
+    "aste": (4, "causative_passive_", "አስተሳሳቢ", "Causative-Passive"),
+    "reciprocal": (5, "reciprocal_", "ተሣሣቢ", "Reciprocal"),
+}
+
+# Tense -> (Ge'ez order name, Stem I Ge'ez name, English name)
+TENSE_PATTERNS = {
+    "perfective": ("ቀዳማይ", "ቀዳማይ አንቀጽ", "Perfective"),
+    "imperfective": ("ካልኣይ", "ካልኣይ አንቀጽ", "Imperfective"),
+    "jussive": ("ሣልሳይ", "ሣልሳይ አንቀጽ", "Jussive"),
+    "imperative": ("ትእዛዝ", "ትእዛዝ", "Imperative"),
+}
+
+
+def _stem_suffix(verb_type: str) -> str:
+    for suffix in DERIVED_STEM_SUFFIXES:
+        if verb_type.endswith("_" + suffix):
+            return suffix
+    return ""
+
+
+@lru_cache(maxsize=None)
+def cell_pattern(verb_type: str, tense: str, subject: str) -> Mapping:
+    """
+    Pattern record for a paradigm cell, named like GeezStemmer.identify_verb_pattern.
+
+    Records are built once per cell slot and shared (read-only), like the
+    stemmer's VERB_PATTERNS.
+
+    Args:
+        verb_type: Template verb type (e.g. "type_a_passive").
+        tense: One of TENSES, or "derived".
+        subject: Subject key, or the nominal class for derived forms.
+    """
+    stem_number, prefix, stem_geez, stem_english = STEM_PATTERNS[_stem_suffix(verb_type)]
+    if tense == "derived":
+        english = subject.replace("_", " ").title()
+        return MappingProxyType({
+            "name": subject,
+            "geez_name": "ስም ዘግስ",
+            "english_name": english,
+            "stem_number": stem_number,
+            "description": f"Derived nominal ({english}) of {verb_type}",
+        })
+    order_geez, basic_geez, tense_english = TENSE_PATTERNS[tense]
+    return MappingProxyType({
+        "name": prefix + tense,
+        "geez_name": f"{stem_geez} {order_geez}" if stem_geez else basic_geez,
+        "english_name": f"{stem_english} {tense_english}" if stem_english else tense_english,
+        "stem_number": stem_number,
+        "subject": subject,
+        "description": f"Paradigm cell: {tense} {subject} of {verb_type}",
+    })
+
+
+class ParadigmIndex:
+    """Surface form -> paradigm cells, exact spelling first, then by homophone."""
+
+    def __init__(self, forms: dict[str, list[str]], normalized: dict[str, list[str]]):
+        """
+        Args:
+            forms: Surface form -> flattened [root, slot, root, slot, ...] cells.
+            normalized: Homophone-normalized form -> stored surface forms whose
+                normalization differs from their spelling.
+        """
+        self.forms = forms
+        self.normalized = normalized
+
+    @classmethod
+    def build(cls, generator, roots=None) -> "ParadigmIndex":
+        """
+        Generates every paradigm of roots (default: the generator's lexicon).
+
+        Args:
+            generator: An EthioMorphGenerator; only its surface forms
+                (expand_root_words) are used.
+            roots: Roots to expand, in order.
+        """
+        buckets: dict[str, dict[tuple[str, ...], None]] = {}
+        templates = generator.templates
+        for root in (generator.lexicon_full if roots is None else roots):
+            base = generator.expand_root_words(root)
+            if "error" in base:
+                continue
+            matrices = [base]
+            if not base["_meta"]["stem_prefix"] and not root.startswith(STEM_PREFIX_LETTERS):
+                base_type = base["_meta"]["verb_type"]
+                for suffix in DERIVED_STEM_SUFFIXES:
+                    if f"{base_type}_{suffix}" in templates:
+                        matrices.append(generator.expand_root_words(root, f"{base_type}_{suffix}"))
+            for matrix in matrices:
+                if "error" in matrix:
+                    continue
+                verb_type = matrix["_meta"]["verb_type"]
+                variants = matrix["variants"]
+                for tense in TENSES:
+                    tense_variants = variants.get(tense, {})
+                    for subject, word in matrix.get(tense, {}).items():
+                        key = (root, verb_type, tense, subject)
+                        buckets.setdefault(word, {})[key] = None
+                        for variant in tense_variants.get(subject, ()):
+                            buckets.setdefault(variant, {})[key] = None
+                for derived_class, word in matrix["derived"].items():
+                    buckets.setdefault(word, {})[(root, verb_type, "derived", derived_class)] = None
+
+        forms = {
+            form: [
+                part
+                for root, verb_type, tense, subject in bucket
+                for part in (root, SLOT_SEPARATOR.join((verb_type, tense, subject)))
+            ]
+            for form, bucket in buckets.items() if len(form) >= MIN_FORM_LENGTH
+        }
+        return cls(forms, cls._build_normalized(forms))
+
+    @staticmethod
+    def _build_normalized(forms: dict[str, list[str]]) -> dict[str, list[str]]:
+        normalized: dict[str, list[str]] = {}
+        for form in forms:
+            norm = normalize_geez(form)
+            if norm != form:
+                normalized.setdefault(norm, []).append(form)
+        return normalized
+
+    def lookup(self, word: str) -> list[tuple[str, ...]]:
+        """All cells generating word: its exact spelling if attested, else any homophone."""
+        flat = self.forms.get(word)
+        if flat is None:
+            norm = normalize_geez(word)
+            # When word is already normalized its exact probe above was this one.
+            flat = list(self.forms.get(norm, ())) if norm != word else []
+            for form in self.normalized.get(norm, ()):
+                if form != word:
+                    flat.extend(self.forms[form])
+        return [
+            (flat[i], *flat[i + 1].split(SLOT_SEPARATOR))
+            for i in range(0, len(flat), 2)
+        ]
+
+    def analyze(self, word: str) -> list[tuple[str, ...]] | None:
+        """Cells for word when they all belong to one root; None when absent or ambiguous."""
+        cells = self.lookup(word)
+        if not cells:
+            return None
+        root = cells[0][0]
+        for cell in cells:
+            if cell[0] != root:
+                return None
+        return cells
+
+    def __len__(self) -> int:
+        return len(self.forms)
+
+    def __contains__(self, word) -> bool:
+        return word in self.forms
@@ -11,11 +11,16 @@ weak radicals.
 Esubalew Chekol
 """
 
-import json
-import os
+import marshal
+from functools import cached_property
+from types import MappingProxyType
+from typing import NamedTuple
+
 from src.normalizer import normalize_geez
 from src.decomposer import get_consonant_skeleton, get_char_order, devowelize, detect_verb_home
-from src.grammar_loader import GrammarIndex
+from src.cache import LRUCache
+from src.lexicon_store import get_store
+from src.paradigm_index import cell_pattern
 
 
 PARTICLE_LEXICON = {
@@ -71,6 +76,166 @@ PARTICLE_LEXICON = {
 }
 
 
+class LeanAnalysis(NamedTuple):
+    """Compact result of GeezStemmer.analyze_fast (no derivation path or notation)."""
+    input: str
+    root: str
+    root_type: str
+    pattern: str | None
+    confidence: float
+
+
+_METHOD_CONFIDENCE = {"paradigm": 0.95, "lexicon": 0.95, "derived": 0.85}
+
+# Stem number -> causative prefix, for paradigm index hits (no stripped prefixes).
+PARADIGM_CAUSATIVE_PREFIXES = {3: 'አ', 4: 'አስተ'}
+
+
+def _build_affix_trie(affixes, reverse=False):
+    """
+    Compile affixes into a character trie (reversed for suffixes).
+
+    A node is a dict of next character -> child node; a node that ends an
+    affix also maps None -> (priority, affix), priority being the affix's
+    first position in the list so matches can be tried in list order.
+    """
+    root = {}
+    for priority, affix in enumerate(affixes):
+        node = root
+        for char in (reversed(affix) if reverse else affix):
+            node = node.setdefault(char, {})
+        node.setdefault(None, (priority, affix))
+    return root
+
+
+def _affix_matches(trie, word, start, end, reverse=False):
+    """All affixes at word[start:end]'s start (or end, if reverse), in list order."""
+    matches = []
+    node = trie
+    positions = range(end - 1, start - 1, -1) if reverse else range(start, end)
+    for i in positions:
+        node = node.get(word[i])
+        if node is None:
+            break
+        terminal = node.get(None)
+        if terminal is not None:
+            matches.append(terminal)
+    if len(matches) > 1:
+        matches.sort()
+    return [affix for _, affix in matches]
+
+
+def _verb_pattern(name, geez_name, english_name, stem_number, description):
+    return MappingProxyType({
+        "name": name,
+        "geez_name": geez_name,
+        "english_name": english_name,
+        "stem_number": stem_number,
+        "description": description,
+    })
+
+
+# Pattern records returned by GeezStemmer.identify_verb_pattern, built once
+# and shared read-only (keyed by name, except the አስ-verb perfective variant).
+VERB_PATTERNS = {
+    "causative_passive_imperfective": _verb_pattern(
+        "causative_passive_imperfective", "አስተሳሳቢ ካልኣይ", "Causative-Passive Imperfective", 4,
+        "Stem IV: Causative-passive ongoing action"),
+    "causative_passive_jussive": _verb_pattern(
+        "causative_passive_jussive", "አስተሳሳቢ ሣልሳይ", "Causative-Passive Jussive", 4,
+        "Stem IV: Causative-passive wish/command"),
+    "causative_passive_perfective": _verb_pattern(
+        "causative_passive_perfective", "አስተሳሳቢ ቀዳማይ", "Causative-Passive Perfective", 4,
+        "Stem IV: Causative-passive completed action"),
+    "causative_imperfective": _verb_pattern(
+        "causative_imperfective", "አሳሳቢ ካልኣይ", "Causative Imperfective", 3,
+        "Stem III: Causing action (ongoing)"),
+    "causative_jussive": _verb_pattern(
+        "causative_jussive", "አሳሳቢ ሣልሳይ", "Causative Jussive", 3,
+        "Stem III: Causing action (wish/command)"),
+    "causative_perfective": _verb_pattern(
+        "causative_perfective", "አሳሳቢ ቀዳማይ", "Causative Perfective", 3,
+        "Stem III: Causing action (completed)"),
+    "causative_perfective_as": _verb_pattern(
+        "causative_perfective", "አሳሳቢ ቀዳማይ", "Causative Perfective (አስ-verb)", 3,
+        "Stem III: Causing action (completed)"),
+    "passive_imperfective": _verb_pattern(
+        "passive_imperfective", "ተገብሮ ካልኣይ", "Passive Imperfective", 2,
+        "Stem II: Passive/reflexive ongoing action"),
+    "passive_perfective": _verb_pattern(
+        "passive_perfective", "ተገብሮ ቀዳማይ", "Passive Perfective", 2,
+        "Stem II: Passive/reflexive completed action"),
+    "imperfective": _verb_pattern(
+        "imperfective", "ካልኣይ አንቀጽ", "Imperfective", 1,
+        "Stem I: Basic ongoing/habitual action"),
+    "imperative": _verb_pattern(
+        "imperative", "ትእዛዝ", "Imperative", 1,
+        "Stem I: Direct command"),
+    "perfective": _verb_pattern(
+        "perfective", "ቀዳማይ አንቀጽ", "Perfective", 1,
+        "Stem I: Basic completed action"),
+    "unknown": _verb_pattern(
+        "unknown", "ያልታወቀ", "Unknown/Noun", 0,
+        "Pattern could not be determined"),
+}
+
+# Prefix rules in priority order: (prefixes, pattern, only as the sole prefix).
+# Stem IV is checked first (longest prefixes), then III, II and I.
+PREFIX_PATTERN_RULES = (
+    (('ያስተ', 'ታስተ', 'ናስተ'), "causative_passive_imperfective", False),
+    (('ላስተ',), "causative_passive_jussive", False),
+    (('አስተ', 'መስተ'), "causative_passive_perfective", False),
+    (('ያ', 'ታ', 'ና', 'ያስ', 'ታስ', 'ናስ'), "causative_imperfective", False),
+    (('ላስ',), "causative_jussive", False),
+    (('አ',), "causative_perfective", True),
+    (('አስ',), "causative_perfective_as", True),
+    (('ይት', 'ትת', 'እת', 'ንת'), "passive_imperfective", False),
+    (('ተ',), "passive_perfective", False),
+    (('ይ', 'ት', 'እ', 'ን'), "imperfective", False),
+)
+
+# Prefix -> bit of each rule it triggers, the bit value rising with the rule
+# index, so for a prefix list the lowest set bit of the OR-ed flags selects
+# the pattern in PATTERN_BY_FLAG. Sole-prefix rules have their own table.
+PREFIX_PATTERN_FLAGS = {}
+PATTERN_BY_FLAG = {}
+SINGLE_PREFIX_PATTERNS = {}
+for _bit, (_prefixes, _pattern, _sole) in enumerate(PREFIX_PATTERN_RULES):
+    for _prefix in _prefixes:
+        SINGLE_PREFIX_PATTERNS.setdefault(_prefix, VERB_PATTERNS[_pattern])
+        if not _sole:
+            PREFIX_PATTERN_FLAGS[_prefix] = PREFIX_PATTERN_FLAGS.get(_prefix, 0) | 1 << _bit
+    PATTERN_BY_FLAG[1 << _bit] = VERB_PATTERNS[_pattern]
+del _bit, _prefixes, _pattern, _sole, _prefix
+
+# Default size of each stemmer's root canonicalization memo (0 disables it).
+CANONICAL_CACHE_ENTRIES = 8192
+
+# Exits of GeezStemmer._route, i.e. how an analysis was resolved.
+ANALYSIS_BRANCHES = (
+    "particle_phrase",
+    "paradigm",
+    "one_char",
+    "hollow_restore",
+    "lexicon_match",
+    "protected_noun",
+    "derived",
+    "derived_hollow_w",
+    "derived_hollow_y",
+    "derived_laryngeal",
+    "derived_hollow_lexicon",
+    "derived_weak_initial",
+)
+
+# extract_root answered from the analysis cache, without reaching _route.
+CACHE_HIT = "cache_hit"
+
+# Lookups GeezStemmer._canonical_citation can resolve a root through.
+CANONICALIZATION_PATHS = (
+    "lexicon", "homophone", "hollow_w", "hollow_y", "skeleton", "grammar", "unresolved",
+)
+
+
 class GeezStemmer:
     """
     Ge'ez morphological analyzer.
@@ -78,75 +243,47 @@ class GeezStemmer:
     Provides complete derivation paths showing how roots are extracted through 
     normalization, affix stripping, and weak root reconstruction.
     """
+
+    # StageTimer set by src.instrumentation.instrument(); None when untimed.
+    instrumentation = None
+    # BranchCounters set by src.instrumentation.count_branches(); None when uncounted.
+    branch_counters = None
     
-    def __init__(self):
-        """Initialize the stemmer by loading the lexicon."""
+    def __init__(self, store=None, cache=None, canonical_cache_entries=CANONICAL_CACHE_ENTRIES):
+        """
+        Initialize the stemmer over the shared lexicon store.
+
+        Args:
+            store: LexiconStore to read from. Defaults to the process-wide store,
+                so every stemmer in a worker shares one copy of the data.
+            cache: Optional AnalysisCache for extract_root results, keyed on
+                the input word and tied to the store's data version.
+            canonical_cache_entries: Size of the LRU memo of root
+                canonicalizations (see _canonical_citation); 0 disables it.
+        """
+        self.store = store if store is not None else get_store()
+        self.cache = cache
+        if cache is not None:
+            cache.bind_version(self.store.version)
+        self.canonical_cache = None
+        if canonical_cache_entries > 0:
+            self.canonical_cache = LRUCache(max_entries=canonical_cache_entries)
+            self.canonical_cache.bind_version(self.store.version)
         self.particles = PARTICLE_LEXICON
         self.particle_forms = sorted(self.particles.keys(), key=len, reverse=True)
-        self.lexicon_roots = {}
-        self.weak_initial_roots = set()
-        self.hollow_w_roots = set()
-        self.hollow_y_roots = set()
-        self.quadriliterals = set()
-        
-        try:
-            lexicon_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'lexicon.json')
-            with open(lexicon_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                for entry in data.get('roots', []):
-                    root = entry['root']
-                    self.lexicon_roots[root] = entry
-                    
-                    root_type = entry.get('type', '')
-                    if root_type == 'weak_initial':
-                        self.weak_initial_roots.add(root)
-                    elif root_type == 'quadriliteral':
-                        self.quadriliterals.add(root)
-                    elif root_type == 'hollow_w':
-                        self.hollow_w_roots.add(root)
-                    elif root_type == 'hollow_y':
-                        self.hollow_y_roots.add(root)
-
-            self.hollow_w_lookup = {
-                normalize_geez(root): root for root in self.hollow_w_roots
-            }
-            self.hollow_y_lookup = {
-                normalize_geez(root): root for root in self.hollow_y_roots
-            }
-            self.lexicon_normalized_lookup = {}
-            for lex_root in self.lexicon_roots:
-                norm = normalize_geez(lex_root)
-                if norm not in self.lexicon_normalized_lookup:
-                    self.lexicon_normalized_lookup[norm] = lex_root
-            self.skeleton_lookup = {}
-            for lex_root in self.lexicon_roots:
-                skel = normalize_geez(get_consonant_skeleton(lex_root))
-                self.skeleton_lookup.setdefault(skel, []).append(lex_root)
-                        
-        except FileNotFoundError:
-            print("Warning: lexicon.json not found. Using empty lexicon.")
-            self.hollow_w_lookup = {}
-            self.hollow_y_lookup = {}
-            self.lexicon_normalized_lookup = {}
-            self.skeleton_lookup = {}
-
-        self.nouns = {}
-        try:
-            lexicon_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'lexicon.json')
-            with open(lexicon_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                for entry in data.get('nouns', []):
-                    self.nouns[entry['word']] = entry
-        except Exception:
-            pass
-
-        self.grammar = GrammarIndex()
-        if self.grammar.loaded:
-            for entry in self.grammar.roots.values():
-                root = entry["root"]
-                skel = normalize_geez(get_consonant_skeleton(root))
-                if root not in self.skeleton_lookup.get(skel, []):
-                    self.skeleton_lookup.setdefault(skel, []).append(root)
+
+        self.lexicon_roots = self.store.lexicon_roots
+        self.weak_initial_roots = self.store.weak_initial_roots
+        self.hollow_w_roots = self.store.hollow_w_roots
+        self.hollow_y_roots = self.store.hollow_y_roots
+        self.quadriliterals = self.store.quadriliterals
+        self.hollow_w_lookup = self.store.hollow_w_lookup
+        self.hollow_y_lookup = self.store.hollow_y_lookup
+        self.lexicon_normalized_lookup = self.store.lexicon_normalized_lookup
+        self.nouns = self.store.nouns
+        self.grammar = self.store.grammar
+        self.skeleton_lookup = self.store.skeleton_lookup
+        self.skeleton_candidates = self.store.skeleton_candidates
 
         self.prefixes = [
             # Stem IV (አስተሳሳቢ) - Causative-Passive fused prefixes (LONGEST FIRST)
@@ -216,28 +353,87 @@ class GeezStemmer:
             'ክ', 'ን', 'ት', 'ም', 'አት', 'ተ', 'ዩ',
         ]
 
+        # Forward/reverse tries: one walk finds every affix at the word edge.
+        self._prefix_trie = _build_affix_trie(self.prefixes)
+        self._suffix_trie = _build_affix_trie(self.suffixes, reverse=True)
+        self._particle_trie = _build_affix_trie(self.particle_forms)
+
+    def _particle_next(self, word):
+        """
+        Next-pointer table for particle segmentation of word.
+
+        Filled right to left: entry pos lists the particles that start at pos
+        and are followed by a complete segmentation of the rest, longest
+        first; it is None when word[pos:] cannot be segmented. Each position
+        is solved once through the particle trie, so the cost is linear in
+        the word length.
+        """
+        end = len(word)
+        trie = self._particle_trie
+        nexts = [None] * (end + 1)
+        nexts[end] = ()
+        for pos in range(end - 1, -1, -1):
+            forms = [
+                form for form in _affix_matches(trie, word, pos, end)
+                if nexts[pos + len(form)] is not None
+            ]
+            if forms:
+                nexts[pos] = forms
+        return nexts
+
     def _segment_particles(self, word):
         """
         Segment a token into a chain of known particles.
 
-        Uses longest-match backtracking so multi-character particles like እም
-        are preferred over single-character overlaps.
+        Returns the segmentation longest-match backtracking would find
+        (multi-character particles like እም are preferred over single-character
+        overlaps), or None.
         """
-        def helper(pos):
-            if pos == len(word):
-                return []
-            for form in self.particle_forms:
-                if word.startswith(form, pos):
-                    rest = helper(pos + len(form))
-                    if rest is not None:
-                        return [form] + rest
+        if not word or word[0] not in self._particle_trie:
             return None
-
-        segments = helper(0)
-        if not segments:
+        nexts = self._particle_next(word)
+        if nexts[0] is None:
             return None
+        segments = []
+        pos = 0
+        while pos < len(word):
+            form = nexts[pos][0]
+            segments.append(form)
+            pos += len(form)
         return segments
 
+    def particle_segmentations(self, word, limit=None):
+        """
+        Every way to segment a token into known particles.
+
+        Args:
+            word: The (normalized) token.
+            limit: Stop after this many segmentations (None for all; the count
+                can grow exponentially with the number of one-letter particles).
+
+        Returns:
+            List of segmentations (lists of particle forms); the first is the
+            one extract_root uses. Empty when the token is not a particle chain.
+        """
+        if not word or word[0] not in self._particle_trie:
+            return []
+        nexts = self._particle_next(word)
+        if nexts[0] is None:
+            return []
+        results = []
+        stack = [(0, [])]
+        while stack:
+            pos, path = stack.pop()
+            if pos == len(word):
+                results.append(path)
+                if limit is not None and len(results) >= limit:
+                    break
+                continue
+            # Push in reverse so the preferred particle is expanded first.
+            for form in reversed(nexts[pos]):
+                stack.append((pos + len(form), path + [form]))
+        return results
+
     def _build_particle_result(self, word, segments, derivation_steps):
         """Build analysis output for an atomic particle phrase."""
         particles = []
@@ -396,52 +592,50 @@ class GeezStemmer:
         Skeletonization collapses vowel order (ጣ/ጥ/ጠ → ጠ) and normalization
         collapses homophone rows (ኀ/ሀ/ሐ → ሀ). The lexicon stores citation
         spellings such as ኀጥአ; this resolver recovers them from ሀጠአ.
+        Skeletons shared by several roots are decided from the store's
+        precomputed skeleton_candidates records.
         """
         if not skeleton:
             return None
 
-        norm = normalize_geez(get_consonant_skeleton(skeleton))
-        candidates = self.skeleton_lookup.get(norm, [])
-        if not candidates:
-            grammar_pick = self.grammar.resolve_skeleton(
+        norm = normalize_geez(skeleton, "search")
+        bucket = self.skeleton_candidates.get(norm)
+        if bucket is None:
+            candidates = self.skeleton_lookup.get(norm)
+            if candidates:
+                return candidates[0]
+            return self.grammar.resolve_skeleton(
                 skeleton, source=source, pattern_name=pattern_name
             )
-            return grammar_pick
-        if len(candidates) == 1:
-            return candidates[0]
 
-        if pattern_name in {"imperfective", "jussive"} and stem and get_char_order(stem[0]) == 6:
-            for candidate in candidates:
-                if self.lexicon_roots[candidate].get("type") == "type_a":
-                    return candidate
+        if (
+            bucket.type_a
+            and pattern_name in ("imperfective", "jussive")
+            and stem
+            and get_char_order(stem[0]) == 6
+        ):
+            return bucket.type_a
 
         order_surface = source or stem
         if order_surface:
-            c1_order = get_char_order(order_surface[0])
-            if c1_order:
-                order_matches = [
-                    candidate for candidate in candidates
-                    if get_char_order(candidate[0]) == c1_order
-                ]
-                if len(order_matches) == 1:
-                    return order_matches[0]
-
-        for candidate in candidates:
-            if candidate in self.hollow_w_roots or candidate in self.hollow_y_roots:
-                return candidate
-
-        for candidate in candidates:
-            root_type = self.lexicon_roots[candidate].get("type", "")
-            if root_type and root_type not in ("type_a", "strong", "unknown"):
-                return candidate
+            order_pick = bucket.by_order.get(get_char_order(order_surface[0]))
+            if order_pick is not None:
+                return order_pick
+
+        if bucket.hollow:
+            return bucket.hollow
+        if bucket.typed:
+            return bucket.typed
 
         grammar_pick = self.grammar.resolve_skeleton(
             skeleton, source=source, pattern_name=pattern_name
         )
-        if grammar_pick and grammar_pick in candidates:
+        if grammar_pick and grammar_pick in bucket.members:
+            if grammar_pick not in self.lexicon_roots and source in self.lexicon_roots:
+                return source
             return grammar_pick
 
-        return candidates[0]
+        return bucket.roots[0]
 
     def _canonicalize_root(self, root, source=None, stem=None, pattern_name=None):
         """
@@ -450,48 +644,91 @@ class GeezStemmer:
         Internal normalization maps homophones (e.g. ሐ→ሀ) for matching, but
         user-facing output should use the lexicon citation form when known.
         """
+        return self._canonical_citation(root, source, stem, pattern_name)[1]
+
+    def _canonical_citation(self, root, source=None, stem=None, pattern_name=None):
+        """
+        _canonicalize_root with the lookup that decided it.
+
+        Resolutions are memoized in canonical_cache. Besides root, the
+        lookups below only read the first-radical orders of source and stem,
+        whether pattern_name is imperfective/jussive, and (as a possible
+        answer) source itself when it is a lexicon root, so those make up the
+        key.
+
+        Returns:
+            (via, root): via is one of CANONICALIZATION_PATHS.
+        """
         if not root:
-            return root
+            return "unresolved", root
         if root in self.lexicon_roots:
-            return root
+            return "lexicon", root
 
+        memo = self.canonical_cache
+        if memo is None:
+            return self._resolve_canonical(root, source, stem, pattern_name)
+        if memo.version != self.store.version:
+            memo.bind_version(self.store.version)
+        key = (
+            root,
+            get_char_order(source[0]) if source else -1,
+            get_char_order(stem[0]) if stem else -1,
+            pattern_name in ("imperfective", "jussive"),
+            source if source and source in self.lexicon_roots else None,
+        )
+        resolved = memo.get(key)
+        if resolved is None:
+            resolved = self._resolve_canonical(root, source, stem, pattern_name)
+            memo.put(key, resolved)
+        return resolved
+
+    def _resolve_canonical(self, root, source, stem, pattern_name):
+        """Uncached lookups of _canonical_citation for a root outside the lexicon."""
         norm = normalize_geez(root)
         if norm in self.lexicon_normalized_lookup:
-            return self.lexicon_normalized_lookup[norm]
+            return "homophone", self.lexicon_normalized_lookup[norm]
 
         canonical_w = self.hollow_w_lookup.get(norm)
         if canonical_w:
-            return canonical_w
+            return "hollow_w", canonical_w
 
         canonical_y = self.hollow_y_lookup.get(norm)
         if canonical_y:
-            return canonical_y
+            return "hollow_y", canonical_y
 
         citation = self._resolve_skeleton_citation(
             root, source=source, stem=stem, pattern_name=pattern_name
         )
         if citation:
-            return citation
+            return "skeleton", citation
 
         grammar_pick = self.grammar.resolve_skeleton(
             root, source=source, pattern_name=pattern_name
         )
         if grammar_pick:
-            return grammar_pick
+            return "grammar", grammar_pick
 
-        return root
+        return "unresolved", root
 
-    def strip_affixes(self, word):
+    def strip_affixes(self, word, trace=True):
         """
         Recursively strips prefixes and suffixes with derivation tracking.
         
+        Prefixes are tried before suffixes and, at each edge, in list order;
+        after every strip the search restarts from the prefixes. The
+        remaining word is tracked as word[start:end], and since every
+        character devowelizes to one consonant its skeleton length is
+        end - start.
+        
         Args:
             word: The input word.
+            trace: Record derivation steps; when False the step list is
+                returned empty.
             
         Returns:
             Tuple of (stripped_word, prefix_list, suffix_list, derivation_steps).
         """
-        current_word = word
+        start, end = 0, len(word)
         found_prefixes = []
         found_suffixes = []
         derivation_steps = []
@@ -499,90 +736,78 @@ class GeezStemmer:
         changed = True
         while changed:
             changed = False
+            current_word = word[start:end]
             
-            for prefix in self.prefixes:
-                if current_word.startswith(prefix):
-                    remaining = current_word[len(prefix):]
-                    remaining_skeleton = get_consonant_skeleton(remaining)
-                    
-                    if prefix == 'መ':
-                        if current_word in self.nouns:
-                            continue
-                            
-                        if len(remaining) > 0:
-                            last_char = remaining[-1]
-                            if get_char_order(last_char) == 1 and len(remaining_skeleton) >= 3:
-                                skeleton_full = get_consonant_skeleton(current_word)
-                                if skeleton_full in self.quadriliterals:
-                                    continue
-
-                    if len(remaining_skeleton) >= 3:
-                        derivation_steps.append({
-                            "action": "strip_prefix",
-                            "affix": prefix,
-                            "before": current_word,
-                            "after": remaining,
-                            "rule": f"Prefix '{prefix}' stripped (skeleton >= 3)"
-                        })
-                        found_prefixes.append(prefix)
-                        current_word = remaining
-                        changed = True
-                        break
-                    elif len(remaining_skeleton) == 2 and self._is_weak_root_candidate(remaining):
-                        derivation_steps.append({
-                            "action": "strip_prefix",
-                            "affix": prefix,
-                            "before": current_word,
-                            "after": remaining,
-                            "rule": f"Prefix '{prefix}' stripped (weak root candidate)"
-                        })
-                        found_prefixes.append(prefix)
-                        current_word = remaining
-                        changed = True
-                        break
+            for prefix in _affix_matches(self._prefix_trie, word, start, end):
+                remaining_len = end - start - len(prefix)
+                
+                if prefix == 'መ':
+                    if current_word in self.nouns:
+                        continue
+                        
+                    if remaining_len > 0:
+                        last_char = word[end - 1]
+                        if get_char_order(last_char) == 1 and remaining_len >= 3:
+                            skeleton_full = get_consonant_skeleton(current_word)
+                            if skeleton_full in self.quadriliterals:
+                                continue
+
+                if remaining_len >= 3:
+                    reason = "skeleton >= 3"
+                elif remaining_len == 2 and self._is_weak_root_candidate(word[start + len(prefix):end]):
+                    reason = "weak root candidate"
+                else:
+                    continue
+                start += len(prefix)
+                if trace:
+                    derivation_steps.append({
+                        "action": "strip_prefix",
+                        "affix": prefix,
+                        "before": current_word,
+                        "after": word[start:end],
+                        "rule": f"Prefix '{prefix}' stripped ({reason})"
+                    })
+                found_prefixes.append(prefix)
+                changed = True
+                break
             
             if changed:
                 continue
 
-            for suffix in self.suffixes:
-                if current_word.endswith(suffix):
-                    remaining = current_word[:-len(suffix)]
-                    remaining_skeleton = get_consonant_skeleton(remaining)
-                    
-                    if len(remaining_skeleton) >= 3:
-                        derivation_steps.append({
-                            "action": "strip_suffix",
-                            "affix": suffix,
-                            "before": current_word,
-                            "after": remaining,
-                            "rule": f"Suffix '{suffix}' stripped (skeleton >= 3)"
-                        })
-                        found_suffixes.append(suffix)
-                        current_word = remaining
-                        changed = True
-                        break
-                    elif len(remaining_skeleton) == 2:
-                        # Check for weak root or laryngeal middle
-                        is_reconstructable = self._is_weak_root_candidate(remaining)
-                        if not is_reconstructable:
-                            # Check for laryngeal middle candidate
-                            laryngeal_root, _ = self._reconstruct_laryngeal_middle(remaining_skeleton)
-                            is_reconstructable = laryngeal_root is not None
-                        
-                        if is_reconstructable:
-                            derivation_steps.append({
-                                "action": "strip_suffix",
-                                "affix": suffix,
-                                "before": current_word,
-                                "after": remaining,
-                                "rule": f"Suffix '{suffix}' stripped (reconstructable root candidate)"
-                            })
-                            found_suffixes.append(suffix)
-                            current_word = remaining
-                            changed = True
-                            break
+            for suffix in _affix_matches(self._suffix_trie, word, start, end, reverse=True):
+                remaining_len = end - start - len(suffix)
+                remaining = word[start:end - len(suffix)]
+                
+                if remaining_len >= 3:
+                    reason = "skeleton >= 3"
+                elif remaining_len == 2:
+                    # Check for weak root or laryngeal middle
+                    is_reconstructable = self._is_weak_root_candidate(remaining)
+                    if not is_reconstructable:
+                        # Check for laryngeal middle candidate
+                        laryngeal_root, _ = self._reconstruct_laryngeal_middle(
+                            get_consonant_skeleton(remaining)
+                        )
+                        is_reconstructable = laryngeal_root is not None
+                    if not is_reconstructable:
+                        continue
+                    reason = "reconstructable root candidate"
+                else:
+                    continue
+                end -= len(suffix)
+                if trace:
+                    derivation_steps.append({
+                        "action": "strip_suffix",
+                        "affix": suffix,
+                        "before": current_word,
+                        "after": remaining,
+                        "rule": f"Suffix '{suffix}' stripped ({reason})"
+                    })
+                found_suffixes.append(suffix)
+                changed = True
+                break
         
-        return current_word, found_prefixes, found_suffixes, derivation_steps
+        return word[start:end], found_prefixes, found_suffixes, derivation_steps
 
     def identify_verb_pattern(self, stem, prefixes):
         """
@@ -591,155 +816,41 @@ class GeezStemmer:
         Detects 5 verb stems and their tenses:
         - Stem IV (አስተሳሳቢ): ያስተ-, ታስተ-, ናስተ-, አስተ- prefixes
         - Stem III (አሳሳቢ): ያ-, ታ-, ና-, አ- prefixes
-        - Stem II (ተገብሮ): ይት-, ትت-, ተ- prefixes
+        - Stem II (ተገብሮ): ይት-, ትት-, ተ- prefixes
         - Stem I (ቀዳማይ): Basic ይ-, ት-, እ-, ን- or no prefix
+
+        The prefixes are classified through PREFIX_PATTERN_FLAGS (see there);
+        only prefix-less stems look at the stem itself.
         
         Args:
             stem: The verb stem.
             prefixes: List of prefixes found.
             
         Returns:
-            Pattern info dict with geez name, stem number, and description.
+            One of the shared, read-only VERB_PATTERNS records (geez name,
+            stem number and description); copy it before modifying.
         """
-        skeleton = get_consonant_skeleton(stem)
-        
-        # =================================================================
-        # STEM IV: Causative-Passive (አስተሳሳቢ) - Check first (longest)
-        # =================================================================
-        stem4_imperf = ['ያስተ', 'ታስተ', 'ናስተ']
-        stem4_juss = ['ላስተ']
-        stem4_perf = ['አስተ', 'መስተ']
-        
-        if any(p in stem4_imperf for p in prefixes):
-            return {
-                "name": "causative_passive_imperfective",
-                "geez_name": "አስተሳሳቢ ካልኣይ",
-                "english_name": "Causative-Passive Imperfective",
-                "stem_number": 4,
-                "description": "Stem IV: Causative-passive ongoing action"
-            }
-        if any(p in stem4_juss for p in prefixes):
-            return {
-                "name": "causative_passive_jussive",
-                "geez_name": "አስተሳሳቢ ሣልሳይ",
-                "english_name": "Causative-Passive Jussive",
-                "stem_number": 4,
-                "description": "Stem IV: Causative-passive wish/command"
-            }
-        if any(p in stem4_perf for p in prefixes):
-            return {
-                "name": "causative_passive_perfective",
-                "geez_name": "አስተሳሳቢ ቀዳማይ",
-                "english_name": "Causative-Passive Perfective",
-                "stem_number": 4,
-                "description": "Stem IV: Causative-passive completed action"
-            }
-        
-        # =================================================================
-        # STEM III: Causative (አሳሳቢ) - includes አስ- verbs
-        # =================================================================
-        stem3_imperf = ['ያ', 'ታ', 'ና', 'ያስ', 'ታስ', 'ናስ']
-        stem3_juss = ['ላስ']
-        
-        if any(p in stem3_imperf for p in prefixes):
-            return {
-                "name": "causative_imperfective",
-                "geez_name": "አሳሳቢ ካልኣይ",
-                "english_name": "Causative Imperfective",
-                "stem_number": 3,
-                "description": "Stem III: Causing action (ongoing)"
-            }
-        
-        if any(p in stem3_juss for p in prefixes):
-            return {
-                "name": "causative_jussive",
-                "geez_name": "አሳሳቢ ሣልሳይ",
-                "english_name": "Causative Jussive",
-                "stem_number": 3,
-                "description": "Stem III: Causing action (wish/command)"
-            }
-        
-        if 'አ' in prefixes and len(prefixes) == 1:
-            return {
-                "name": "causative_perfective",
-                "geez_name": "አሳሳቢ ቀዳማይ",
-                "english_name": "Causative Perfective",
-                "stem_number": 3,
-                "description": "Stem III: Causing action (completed)"
-            }
-        
-        if 'አስ' in prefixes and len(prefixes) == 1:
-            return {
-                "name": "causative_perfective",
-                "geez_name": "አሳሳቢ ቀዳማይ",
-                "english_name": "Causative Perfective (አስ-verb)",
-                "stem_number": 3,
-                "description": "Stem III: Causing action (completed)"
-            }
-        
-        # =================================================================
-        # STEM II: Passive/Reflexive (ተገብሮ)
-        # =================================================================
-        stem2_imperf = ['ይት', 'ትת', 'እת', 'ንת']
-        
-        if any(p in stem2_imperf for p in prefixes):
-            return {
-                "name": "passive_imperfective",
-                "geez_name": "ተገብሮ ካልኣይ",
-                "english_name": "Passive Imperfective",
-                "stem_number": 2,
-                "description": "Stem II: Passive/reflexive ongoing action"
-            }
-        
-        if 'ተ' in prefixes and not any(p in ['ያ', 'ታ', 'ና', 'አስተ'] for p in prefixes):
-            return {
-                "name": "passive_perfective",
-                "geez_name": "ተገብሮ ቀዳማይ",
-                "english_name": "Passive Perfective",
-                "stem_number": 2,
-                "description": "Stem II: Passive/reflexive completed action"
-            }
-        
-        # =================================================================
-        # STEM I: Basic (ቀዳማይ ግንድ)
-        # =================================================================
-        imperfect_prefixes = ['ይ', 'ት', 'እ', 'ን']
-        if any(p in imperfect_prefixes for p in prefixes):
-            return {
-                "name": "imperfective",
-                "geez_name": "ካልኣይ አንቀጽ",
-                "english_name": "Imperfective",
-                "stem_number": 1,
-                "description": "Stem I: Basic ongoing/habitual action"
-            }
-        
+        if prefixes:
+            if len(prefixes) == 1:
+                pattern = SINGLE_PREFIX_PATTERNS.get(prefixes[0])
+            else:
+                flags = 0
+                for prefix in prefixes:
+                    flags |= PREFIX_PATTERN_FLAGS.get(prefix, 0)
+                # The lowest set bit is the highest-priority matching rule.
+                pattern = PATTERN_BY_FLAG.get(flags & -flags)
+            if pattern is not None:
+                return pattern
+
         # Imperative: C1 is 6th order (Sādis)
         if len(stem) >= 2 and get_char_order(stem[0]) == 6:
-            return {
-                "name": "imperative",
-                "geez_name": "ትእዛዝ",
-                "english_name": "Imperative",
-                "stem_number": 1,
-                "description": "Stem I: Direct command"
-            }
-        
+            return VERB_PATTERNS["imperative"]
+
         # Perfective: default citation form
-        if len(skeleton) >= 3 and len(stem) > 0 and get_char_order(stem[-1]) == 1:
-            return {
-                "name": "perfective",
-                "geez_name": "ቀዳማይ አንቀጽ",
-                "english_name": "Perfective",
-                "stem_number": 1,
-                "description": "Stem I: Basic completed action"
-            }
-            
-        return {
-            "name": "unknown",
-            "geez_name": "ያልታወቀ",
-            "english_name": "Unknown/Noun",
-            "stem_number": 0,
-            "description": "Pattern could not be determined"
-        }
+        if len(stem) > 0 and get_char_order(stem[-1]) == 1 and len(get_consonant_skeleton(stem)) >= 3:
+            return VERB_PATTERNS["perfective"]
+
+        return VERB_PATTERNS["unknown"]
 
     def _get_root_type(self, root):
         """Determine the morphological type of a root."""
@@ -761,6 +872,11 @@ class GeezStemmer:
         
         return "strong"
 
+    @cached_property
+    def paradigms(self):
+        """The store's paradigm index (loaded on first analysis)."""
+        return self.store.paradigm_index
+
     def extract_root(self, word):
         """
         Extract the root from a Ge'ez word with full research metadata.
@@ -771,22 +887,117 @@ class GeezStemmer:
         Returns:
             Complete analysis dict with derivation path.
         """
+        cache = self.cache
+        if cache is None:
+            return self._analyze(word)
+        if cache.version != self.store.version:
+            cache.bind_version(self.store.version)
+        result = self._cached_analysis(word)
+        if result is None:
+            result = self._analyze(word)
+            cache.put(word, result)
+        return result
+
+    def _cached_analysis(self, word):
+        """The cached extract_root result for word, or None (instrumentation counts hits here)."""
+        return self.cache.get(word)
+
+    def analyze_fast(self, word):
+        """
+        Extract the root from a Ge'ez word without research metadata.
+        
+        Runs the same pipeline as extract_root but skips the derivation path,
+        research notation, glosses and grammar references, and bypasses the
+        analysis cache.
+        
+        Args:
+            word: The input word.
+            
+        Returns:
+            LeanAnalysis(input, root, root_type, pattern, confidence), with the
+            same values as the corresponding extract_root fields (pattern is
+            the pattern name).
+        """
+        return self._analyze(word, lean=True)
+
+    def _analyze(self, word, lean=False):
+        """
+        Shared analysis pipeline behind extract_root and analyze_fast.
+
+        With lean=True no derivation steps, rule strings or reference blocks
+        are built and a LeanAnalysis is returned.
+        """
+        return self._route(word, lean)[1]
+
+    def _paradigm_cells(self, word, normalized):
+        """
+        Paradigm index cells for word, unless they move it off a lexicon root.
+
+        A word spelled like a lexicon root only takes cells of that root; one
+        spelled like a homophone of lexicon roots only takes cells of a root
+        with the same normalization; one whose consonant skeleton is a
+        lexicon root (ሠራ -> ሰረ) is left to the lexicon match.
+        """
+        cells = self.paradigms.analyze(word)
+        if not cells:
+            return None
+        root = cells[0][0]
+        if word in self.lexicon_roots:
+            return cells if root == word else None
+        if normalized in self.lexicon_roots:
+            return cells if root == normalized else None
+        if normalized in self.lexicon_normalized_lookup and normalize_geez(root) != normalized:
+            return None
+        skeleton = get_consonant_skeleton(normalized)
+        if skeleton != root and skeleton in self.lexicon_roots:
+            return None
+        return cells
+
+    def _route(self, word, lean=False):
+        """
+        The analysis pipeline proper.
+
+        Returns:
+            (branch, result): branch names the exit the analysis took (one
+            of ANALYSIS_BRANCHES), result is what _analyze returns.
+        """
+        trace = not lean
         derivation_steps = []
         
         normalized = normalize_geez(word)
         if word != normalized:
-            derivation_steps.append({
-                "step": 1,
-                "action": "normalize",
-                "description": "Homophone normalization",
-                "before": word,
-                "after": normalized,
-                "rule": "Map phonetic variants to canonical forms"
-            })
+            if trace:
+                derivation_steps.append({
+                    "step": 1,
+                    "action": "normalize",
+                    "description": "Homophone normalization",
+                    "before": word,
+                    "after": normalized,
+                    "rule": "Map phonetic variants to canonical forms"
+                })
         
         particle_segments = self._segment_particles(normalized)
         if particle_segments:
-            return self._build_particle_result(word, particle_segments, derivation_steps)
+            if lean:
+                return "particle_phrase", LeanAnalysis(word, " + ".join(particle_segments), "particle_phrase", "particle_phrase", 0.98)
+            return "particle_phrase", self._build_particle_result(word, particle_segments, derivation_steps)
+
+        if normalized not in self.nouns:
+            cells = self._paradigm_cells(word, normalized)
+            if cells:
+                root, verb_type, tense, subject = cells[0]
+                if trace:
+                    derivation_steps.append({
+                        "step": len(derivation_steps) + 1,
+                        "action": "paradigm_lookup",
+                        "description": "Generated paradigm form lookup",
+                        "before": word,
+                        "after": root,
+                        "rule": f"Generated as {tense} {subject} of {root} ({verb_type})"
+                    })
+                return "paradigm", self._build_result(
+                    word, root, normalized, [], [], derivation_steps, "paradigm", lean, paradigm=cells
+                )
 
         if len(normalized) == 1:
             one_char_map = {
@@ -797,15 +1008,16 @@ class GeezStemmer:
             }
             if normalized in one_char_map:
                 root, explanation = one_char_map[normalized]
-                derivation_steps.append({
-                    "step": 2,
-                    "action": "one_char_lookup",
-                    "description": "Single-character imperative reconstruction",
-                    "before": normalized,
-                    "after": root,
-                    "rule": explanation
-                })
-                return self._build_result(word, root, normalized, [], [], derivation_steps, "irregular")
+                if trace:
+                    derivation_steps.append({
+                        "step": 2,
+                        "action": "one_char_lookup",
+                        "description": "Single-character imperative reconstruction",
+                        "before": normalized,
+                        "after": root,
+                        "rule": explanation
+                    })
+                return "one_char", self._build_result(word, root, normalized, [], [], derivation_steps, "irregular", lean)
 
         skeleton_initial = get_consonant_skeleton(normalized)
         order_signal = get_char_order(normalized[0]) if normalized else 0
@@ -814,46 +1026,50 @@ class GeezStemmer:
         if len(skeleton_initial) == 2 and not has_order_signal:
             hollow_root, hollow_type = self._try_hollow_middle_restore(skeleton_initial)
             if hollow_root:
-                action = (
-                    "reconstruct_hollow_w_lexicon"
-                    if hollow_type == "hollow_w"
-                    else "reconstruct_hollow_y_lexicon"
-                )
-                radical = "ወ" if hollow_type == "hollow_w" else "የ"
-                derivation_steps.append({
-                    "step": 2,
-                    "action": action,
-                    "description": f"Reconstruct hollow-{radical} middle radical",
-                    "before": normalized,
-                    "after": hollow_root,
-                    "rule": f"2-letter stem matches known {hollow_type} root. Restored {radical} as C2."
-                })
-                return self._build_result(
-                    word, hollow_root, normalized, [], [], derivation_steps, "derived"
+                if trace:
+                    action = (
+                        "reconstruct_hollow_w_lexicon"
+                        if hollow_type == "hollow_w"
+                        else "reconstruct_hollow_y_lexicon"
+                    )
+                    radical = "ወ" if hollow_type == "hollow_w" else "የ"
+                    derivation_steps.append({
+                        "step": 2,
+                        "action": action,
+                        "description": f"Reconstruct hollow-{radical} middle radical",
+                        "before": normalized,
+                        "after": hollow_root,
+                        "rule": f"2-letter stem matches known {hollow_type} root. Restored {radical} as C2."
+                    })
+                return "hollow_restore", self._build_result(
+                    word, hollow_root, normalized, [], [], derivation_steps, "derived", lean
                 )
 
         canonical_initial = self._resolve_skeleton_citation(
             skeleton_initial, source=normalized, stem=normalized
         ) or self._canonicalize_root(skeleton_initial, source=normalized, stem=normalized)
         if canonical_initial in self.lexicon_roots and not (len(skeleton_initial) == 2 and has_order_signal):
-            derivation_steps.append({
-                "step": 2,
-                "action": "lexicon_match",
-                "description": "Direct lexicon lookup",
-                "before": normalized,
-                "after": canonical_initial,
-                "rule": f"Found in lexicon: {self.lexicon_roots[canonical_initial].get('meaning', 'N/A')}"
-            })
-            return self._build_result(word, canonical_initial, normalized, [], [], derivation_steps, "lexicon")
+            if trace:
+                derivation_steps.append({
+                    "step": 2,
+                    "action": "lexicon_match",
+                    "description": "Direct lexicon lookup",
+                    "before": normalized,
+                    "after": canonical_initial,
+                    "rule": f"Found in lexicon: {self.lexicon_roots[canonical_initial].get('meaning', 'N/A')}"
+                })
+            return "lexicon_match", self._build_result(word, canonical_initial, normalized, [], [], derivation_steps, "lexicon", lean)
 
         if normalized in self.nouns:
             noun_entry = self.nouns[normalized]
             root = noun_entry.get('root', normalized)
             root_type = "derived_noun" if 'root' in noun_entry else "noun"
+            if lean:
+                return "protected_noun", LeanAnalysis(word, root, root_type, "noun", 1.0)
             skeleton = get_consonant_skeleton(root)
             verb_home = detect_verb_home(skeleton, root)
             
-            return {
+            return "protected_noun", {
                 "input": word,
                 "root": root,
                 "root_consonants": list(skeleton),
@@ -883,22 +1099,24 @@ class GeezStemmer:
                 }
             }
 
-        stem, prefixes, suffixes, affix_steps = self.strip_affixes(normalized)
+        stem, prefixes, suffixes, affix_steps = self.strip_affixes(normalized, trace=trace)
         for i, step in enumerate(affix_steps):
             step["step"] = len(derivation_steps) + 1 + i
             derivation_steps.append(step)
         
         skeleton = get_consonant_skeleton(stem)
-        derivation_steps.append({
-            "step": len(derivation_steps) + 1,
-            "action": "devowelize",
-            "description": "Extract consonant skeleton",
-            "before": stem,
-            "after": skeleton,
-            "rule": "Remove vowel orders to get base consonants"
-        })
+        if trace:
+            derivation_steps.append({
+                "step": len(derivation_steps) + 1,
+                "action": "devowelize",
+                "description": "Extract consonant skeleton",
+                "before": stem,
+                "after": skeleton,
+                "rule": "Remove vowel orders to get base consonants"
+            })
         
         root = skeleton
+        branch = "derived"
         
         if len(root) == 2 and len(stem) >= 1:
             first_char_stem = stem[0]
@@ -906,104 +1124,169 @@ class GeezStemmer:
             
             if order == 7:
                 reconstructed = root[0] + 'ወ' + root[1]
-                derivation_steps.append({
-                    "step": len(derivation_steps) + 1,
-                    "action": "reconstruct_hollow_w",
-                    "description": "Reconstruct hollow-W middle radical",
-                    "before": root,
-                    "after": reconstructed,
-                    "rule": f"7th order vowel (O) on C1 indicates hidden ወ. Pattern: C1o = C1+ወ+C2"
-                })
+                if trace:
+                    derivation_steps.append({
+                        "step": len(derivation_steps) + 1,
+                        "action": "reconstruct_hollow_w",
+                        "description": "Reconstruct hollow-W middle radical",
+                        "before": root,
+                        "after": reconstructed,
+                        "rule": f"7th order vowel (O) on C1 indicates hidden ወ. Pattern: C1o = C1+ወ+C2"
+                    })
                 root = reconstructed
+                branch = "derived_hollow_w"
             elif order in [3, 5]:
                 reconstructed = root[0] + 'የ' + root[1]
-                derivation_steps.append({
-                    "step": len(derivation_steps) + 1,
-                    "action": "reconstruct_hollow_y",
-                    "description": "Reconstruct hollow-Y middle radical",
-                    "before": root,
-                    "after": reconstructed,
-                    "rule": f"3rd/5th order vowel (I/E) on C1 indicates hidden የ. Pattern: C1i/e = C1+የ+C2"
-                })
+                if trace:
+                    derivation_steps.append({
+                        "step": len(derivation_steps) + 1,
+                        "action": "reconstruct_hollow_y",
+                        "description": "Reconstruct hollow-Y middle radical",
+                        "before": root,
+                        "after": reconstructed,
+                        "rule": f"3rd/5th order vowel (I/E) on C1 indicates hidden የ. Pattern: C1i/e = C1+የ+C2"
+                    })
                 root = reconstructed
+                branch = "derived_hollow_y"
             else:
                 # Try laryngeal middle reconstruction (C2 dropped in Jussive/Imperative)
                 laryngeal_root, laryngeal_char = self._reconstruct_laryngeal_middle(root)
                 if laryngeal_root:
-                    derivation_steps.append({
-                        "step": len(derivation_steps) + 1,
-                        "action": "reconstruct_laryngeal_middle",
-                        "description": "Reconstruct laryngeal middle radical",
-                        "before": root,
-                        "after": laryngeal_root,
-                        "rule": f"2-letter stem with missing C2. Laryngeal '{laryngeal_char}' reconstructed. Pattern: C1+{laryngeal_char}+C3 (ላሪንጅያል መካከል)"
-                    })
+                    if trace:
+                        derivation_steps.append({
+                            "step": len(derivation_steps) + 1,
+                            "action": "reconstruct_laryngeal_middle",
+                            "description": "Reconstruct laryngeal middle radical",
+                            "before": root,
+                            "after": laryngeal_root,
+                            "rule": f"2-letter stem with missing C2. Laryngeal '{laryngeal_char}' reconstructed. Pattern: C1+{laryngeal_char}+C3 (ላሪንጅያል መካከል)"
+                        })
                     root = laryngeal_root
+                    branch = "derived_laryngeal"
                 
         if len(root) == 2:
             hollow_root, hollow_type = self._try_hollow_middle_restore(root)
             if hollow_root:
-                action = (
-                    "reconstruct_hollow_w_lexicon"
-                    if hollow_type == "hollow_w"
-                    else "reconstruct_hollow_y_lexicon"
-                )
-                radical = "ወ" if hollow_type == "hollow_w" else "የ"
-                derivation_steps.append({
-                    "step": len(derivation_steps) + 1,
-                    "action": action,
-                    "description": f"Reconstruct hollow-{radical} middle radical",
-                    "before": root,
-                    "after": hollow_root,
-                    "rule": f"2-letter stem matches known {hollow_type} root. Restored {radical} as C2."
-                })
-                root = hollow_root
-            else:
-                laryngeal_root, laryngeal_char = self._reconstruct_laryngeal_middle(root)
-                if laryngeal_root:
+                if trace:
+                    action = (
+                        "reconstruct_hollow_w_lexicon"
+                        if hollow_type == "hollow_w"
+                        else "reconstruct_hollow_y_lexicon"
+                    )
+                    radical = "ወ" if hollow_type == "hollow_w" else "የ"
                     derivation_steps.append({
                         "step": len(derivation_steps) + 1,
-                        "action": "reconstruct_laryngeal_middle",
-                        "description": "Reconstruct laryngeal middle radical",
+                        "action": action,
+                        "description": f"Reconstruct hollow-{radical} middle radical",
                         "before": root,
-                        "after": laryngeal_root,
-                        "rule": f"2-letter stem matches laryngeal-middle pattern. Restored '{laryngeal_char}' as C2."
+                        "after": hollow_root,
+                        "rule": f"2-letter stem matches known {hollow_type} root. Restored {radical} as C2."
                     })
-                    root = laryngeal_root
-                else:
-                    candidate = 'ወ' + root
-                    if candidate in self.weak_initial_roots:
+                root = hollow_root
+                branch = "derived_hollow_lexicon"
+            else:
+                laryngeal_root, laryngeal_char = self._reconstruct_laryngeal_middle(root)
+                if laryngeal_root:
+                    if trace:
                         derivation_steps.append({
                             "step": len(derivation_steps) + 1,
-                            "action": "reconstruct_weak_initial",
-                            "description": "Reconstruct assimilated initial ወ",
+                            "action": "reconstruct_laryngeal_middle",
+                            "description": "Reconstruct laryngeal middle radical",
                             "before": root,
-                            "after": candidate,
-                            "rule": "2-letter stem matches weak-initial pattern. Restored ወ prefix."
+                            "after": laryngeal_root,
+                            "rule": f"2-letter stem matches laryngeal-middle pattern. Restored '{laryngeal_char}' as C2."
                         })
+                    root = laryngeal_root
+                    branch = "derived_laryngeal"
+                else:
+                    candidate = 'ወ' + root
+                    if candidate in self.weak_initial_roots:
+                        if trace:
+                            derivation_steps.append({
+                                "step": len(derivation_steps) + 1,
+                                "action": "reconstruct_weak_initial",
+                                "description": "Reconstruct assimilated initial ወ",
+                                "before": root,
+                                "after": candidate,
+                                "rule": "2-letter stem matches weak-initial pattern. Restored ወ prefix."
+                            })
                         root = candidate
+                        branch = "derived_weak_initial"
+
+        return branch, self._build_result(word, root, stem, prefixes, suffixes, derivation_steps, "derived", lean)
+
+    def extract_many(self, words, share=False):
+        """
+        Extract roots for a sequence of tokens, analyzing each distinct token once.
+
+        Tokens are deduplicated on their exact surface form rather than the
+        normalized one: extract_root records the normalization step, resolves
+        citations from the surface orders and echoes the input, so two
+        spellings that normalize alike can still analyze differently.
+
+        Args:
+            words: Any iterable of words (e.g. a tokenized corpus).
+            share: If True, repeated tokens return the same result object;
+                otherwise each repeat gets its own copy that is safe to mutate.
+
+        Returns:
+            One analysis per token, in input order.
+        """
+        analyses = {}
+        encoded = {}
+        results = []
+        for word in words:
+            result = analyses.get(word)
+            if result is None:
+                result = analyses[word] = self.extract_root(word)
+            elif not share:
+                # Copies are decoded from one marshal snapshot per distinct token.
+                blob = encoded.get(word)
+                if blob is None:
+                    blob = encoded[word] = marshal.dumps(result)
+                result = marshal.loads(blob)
+            results.append(result)
+        return results
 
-        return self._build_result(word, root, stem, prefixes, suffixes, derivation_steps, "derived")
+    def _grammar_reference(self, root):
+        """Grammar index reference block and attested patterns for root."""
+        return self.grammar.reference(root), self.grammar.grammar_patterns(root)
 
-    def _build_result(self, word, root, stem, prefixes, suffixes, derivation_steps, method):
+    def _build_result(self, word, root, stem, prefixes, suffixes, derivation_steps, method, lean=False, paradigm=None):
         """
         Build the standardized result dictionary with algorithmic verb type detection.
         
         Includes the 'verb_home' field which algorithmically detects the verb class
         based on radical count and vowel quality (C1 order), without requiring 
         lexicon lookup. Also detects causative prefixes.
+        
+        With lean=True only the root, root type, pattern name and confidence
+        are computed and a LeanAnalysis is returned. paradigm holds the
+        (root, verb_type, tense, subject) cells of a paradigm index hit; the
+        pattern then comes from its first cell.
         """
-        pattern = self.identify_verb_pattern(stem, prefixes)
+        if paradigm:
+            pattern = cell_pattern(*paradigm[0][1:])
+        else:
+            pattern = self.identify_verb_pattern(stem, prefixes)
         canonical_root = self._canonicalize_root(
             root,
             source=word,
             stem=stem,
             pattern_name=pattern.get("name"),
         )
+        if lean:
+            return LeanAnalysis(
+                word,
+                canonical_root,
+                self._get_root_type(canonical_root),
+                pattern.get("name"),
+                _METHOD_CONFIDENCE.get(method, 0.70),
+            )
         if canonical_root != root:
             citation_via = (
                 "skeleton citation lookup"
-                if normalize_geez(get_consonant_skeleton(root)) in self.skeleton_lookup
+                if normalize_geez(root, "search") in self.skeleton_lookup
                 else "homophone-normalized root mapped to lexicon citation form"
             )
             derivation_steps.append({
@@ -1023,16 +1306,19 @@ class GeezStemmer:
         if not meaning:
             meaning = self.grammar.primary_gloss(root)
 
-        grammar_ref = self.grammar.reference(root)
-        grammar_patterns = self.grammar.grammar_patterns(root)
+        grammar_ref, grammar_patterns = self._grammar_reference(root)
         
         verb_home = detect_verb_home(root, stem)
         
         # Detect causative prefix (ያ, ታ, ና, አ)
-        is_causative = any(p in self.causative_prefixes for p in prefixes)
+        if paradigm:
+            causative_prefix = PARADIGM_CAUSATIVE_PREFIXES.get(pattern["stem_number"])
+        else:
+            causative_prefix = next((p for p in prefixes if p in self.causative_prefixes), None)
+        is_causative = causative_prefix is not None
         if is_causative:
             verb_home['features']['is_causative'] = True
-            verb_home['features']['causative_prefix'] = [p for p in prefixes if p in self.causative_prefixes][0]
+            verb_home['features']['causative_prefix'] = causative_prefix
         
         derivation_steps.append({
             "step": len(derivation_steps) + 1,
@@ -1043,17 +1329,17 @@ class GeezStemmer:
             "rule": verb_home['evidence']
         })
         
-        return {
+        result = {
             "input": word,
             "root": root,
             "root_consonants": list(get_consonant_skeleton(root)),
             "root_type": root_type,
             "verb_home": verb_home,
             "meaning": meaning,
-            "confidence": 0.95 if method == "lexicon" else 0.85 if method == "derived" else 0.70,
+            "confidence": _METHOD_CONFIDENCE.get(method, 0.70),
             "analysis": {
                 "stem": stem,
-                "pattern": pattern,
+                "pattern": dict(pattern),
                 "prefixes": prefixes,
                 "suffixes": suffixes,
                 "method": method,
@@ -1068,3 +1354,9 @@ class GeezStemmer:
                 "affix_formula": f"Prefix({'+'.join(prefixes) if prefixes else 'ø'}) + Stem + Suffix({'+'.join(suffixes) if suffixes else 'ø'})"
             }
         }
+        if paradigm:
+            result["analysis"]["paradigm"] = [
+                {"verb_type": verb_type, "tense": tense, "subject": subject}
+                for _, verb_type, tense, subject in paradigm
+            ]
+        return result
@@ -4,13 +4,17 @@ import unittest
 
 # Add the project root to the python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Paradigm-index tests also run from the JSON data when no artifact is built.
+os.environ.setdefault("ETHIOMORPH_PARADIGMS", "build")
 
 from src.stemmer import GeezStemmer
 from src.normalizer import normalize_geez
+from src.paradigm_index import cell_pattern
 from src.decomposer import (
     devowelize,
     get_char_order,
     get_consonant_skeleton,
+    get_char_by_order,
     AMBIGUOUS_VOWELS,
     AMBIGUOUS_VOWEL_DEFAULTS,
 )
@@ -60,6 +64,23 @@ class TestAdvancedGeezRootAnalyzer(unittest.TestCase):
         self.assertEqual(result["meaning"], "አጣ")
         self.assertEqual(result["analysis"]["pattern"]["name"], "passive_imperfective")
 
+    def test_skeleton_citation_prefers_attested_source(self):
+        # The grammar index picks ገዘፈ for the skeleton; the source spelling
+        # ገዝፈ is the lexicon's, ገዘፈ is not.
+        resolve = self.stemmer._resolve_skeleton_citation
+        self.assertEqual(self.stemmer.grammar.resolve_skeleton("ገዘፈ", source="ገዝፈ"), "ገዘፈ")
+        self.assertNotIn("ገዘፈ", self.stemmer.lexicon_roots)
+        self.assertEqual(resolve("ገዘፈ", source="ገዝፈ"), "ገዝፈ")
+        for word in ("ገዝፈ", "መልኀ", "መክነ"):
+            self.assertEqual(self.stemmer.extract_root(word)["root"], word)
+
+        # Skeleton buckets also hold spellings the lexicon does not list.
+        for skeleton, bucket in self.stemmer.skeleton_candidates.items():
+            if any(root not in self.stemmer.lexicon_roots for root in bucket.roots):
+                with self.subTest(skeleton=skeleton):
+                    pick = resolve(skeleton, stem="ይ" + skeleton, pattern_name="imperfective")
+                    self.assertIn(pick, bucket.members)
+
     def test_prefix_lookalikes(self):
         print("\n--- Testing Prefix Look-Alikes ---")
         self.check_root("መሐረ", "መሀረ", "Root starts with Ma")
@@ -90,6 +111,24 @@ class TestAdvancedGeezRootAnalyzer(unittest.TestCase):
         self.assertEqual(get_char_order("ጺ"), 3)
         self.assertEqual(get_consonant_skeleton("ጺ"), "ጸ")
 
+    def test_labialized_and_extended_rows(self):
+        print("\n--- Testing labialized / Ethiopic Extended decomposition ---")
+        for char, base, order in [("ኰ", "ኰ", 1), ("ኲ", "ኰ", 3), ("ኳ", "ኰ", 4), ("ኵ", "ኰ", 6),
+                                  ("ጕ", "ጐ", 6), ("ሏ", "ለ", 8), ("ⶥ", "ⶠ", 6), ("ᎁ", "ᎀ", 3)]:
+            self.assertEqual(devowelize(char), base, char)
+            self.assertEqual(get_char_order(char), order, char)
+            self.assertEqual(get_char_by_order(base, order), char, char)
+        self.assertEqual(get_consonant_skeleton("መንኵስ"), "መነኰሰ")
+
+    def test_irregular_cells_preserved(self):
+        print("\n--- Testing irregular ዓ / ፀ rows ---")
+        self.assertEqual(devowelize("ዐ"), "ዐ")
+        self.assertEqual(get_char_order("ዐ"), 0)
+        self.assertEqual(devowelize("ዕ"), "ዓ")
+        self.assertEqual(get_char_order("ዓ"), 4)
+        self.assertEqual(get_char_by_order("ፀ", 3), "ጺ")
+        self.assertEqual(devowelize("ፂ"), "ፀ")
+
     def test_ambiguous_tsi_stemmer_does_not_bleed_to_tsa_row(self):
         print("\n--- Testing ጺ in stemmer analysis ---")
         result = self.stemmer.extract_root("ደንግጺ")
@@ -120,6 +159,123 @@ class TestAdvancedGeezRootAnalyzer(unittest.TestCase):
         self.assertEqual([p["form"] for p in result["analysis"]["particles"]], ["እም", "ዝ"])
         self.assertEqual(result["meaning"], "from / out of this")
 
+    def test_particle_segmentation_is_linear(self):
+        self.assertEqual(self.stemmer.particle_segmentations("ወእምዝ"), [["ወ", "እም", "ዝ"]])
+        self.assertEqual(self.stemmer.particle_segmentations("ነገረ"), [])
+        # Deeper than the recursion limit, and a near-miss that used to backtrack.
+        self.assertEqual(len(self.stemmer._segment_particles("ወበ" * 3000)), 6000)
+        self.assertIsNone(self.stemmer._segment_particles("ወለከ" * 3000 + "ሰ"))
+
+    def test_affix_trie_keeps_list_priority(self):
+        from src.stemmer import _affix_matches
+        word = "ያስተሰናአለት"
+        self.assertEqual(_affix_matches(self.stemmer._prefix_trie, word, 0, len(word)), ["ያስተ", "ያስ", "ያ"])
+        # 'ት' is listed before 'አት', so it is tried first.
+        self.assertEqual(_affix_matches(self.stemmer._suffix_trie, "ሐረአት", 0, 4, reverse=True), ["ት", "አት"])
+
+    def test_verb_pattern_decision_table(self):
+        identify = self.stemmer.identify_verb_pattern
+        self.assertEqual(identify("ቀትል", ["ይ"])["name"], "imperfective")
+        # Stem IV outranks the Stem II/I prefixes stripped alongside it.
+        self.assertEqual(identify("ቀትል", ["ወ", "ይ", "ያስተ"])["name"], "causative_passive_imperfective")
+        self.assertEqual(identify("ቀትል", ["ይት", "ይ"])["name"], "passive_imperfective")
+        # አ alone is causative; next to other prefixes it is ignored.
+        self.assertEqual(identify("ቀተለ", ["አ"])["name"], "causative_perfective")
+        self.assertEqual(identify("ቀተለ", ["አስ"])["english_name"], "Causative Perfective (አስ-verb)")
+        self.assertEqual(identify("ቀተለ", ["ወ", "አ"])["name"], "perfective")
+        self.assertEqual(identify("ቅትል", [])["name"], "imperative")
+        self.assertEqual(identify("ab", ["x"])["name"], "unknown")
+
+        # Records are shared and read-only; results carry their own copy.
+        self.assertIs(identify("ቀትል", ["ት"]), identify("ቀትል", ["ይ"]))
+        with self.assertRaises(TypeError):
+            identify("ቀትል", ["ይ"])["name"] = "x"
+        result = self.stemmer.extract_root("ይቀትሉ")
+        self.assertIs(type(result["analysis"]["pattern"]), dict)
+
+    def test_extract_many_matches_extract_root(self):
+        tokens = ["ወኢይትኀጣእ", "ነገረ", "እምዝ", "ነገረ", "ወኢይትኀጣእ", "ነገረ"]
+        results = self.stemmer.extract_many(iter(tokens))
+        self.assertEqual(results, [self.stemmer.extract_root(t) for t in tokens])
+        self.assertIsNot(results[1], results[3])
+        results[1]["analysis"]["prefixes"].append("x")
+        self.assertNotEqual(results[1], results[3])
+
+        shared = self.stemmer.extract_many(tokens, share=True)
+        self.assertIs(shared[1], shared[3])
+        self.assertIs(shared[1], shared[5])
+
+    def test_paradigm_index_analysis(self):
+        result = self.stemmer.extract_root("ይትቀተል")
+        self.assertEqual(result["root"], "ቀተለ")
+        self.assertEqual(result["analysis"]["method"], "paradigm")
+        self.assertEqual(result["analysis"]["pattern"]["name"], "passive_imperfective")
+        self.assertEqual(
+            result["analysis"]["paradigm"],
+            [{"verb_type": "type_a_passive", "tense": "imperfective", "subject": "3sm"}],
+        )
+        self.assertEqual(self.stemmer.extract_root("ትወርድ")["root"], "ወረደ")
+
+        # Generated by several roots: left to the heuristic analysis.
+        self.assertIsNone(self.stemmer.paradigms.analyze("ረዱ"))
+        self.assertNotEqual(self.stemmer.extract_root("ረዱ")["analysis"]["method"], "paradigm")
+
+    def test_paradigm_patterns_are_shared(self):
+        first = self.stemmer.analyze_fast("ይትቀተል")
+        self.assertEqual(first.pattern, "passive_imperfective")
+        self.assertIs(
+            cell_pattern("type_a_passive", "imperfective", "3sm"),
+            cell_pattern("type_a_passive", "imperfective", "3sm"),
+        )
+        with self.assertRaises(TypeError):
+            cell_pattern("type_a", "perfective", "3sm")["name"] = "x"
+        result = self.stemmer.extract_root("ይትቀተል")
+        result["analysis"]["pattern"]["name"] = "changed"
+        self.assertEqual(self.stemmer.extract_root("ይትቀተል")["analysis"]["pattern"]["name"], "passive_imperfective")
+
+    def test_paradigm_lookup_keeps_lexicon_roots(self):
+        # Generated forms of other roots that share a lexicon root's spelling
+        # (or a homophone of it) must not replace it.
+        for root in ["ሀደመ", "ዐይነ", "አመልዐ", "ሠይነ", "ተዐይነ"]:
+            with self.subTest(root=root):
+                self.assertEqual(self.stemmer.extract_root(root)["root"], root)
+
+        # Some lexicon entries are surface citations that the pipeline
+        # reconstructs (ቆመ -> ቀወመ), but the paradigm index never moves one.
+        for root in self.stemmer.lexicon_roots:
+            result = self.stemmer.extract_root(root)
+            if result["analysis"]["method"] == "paradigm":
+                self.assertEqual(result["root"], root)
+
+    def test_paradigm_lookup_keeps_common_words(self):
+        # A word whose skeleton is a lexicon root keeps it.
+        for word, root in (("ሠራ", "ሰረ"), ("ገራ", "ገረ")):
+            with self.subTest(word=word):
+                result = self.stemmer.extract_root(word)
+                self.assertEqual(result["root"], root)
+                self.assertEqual(result["analysis"]["method"], "lexicon")
+
+        # Short collapsed forms and stacked stem prefixes are generator
+        # artefacts, so they are not in the index.
+        artefacts = {"ፈታ": "ፈየተ", "አገረ": "ተጋወረ", "ተሐቀረ": "አስተሐቀረ", "ቆ": "ቀውዐ"}
+        for word, artefact in artefacts.items():
+            with self.subTest(word=word):
+                self.assertNotIn(word, self.stemmer.paradigms)
+                self.assertNotEqual(self.stemmer.extract_root(word)["root"], artefact)
+        self.assertEqual(self.stemmer.extract_root("ትወርድ")["root"], "ወረደ")
+
+    def test_analyze_fast_matches_extract_root(self):
+        # particle phrase, lexicon, protected noun, derived and one-char imperative
+        for word in ["ወኢይትኀጣእ", "ነገረ", "እምዝ", "ትንግር", "ይትቀተሉ", "ንጉሥ", "ፃ"]:
+            full = self.stemmer.extract_root(word)
+            lean = self.stemmer.analyze_fast(word)
+            self.assertEqual(lean.input, word)
+            self.assertEqual(lean.root, full["root"])
+            self.assertEqual(lean.root_type, full["root_type"])
+            self.assertEqual(lean.pattern, full["analysis"]["pattern"]["name"])
+            self.assertEqual(lean.confidence, full["confidence"])
+            self.assertFalse(hasattr(lean, "__dict__"))
+
     def test_nagera_tell_not_stumble(self):
         result = self.stemmer.extract_root("ነገረ")
         self.assertEqual(result["root"], "ነገረ")
@@ -128,7 +284,8 @@ class TestAdvancedGeezRootAnalyzer(unittest.TestCase):
         result = self.stemmer.extract_root("ትንግር")
         self.assertEqual(result["root"], "ነገረ")
         self.assertIn("ነገረ", result["meaning"])
-        self.assertEqual(result["analysis"]["pattern"]["name"], "imperfective")
+        # Generated as the jussive (the imperfective is ትነግር).
+        self.assertEqual(result["analysis"]["pattern"]["name"], "jussive")
 
         result = self.stemmer.extract_root("ንገረ")
         self.assertEqual(result["root"], "ንገረ")
@@ -4,7 +4,7 @@ import os
 # Add the project root to the python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.normalizer import normalize_geez
+from src.normalizer import normalize_geez, normalize_many
 from src.decomposer import devowelize, get_consonant_skeleton
 
 def test_normalization():
@@ -17,6 +17,21 @@ def test_normalization():
     assert result == expected
     print("Normalization Test Passed!")
 
+def test_normalization_profiles():
+    print("\nTesting Normalization Profiles...")
+    assert normalize_geez("ሠረቀ") == "ሰረቀ"
+    assert normalize_geez("ሠረቀ", "strict") == "ሠረቀ"
+    assert normalize_geez("ሐዊር", "strict") == "ሀዊር"
+    assert normalize_geez("ሖረ", "search") == normalize_geez(get_consonant_skeleton("ሖረ")) == "ሀረ"
+    assert normalize_many(iter(["ፀሐይ", "ሥርዐት"])) == ["ጸሀይ", "ስርዐት"]
+    try:
+        normalize_geez("ሀ", "loose")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown profile accepted")
+    print("Normalization Profiles Test Passed!")
+
 def test_devowelization():
     print("\nTesting De-vowelization...")
     # Test case from user plan
@@ -45,5 +60,6 @@ def test_combined_flow():
 
 if __name__ == "__main__":
     test_normalization()
+    test_normalization_profiles()
     test_devowelization()
     test_combined_flow()
@@ -0,0 +1,87 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cache import AnalysisCache, LRUCache
+from src.stemmer import GeezStemmer
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_entry_budget_evicts_least_recent(self):
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("b"), None)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 1, 1))
+
+    def test_byte_budget(self):
+        cache = AnalysisCache(max_entries=None, max_bytes=64)
+        cache.put("small", "x")
+        cache.put("large", "x" * 100)
+        self.assertIn("small", cache)
+        self.assertNotIn("large", cache)
+        cache.put("medium", "y" * 40)
+        cache.put("medium2", "z" * 40)
+        self.assertLessEqual(cache.bytes, 64)
+        self.assertGreater(cache.evictions, 0)
+
+    def test_version_invalidation(self):
+        cache = LRUCache(max_entries=8)
+        cache.bind_version("v1")
+        cache.put("a", 1)
+        cache.bind_version("v1")
+        self.assertIn("a", cache)
+        cache.bind_version("v2")
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+
+class TestStemmerCache(unittest.TestCase):
+    def test_cached_results_match_and_are_copies(self):
+        cache = AnalysisCache(max_entries=16)
+        stemmer = GeezStemmer(cache=cache)
+        plain = GeezStemmer()
+        first = stemmer.extract_root("ወኢይትኀጣእ")
+        first["root"] = "mutated"
+        second = stemmer.extract_root("ወኢይትኀጣእ")
+        self.assertEqual(second, plain.extract_root("ወኢይትኀጣእ"))
+        self.assertIsNot(second, stemmer.extract_root("ወኢይትኀጣእ"))
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.version, stemmer.store.version)
+
+    def test_canonicalization_memo(self):
+        words = ["ወኢይትኀጣእ", "ይቀትሉ", "ቆመ", "ኀጥአ", "ይሁብ", "ረዱ", "ወረደ", "ንግር"]
+        stemmer = GeezStemmer()
+        plain = GeezStemmer(canonical_cache_entries=0)
+        self.assertIsNone(plain.canonical_cache)
+        memo = stemmer.canonical_cache
+        self.assertEqual(memo.version, stemmer.store.version)
+
+        for _ in range(2):
+            for word in words:
+                self.assertEqual(stemmer.extract_root(word), plain.extract_root(word))
+                self.assertEqual(stemmer.analyze_fast(word), plain.analyze_fast(word))
+        self.assertGreater(memo.hits, 0)
+        self.assertLessEqual(len(memo), memo.misses)
+
+        # Source spellings that are lexicon roots can be the answer, so they key apart.
+        self.assertEqual(
+            stemmer._canonicalize_root("ሀጠአ", source="ኀጥአ"),
+            plain._canonicalize_root("ሀጠአ", source="ኀጥአ"),
+        )
+
+        memo.bind_version("stale")
+        self.assertEqual(len(memo), 0)
+        self.assertEqual(stemmer.extract_root(words[0]), plain.extract_root(words[0]))
+        self.assertEqual(memo.version, stemmer.store.version)
+
+
+if __name__ == "__main__":
+    unittest.main()
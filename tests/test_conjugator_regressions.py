@@ -4,7 +4,7 @@ import unittest
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.conjugator import EthioMorphGenerator
+from src.conjugator import EthioMorphGenerator, fuse_prefix
 from src.decomposer import devowelize, AMBIGUOUS_VOWELS
 
 
@@ -108,6 +108,89 @@ class TestVerbTypeMatrix(unittest.TestCase):
                     self.assertTrue(result.get("word"))
 
 
+class TestCellPrograms(unittest.TestCase):
+    def setUp(self):
+        self.generator = EthioMorphGenerator()
+
+    def test_cells_compile_per_verb_type(self):
+        self.generator.generate_word("ቀተለ", "imperfective", "3pm", verb_type="type_a")
+        self.assertEqual(list(self.generator._cell_programs), ["type_a"])
+        program = self.generator._programs("type_a")["imperfective", "3pm"]
+        self.assertEqual(program.prefixes["አ"], "ያ")
+        self.assertEqual(program.prefixes["ተ"], program.prefixes[""] + "ተ")
+        self.assertEqual(fuse_prefix("ይ", "አስተ", "perfective"), "አስተ")
+        self.assertIsNone(self.generator._programs("no_such_type"))
+
+    def test_cell_errors(self):
+        generate = self.generator.generate_word
+        self.assertEqual(generate("ቀተለ", "perfective", "3sm", "nope"), {"error": "Unknown verb type 'nope'"})
+        self.assertEqual(
+            generate("ቀተለ", "_meta", "3sm", "type_a"),
+            {"error": "Unknown tense '_meta' for type 'type_a'"},
+        )
+        self.assertEqual(
+            generate("ቀተለ", "perfective", "9x", "type_a"),
+            {"error": "Unknown subject '9x' for tense 'perfective'"},
+        )
+
+    def test_fusion_and_causative_prefix(self):
+        result = self.generator.generate_word("ቀተለ", "imperfective", "3pm", verb_type="type_a")
+        self.assertEqual(result["word"], "ይቀትሉ")
+        self.assertEqual(result["derivation"]["fusion"]["fused_with"], "C3")
+        self.assertEqual(fuse_prefix("ይ", "አ", "imperfective"), "ያ")
+        self.assertEqual(fuse_prefix("እ", "አን", "jussive"), "አን")
+        self.assertEqual(fuse_prefix("", "ነ", "imperative"), "ነ")
+
+    def test_expand_root_reuses_root_context(self):
+        calls = []
+        root_context = self.generator.root_context
+
+        def counting(*args):
+            calls.append(args)
+            return root_context(*args)
+
+        self.generator.root_context = counting
+        matrix = self.generator.expand_root("ቀተለ")
+        self.assertEqual(len(calls), 1)
+        del self.generator.root_context
+
+        meta = matrix["_meta"]
+        for tense in ("perfective", "imperfective", "jussive", "imperative"):
+            for subject, cell in matrix[tense]["conjugations"].items():
+                self.assertEqual(
+                    cell,
+                    self.generator.generate_word("ቀተለ", tense, subject, meta["verb_type"], meta["verb_home"]),
+                )
+        for key, cell in matrix["derived"].items():
+            self.assertEqual(cell, self.generator.generate_derived("ቀተለ", key, meta["verb_type"]))
+        self.assertIn("error", self.generator.root_context("ቀተ"))
+
+    def test_word_only_path_matches_expand_root(self):
+        for root in ("ቀተለ", "ሐወረ", "ወለደ", "ተቀተለ", "አስተቀተለ"):
+            with self.subTest(root=root):
+                matrix = self.generator.expand_root(root)
+                words = self.generator.expand_root_words(root)
+                self.assertEqual(words["_meta"]["verb_type"], matrix["_meta"]["verb_type"])
+                self.assertEqual(words["_meta"]["stem_prefix"], matrix["_meta"]["stem"]["prefix"])
+                for tense in ("perfective", "imperfective", "jussive", "imperative"):
+                    for subject, cell in matrix[tense]["conjugations"].items():
+                        self.assertEqual(words[tense][subject], cell["word"])
+                        self.assertEqual(
+                            words["variants"].get(tense, {}).get(subject, []), cell.get("variants", [])
+                        )
+                self.assertEqual(
+                    words["derived"], {key: cell["word"] for key, cell in matrix["derived"].items()}
+                )
+
+        self.assertEqual(
+            self.generator.generate_word_fast("ሐወረ", "imperative", "2sm"),
+            ("ሕወር", ("ሖር", "ሖ")),
+        )
+        self.assertEqual(self.generator.generate_word_fast("ቀተለ", "perfective", "3sm"), ("ቀተለ", ()))
+        self.assertIsNone(self.generator.generate_word_fast("ቀተለ", "perfective", "9x"))
+        self.assertIn("error", self.generator.expand_root_words("ቀተ"))
+
+
 class TestHollowVerbVariants(unittest.TestCase):
     def setUp(self):
         self.generator = EthioMorphGenerator()
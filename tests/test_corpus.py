@@ -0,0 +1,110 @@
+import io
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.corpus import analyze_stream, iter_tokens, read_chunks, tokenize
+from src.conjugator import EthioMorphGenerator
+from src.parallel import parallel_analyze, parallel_analyze_stream, parallel_expand
+from src.stemmer import GeezStemmer
+
+TEXT = "ወኢይትኀጣእ፡ነገረ። እምዝ፣ abc ፩ ትንግር\n\nይትቀተሉ፤ንጉሥ፥ፃ፦"
+
+
+class TestCorpus(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.stemmer = GeezStemmer()
+
+    def test_tokenize_splits_on_ethiopic_punctuation(self):
+        tokens = tokenize(TEXT)
+        self.assertEqual(
+            [t.text for t in tokens],
+            ["ወኢይትኀጣእ", "ነገረ", "እምዝ", "abc", "፩", "ትንግር", "ይትቀተሉ", "ንጉሥ", "ፃ"],
+        )
+        for token in tokens:
+            self.assertEqual(TEXT[token.start:token.end], token.text)
+
+    def test_chunk_boundaries_do_not_change_tokens(self):
+        expected = tokenize(TEXT)
+        for size in range(1, len(TEXT) + 1):
+            with self.subTest(chunk_size=size):
+                self.assertEqual(list(iter_tokens(read_chunks(io.StringIO(TEXT), size))), expected)
+
+    def test_analyze_stream_is_lazy_and_matches_extract_root(self):
+        def endless():
+            while True:
+                yield TEXT
+
+        stream = analyze_stream(endless(), self.stemmer)
+        first = [next(stream) for _ in range(7)]
+        self.assertEqual([t.text for t, _ in first][:2], ["ወኢይትኀጣእ", "ነገረ"])
+        # Numerals and Latin tokens are skipped by default.
+        self.assertNotIn("abc", [t.text for t, _ in first])
+        for token, analysis in first:
+            self.assertEqual(analysis, self.stemmer.extract_root(token.text))
+
+        lean = analyze_stream([TEXT], self.stemmer, lean=True, geez_only=False)
+        self.assertEqual(len(list(lean)), 9)
+
+    def test_parallel_stream_keeps_input_order(self):
+        chunks = [TEXT] * 20
+        expected = list(analyze_stream(chunks, self.stemmer))
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = parallel_analyze_stream(
+                    chunks, workers=workers, batch_size=7, stemmer=self.stemmer
+                )
+                self.assertEqual(list(results), expected)
+
+        lean = parallel_analyze_stream(chunks, workers=2, batch_size=7, lean=True, stemmer=self.stemmer)
+        self.assertEqual(
+            [analysis for _, analysis in lean],
+            [self.stemmer.analyze_fast(token.text) for token, _ in expected],
+        )
+
+    def test_parallel_results_are_copies_unless_shared(self):
+        words = ["ነገረ", "እምዝ", "ነገረ", "ነገረ"]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = list(parallel_analyze(words, workers=workers, stemmer=self.stemmer))
+                self.assertEqual(results, [self.stemmer.extract_root(w) for w in words])
+                self.assertIsNot(results[0], results[2])
+                results[0]["analysis"]["prefixes"].append("x")
+                self.assertNotEqual(results[0], results[2])
+
+                shared = list(parallel_analyze(words, workers=workers, share=True, stemmer=self.stemmer))
+                self.assertIs(shared[0], shared[2])
+                self.assertIs(shared[0], shared[3])
+                self.assertEqual(shared, [self.stemmer.extract_root(w) for w in words])
+
+
+def _word_count(root, matrix):
+    return len(matrix.get("perfective", ()))
+
+
+class TestParallelExpand(unittest.TestCase):
+    def test_expansion_keeps_root_order(self):
+        generator = EthioMorphGenerator()
+        roots = list(generator.lexicon_full)[:40] + ["ቀተ"]
+        for lean in (False, True):
+            expand = generator.expand_root_words if lean else generator.expand_root
+            expected = [(root, expand(root)) for root in roots]
+            for workers in (1, 2):
+                with self.subTest(lean=lean, workers=workers):
+                    results = parallel_expand(
+                        roots, workers=workers, batch_size=3, lean=lean, generator=generator
+                    )
+                    self.assertEqual(list(results), expected)
+
+        counts = parallel_expand(roots, workers=2, lean=True, transform=_word_count, generator=generator)
+        self.assertEqual(
+            list(counts), [(root, _word_count(root, matrix)) for root, matrix in expected]
+        )
+        self.assertIn("error", expected[-1][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
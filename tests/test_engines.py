@@ -0,0 +1,85 @@
+import gzip
+import json
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Paradigm-index tests also run from the JSON data when no artifact is built.
+os.environ.setdefault("ETHIOMORPH_PARADIGMS", "build")
+
+from src import engines
+from src.stemmer import GeezStemmer
+from src.conjugator import EthioMorphGenerator
+
+
+class TestEngineRegistry(unittest.TestCase):
+    def test_engines_are_shared(self):
+        self.assertIs(engines.get_stemmer(), engines.get_stemmer())
+        self.assertIs(engines.get_generator(), engines.get_generator())
+        self.assertIsInstance(engines.get_stemmer(), GeezStemmer)
+        self.assertIsInstance(engines.get_generator(), EthioMorphGenerator)
+
+    def test_warm_and_reset(self):
+        engines.warm('stemmer')
+        before = engines.get_stemmer()
+        engines.reset_engines()
+        after = engines.get_stemmer()
+        self.assertIsNot(before, after)
+        self.assertEqual(after.extract_root("ቆመ")["root"], "ቀወመ")
+
+    def test_stage_metrics_are_opt_in(self):
+        engines.reset_engines()
+        self.assertEqual(engines.stage_metrics(), {"enabled": False, "loaded": False})
+        self.assertEqual(engines.branch_metrics(), {"enabled": False, "loaded": False})
+        self.assertEqual(engines.prometheus_metrics(), "")
+        # Reading metrics never builds the stemmer.
+        self.assertNotIn('stemmer', engines._ENGINES)
+        engines.get_stemmer()
+        self.assertEqual(engines.stage_metrics(), {"enabled": False})
+        self.assertEqual(engines.branch_metrics(), {"enabled": False})
+        original = engines.INSTRUMENT, engines.BRANCH_COUNTERS
+        engines.INSTRUMENT = engines.BRANCH_COUNTERS = True
+        try:
+            engines.reset_engines()
+            engines.get_stemmer().extract_root("ይትቀተል")
+            metrics = engines.stage_metrics()
+            branches = engines.branch_metrics()
+            text = engines.prometheus_metrics()
+        finally:
+            engines.INSTRUMENT, engines.BRANCH_COUNTERS = original
+            engines.reset_engines()
+        self.assertTrue(metrics["enabled"])
+        self.assertEqual(metrics["calls"], 1)
+        self.assertEqual(branches["branches"]["paradigm"]["count"], 1)
+        self.assertIn("ethiomorph_analysis_stage_seconds_count", text)
+        self.assertIn("ethiomorph_analysis_branch_total", text)
+
+    def test_paradigm_json_is_cached(self):
+        engines.reset_engines()
+        expected = json.dumps(
+            engines.get_generator().expand_root("ቀተለ"), ensure_ascii=False, indent=2
+        ).encode()
+        body = engines.paradigm_json("ቀተለ")
+        self.assertEqual(body, expected)
+        self.assertIs(engines.paradigm_json("ቀተለ"), body)
+
+        compressed = engines.paradigm_json("ቀተለ", compress=True)
+        self.assertEqual(gzip.decompress(compressed), expected)
+        self.assertIs(engines.paradigm_json("ቀተለ", compress=True), compressed)
+        cache = engines.get_paradigm_cache()
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.bytes, len(body) + len(compressed))
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+        self.assertIn(b"error", engines.paradigm_json("ቀተ"))
+        engines.reset_engines()
+        self.assertIsNot(engines.get_paradigm_cache(), cache)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            engines.get_engine('tokenizer')
+
+
+if __name__ == "__main__":
+    unittest.main()
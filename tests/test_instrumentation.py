@@ -0,0 +1,125 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.cache import AnalysisCache
+from src.instrumentation import (
+    CALL_STAGE, BranchCounters, Histogram, StageTimer,
+    count_branches, instrument, uncount_branches, uninstrument,
+)
+from src.stemmer import ANALYSIS_BRANCHES, CACHE_HIT, GeezStemmer
+
+
+class TestStageTiming(unittest.TestCase):
+    def test_histogram_buckets_and_quantiles(self):
+        histogram = Histogram(bounds=(0.001, 0.01))
+        for seconds in (0.0005, 0.0005, 0.005, 0.5):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.quantile(0.5), 0.001)
+        self.assertEqual(histogram.quantile(0.75), 0.01)
+        self.assertEqual(histogram.quantile(1.0), 0.5)
+        self.assertEqual(histogram.snapshot()["buckets"][-1], [float("inf"), 1])
+
+    def test_instrumented_stemmer_records_stages(self):
+        stemmer = GeezStemmer()
+        expected = stemmer.extract_root("ወኢይትኀጣእ")
+        seen = []
+        timer = instrument(stemmer, StageTimer(on_call=lambda word, stages: seen.append(word)))
+        self.assertIs(instrument(stemmer), timer)
+
+        self.assertEqual(stemmer.extract_root("ወኢይትኀጣእ"), expected)
+        stemmer.analyze_fast("ይቀትል")
+        self.assertEqual(seen, ["ወኢይትኀጣእ", "ይቀትል"])
+        stages = timer.last_call()
+        self.assertIn("canonicalize_root", stages)
+        self.assertLessEqual(stages["build_result"], stages[CALL_STAGE])
+
+        snapshot = timer.snapshot()
+        self.assertEqual(snapshot["calls"], 2)
+        self.assertEqual(snapshot["stages"][CALL_STAGE]["count"], 2)
+        self.assertIn("strip_affixes", snapshot["stages"])
+
+        # Stages only count inside an analysis call.
+        stripped = snapshot["stages"]["strip_affixes"]["count"]
+        stemmer.strip_affixes("ይቀትሉ")
+        self.assertEqual(timer.snapshot()["stages"]["strip_affixes"]["count"], stripped)
+
+        uninstrument(stemmer)
+        self.assertIsNone(stemmer.instrumentation)
+        self.assertNotIn("_analyze", vars(stemmer))
+        stemmer.extract_root("ይቀትል")
+        self.assertEqual(timer.snapshot()["calls"], 2)
+
+        timer.reset()
+        self.assertEqual(timer.snapshot(), {"calls": 0, "stages": {}})
+
+
+
+class TestBranchCounters(unittest.TestCase):
+    def test_counts_pipeline_exits(self):
+        stemmer = GeezStemmer()
+        words = ["ወኢይትኀጣእ", "ፃ", "ንጉሥ", "እምዝ", "ይትቀተል", "ቆመ"]
+        expected = [stemmer.extract_root(word) for word in words]
+        counters = count_branches(stemmer)
+        self.assertIs(count_branches(stemmer), counters)
+        timer = instrument(stemmer)
+
+        self.assertEqual([stemmer.extract_root(word) for word in words], expected)
+        stemmer.analyze_fast("ፃ")
+        snapshot = counters.snapshot()
+        self.assertEqual(list(snapshot["branches"])[:len(ANALYSIS_BRANCHES)], list(ANALYSIS_BRANCHES))
+        self.assertEqual(snapshot["branches"]["one_char"]["count"], 2)
+        self.assertEqual(sum(b["count"] for b in snapshot["branches"].values()), len(words) + 1)
+        self.assertEqual(timer.snapshot()["calls"], len(words) + 1)
+        self.assertGreater(snapshot["canonicalization"]["lexicon"]["count"], 0)
+
+        text = counters.prometheus()
+        self.assertIn("# TYPE ethiomorph_analysis_branch_total counter", text)
+        self.assertIn('ethiomorph_analysis_branch_total{branch="one_char"} 2', text)
+        self.assertIn('ethiomorph_canonicalization_seconds_total{via="skeleton"}', text)
+        self.assertIn('ethiomorph_analysis_stage_seconds_bucket{stage="analyze",le="+Inf"} 7', timer.prometheus())
+
+        uncount_branches(stemmer)
+        self.assertIsNone(stemmer.branch_counters)
+        stemmer.extract_root("ፃ")
+        self.assertEqual(counters.snapshot()["branches"]["one_char"]["count"], 2)
+        counters.reset()
+        self.assertEqual(counters.snapshot()["branches"]["one_char"], {"count": 0, "seconds": 0.0})
+        # The timer wraps _analyze, not _route, so it survives uncounting.
+        self.assertEqual(timer.snapshot()["calls"], len(words) + 2)
+
+    def test_cache_hits_are_counted(self):
+        stemmer = GeezStemmer(cache=AnalysisCache(max_entries=16))
+        counters = count_branches(stemmer)
+        timer = instrument(stemmer)
+
+        first = stemmer.extract_root("ይቀትል")
+        self.assertEqual(stemmer.extract_root("ይቀትል"), first)
+        branches = counters.snapshot()["branches"]
+        self.assertEqual(list(branches)[len(ANALYSIS_BRANCHES)], CACHE_HIT)
+        self.assertEqual(branches[CACHE_HIT]["count"], 1)
+        self.assertEqual(sum(b["count"] for b in branches.values()), 2)
+        snapshot = timer.snapshot()
+        self.assertEqual(snapshot["calls"], 2)
+        self.assertEqual(snapshot["stages"][CALL_STAGE]["count"], 1)
+        self.assertEqual(snapshot["stages"][CACHE_HIT]["count"], 1)
+        self.assertEqual(list(timer.last_call()), [CACHE_HIT])
+
+        uninstrument(stemmer)
+        uncount_branches(stemmer)
+        self.assertNotIn("_cached_analysis", vars(stemmer))
+        stemmer.extract_root("ይቀትል")
+        self.assertEqual(counters.snapshot()["branches"][CACHE_HIT]["count"], 1)
+
+    def test_unknown_labels_are_added(self):
+        counters = BranchCounters(branches=(), paths=())
+        route = counters.wrap(counters.branches, lambda word: ("custom", word))
+        self.assertEqual(route("x"), ("custom", "x"))
+        self.assertEqual(counters.snapshot()["branches"]["custom"]["count"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
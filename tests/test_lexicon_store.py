@@ -0,0 +1,191 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexicon_store import (
+    ARTIFACT_PATH,
+    DATA_DIR,
+    DATA_FILES,
+    ArtifactLexiconStore,
+    LexiconStore,
+    compile_artifact,
+    get_store,
+    open_store,
+)
+from src.data_artifact import ArtifactWriter, MappedArtifact, MappedIndex
+from src.normalizer import normalize_geez
+from src.stemmer import GeezStemmer
+from src.conjugator import EthioMorphGenerator
+
+
+class TestLexiconStore(unittest.TestCase):
+    def test_engines_share_store_structures(self):
+        first = GeezStemmer()
+        second = GeezStemmer()
+        generator = EthioMorphGenerator()
+        self.assertIs(first.store, get_store())
+        self.assertIs(first.lexicon_roots, second.lexicon_roots)
+        self.assertIs(first.skeleton_lookup, second.skeleton_lookup)
+        self.assertIs(first.grammar, second.grammar)
+        self.assertIs(generator.lexicon_full, first.lexicon_roots)
+        self.assertIs(generator.templates, get_store().templates)
+
+    def test_derived_indexes(self):
+        store = get_store()
+        self.assertEqual(store.hollow_w_lookup.get("ሀወረ"), "ሐወረ")
+        self.assertEqual(store.lexicon_types.get("ቀተለ"), "type_a")
+        self.assertIn("ቀተለ", store.skeleton_lookup["ቀተለ"])
+
+    def test_skeleton_candidate_records(self):
+        store = get_store()
+        bucket = store.skeleton_candidates["ወረደ"]
+        self.assertEqual(bucket.roots, ["ወረደ", "ዋረደ"])
+        self.assertEqual(bucket.by_order, {1: "ወረደ", 4: "ዋረደ"})
+        self.assertEqual(store.skeleton_candidates["ቀወመ"].hollow, "ቀወመ")
+        for roots in store.skeleton_candidates.values():
+            self.assertGreater(len(roots.roots), 1)
+
+        stemmer = GeezStemmer(store=store)
+        self.assertEqual(stemmer._resolve_skeleton_citation("ወረደ", source="ዋረደ"), "ዋረደ")
+        self.assertEqual(stemmer._resolve_skeleton_citation("ወረደ", source="ይወርድ"), "ወረደ")
+
+        grammar_bucket = store.grammar.skeleton_bucket("ነገረ")
+        self.assertEqual(grammar_bucket.marked, "ንገረ")
+        self.assertEqual(store.grammar.resolve_skeleton("ነገረ", source="ንግር", pattern_name="jussive"), "ንገረ")
+        self.assertEqual(store.grammar.resolve_skeleton("ነገረ", source="ነገረ"), "ነገረ")
+        self.assertIsNone(store.grammar.skeleton_bucket("no-such-skeleton"))
+
+    def test_missing_data_dir_is_empty(self):
+        store = LexiconStore(os.path.join(os.path.dirname(__file__), "no-such-data"))
+        stemmer = GeezStemmer(store=store)
+        self.assertEqual(stemmer.lexicon_roots, {})
+        self.assertFalse(stemmer.grammar.loaded)
+        self.assertEqual(EthioMorphGenerator(store=store).templates, {})
+
+    def test_lookup_form_normalized_index(self):
+        grammar = LexiconStore().grammar
+        for form, roots in list(grammar.form_to_roots.items())[:200]:
+            self.assertEqual(grammar.lookup_form(form), roots)
+            norm = normalize_geez(form)
+            expected = list(dict.fromkeys(
+                root for other, other_roots in grammar.form_to_roots.items()
+                if normalize_geez(other) == norm for root in other_roots
+            ))
+            self.assertEqual(grammar.normalized_form_to_roots[norm], expected)
+        self.assertEqual(grammar.lookup_form("ፘፘፘ"), [])
+
+    def test_version_is_stable(self):
+        self.assertEqual(LexiconStore().version, LexiconStore().version)
+
+
+class TestDataArtifact(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The artifact is a build output (python scripts/build_data_artifact.py);
+        # compile one from the JSON sources for these tests.
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.json_store = LexiconStore()
+        cls.payload = compile_artifact(cls.json_store)
+        cls.path = os.path.join(cls.tmp.name, "ethiomorph.bin")
+        with open(cls.path, "wb") as f:
+            f.write(cls.payload)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_artifact_store_matches_json_store(self):
+        json_store = self.json_store
+        mapped = ArtifactLexiconStore(self.path)
+        self.assertEqual(mapped.version, json_store.version)
+        self.assertFalse(mapped.is_stale())
+        self.assertEqual(list(mapped.lexicon_roots), list(json_store.lexicon_roots))
+        self.assertEqual(mapped.lexicon_roots["ቀተለ"], json_store.lexicon_roots["ቀተለ"])
+        self.assertEqual(mapped.skeleton_lookup, json_store.skeleton_lookup)
+        self.assertEqual(mapped.hollow_w_roots, json_store.hollow_w_roots)
+        self.assertEqual(mapped.grammar.form_to_roots, json_store.grammar.form_to_roots)
+        self.assertEqual(mapped.grammar.normalized_form_to_roots, json_store.grammar.normalized_form_to_roots)
+        self.assertEqual(mapped.grammar.reference("ንገረ"), json_store.grammar.reference("ንገረ"))
+        self.assertEqual(dict(mapped.templates), json_store.templates)
+        self.assertEqual(mapped.stems, json_store.stems)
+
+    def test_artifact_round_trip(self):
+        mapped = ArtifactLexiconStore(self.path)
+        for word in ("ይትቀተል", "ትወርድ", "ረዱ", "ቀታሊ", "ይትቀተሉ"):
+            self.assertEqual(
+                mapped.paradigm_index.lookup(word), self.json_store.paradigm_index.lookup(word)
+            )
+        stemmer = GeezStemmer(store=ArtifactLexiconStore(self.path))
+        self.assertEqual(stemmer.extract_root("ወኢይትኀጣእ")["root"], "ኀጥአ")
+        generator = EthioMorphGenerator(store=ArtifactLexiconStore(self.path))
+        self.assertEqual(generator.generate_word("ቀተለ", "imperfective", "3sm")["word"], "ይቀትል")
+
+    def test_paradigm_index_sections(self):
+        mapped = ArtifactLexiconStore(self.path)
+        forms = mapped.artifact.table("paradigm_forms")
+        self.assertIsInstance(forms, MappedIndex)
+        expected = self.json_store.paradigm_index.forms
+        self.assertEqual(len(forms), len(expected))
+        self.assertEqual(sorted(forms), sorted(expected))
+        for word in ("ይትቀተል", "ቀተለ", "ቀታሊ"):
+            self.assertEqual(forms[word], expected[word])
+        self.assertNotIn("ቀተ", forms)
+        self.assertIsNone(forms.get(1))
+        # The paradigm forms do not go through the shared string pool.
+        self.assertNotIn("ይትቀተሉ", mapped.artifact.strings)
+
+    def test_index_section_lookups(self):
+        writer = ArtifactWriter({"version": "test"})
+        table = {"ለ": ["x", "y"], "ሀ": [], "a": ["y"], "ቀተለ": ["x"]}
+        writer.add_index("index", table)
+        writer.add_index("empty", {})
+        many = {f"k{i}": [str(i % 7)] for i in range(500)}
+        writer.add_index("many", many)
+        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
+            f.write(writer.to_bytes())
+        self.addCleanup(os.unlink, f.name)
+        artifact = MappedArtifact(f.name)
+        index = artifact.table("index")
+        self.assertEqual(list(index), ["a", "ሀ", "ለ", "ቀተለ"])
+        self.assertEqual(dict(index), table)
+        self.assertEqual(index.get("ቀተ", "missing"), "missing")
+        with self.assertRaises(KeyError):
+            index["b"]
+        self.assertEqual(dict(artifact.table("many")), many)
+        self.assertNotIn("k500", artifact.table("many"))
+        self.assertEqual(len(artifact.table("empty")), 0)
+        self.assertNotIn("a", artifact.table("empty"))
+
+    def test_same_size_edit_makes_artifact_stale(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            for name in DATA_FILES:
+                if (DATA_DIR / name).exists():
+                    shutil.copy2(DATA_DIR / name, data_dir)
+            with open(os.path.join(data_dir, ARTIFACT_PATH.name), "wb") as f:
+                f.write(compile_artifact(LexiconStore(data_dir)))
+            lexicon = os.path.join(data_dir, "lexicon.json")
+            self.assertIsInstance(open_store(data_dir), ArtifactLexiconStore)
+
+            # A new mtime alone does not invalidate it ...
+            os.utime(lexicon, ns=(0, 0))
+            self.assertIsInstance(open_store(data_dir), ArtifactLexiconStore)
+
+            # ... but swapping one syllable for another of the same size does.
+            with open(lexicon, encoding="utf-8") as f:
+                text = f.read()
+            edited = text.replace("ቀተለ", "በተለ", 1)
+            self.assertEqual(len(edited.encode()), len(text.encode()))
+            with open(lexicon, "w", encoding="utf-8") as f:
+                f.write(edited)
+            os.utime(lexicon, ns=(0, 0))
+            store = open_store(data_dir)
+            self.assertNotIsInstance(store, ArtifactLexiconStore)
+            self.assertTrue(ArtifactLexiconStore(os.path.join(data_dir, ARTIFACT_PATH.name), data_dir).is_stale())
+
+
+if __name__ == "__main__":
+    unittest.main()